@@ -0,0 +1,72 @@
+"""Benchmark per-request latency with and without connection pooling.
+
+This script starts a :class:`~slingshot.testing.FakeSlingshotServer` holding
+50 projects, then times the same number of requests for a page of them made:
+
+- with ``httpx.request``, which opens a new connection for every call (the
+  behavior of ``SlingshotClient`` before it kept a connection pool), and
+- with ``SlingshotClient._api_request``, which reuses pooled connections.
+
+The local server speaks plain HTTP, so the measured gain only covers the TCP
+handshake and connection setup. Against the real API the TLS handshake makes
+the difference considerably larger.
+
+Usage:
+    python benchmarks/bench_connection_pool.py [requests]
+
+Arguments:
+    requests: Number of requests to time for each mode (default: 500)
+"""
+
+import statistics
+import sys
+import time
+
+import httpx
+
+from slingshot import SlingshotClient
+from slingshot.testing import FakeSlingshotServer
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<24} mean={statistics.mean(samples) * 1000:7.3f}ms "
+        f"p50={_percentile(samples, 50) * 1000:7.3f}ms "
+        f"p99={_percentile(samples, 99) * 1000:7.3f}ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the latency of both modes."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with FakeSlingshotServer(api_key="benchmark") as server:
+        server.add_projects(50)
+
+        unpooled = []
+        for _ in range(count):
+            start = time.perf_counter()
+            httpx.request(
+                "GET", f"{server.url}/v1/projects", headers={"Auth": "benchmark"}
+            ).raise_for_status()
+            unpooled.append(time.perf_counter() - start)
+
+        pooled = []
+        with SlingshotClient(api_key="benchmark", api_url=server.url) as client:
+            for _ in range(count):
+                start = time.perf_counter()
+                client._api_request("GET", "/v1/projects")
+                pooled.append(time.perf_counter() - start)
+
+    _report("new connection per call", unpooled)
+    _report("pooled connections", pooled)
+    print(f"speedup (mean): {statistics.mean(unpooled) / statistics.mean(pooled):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
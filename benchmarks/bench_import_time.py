@@ -0,0 +1,85 @@
+"""Benchmark the time it takes to import the SDK.
+
+This script runs ``python -X importtime -c "import slingshot"`` in fresh
+interpreters and reports the median cumulative import time of the package,
+along with the slowest modules it pulled in. It also times importing the
+client.
+
+``import slingshot`` only loads the public names on first use, and the client
+only imports httpx, asyncio and the modules of the optional features once it
+is created or makes its first request, so short-lived scripts that exit early,
+or that only use the caches or the rate limiter, do not pay for them.
+
+Usage:
+    python benchmarks/bench_import_time.py [runs] [budget_ms]
+
+Arguments:
+    runs: Number of interpreters started for each statement (default: 20)
+    budget_ms: Maximum median time of ``import slingshot``, in milliseconds;
+        the script exits with code 1 when it is exceeded, e.g. in CI
+        (default: no budget)
+"""
+
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = ["import slingshot", "from slingshot import SlingshotClient"]
+
+
+def _importtime(statement: str) -> list[tuple[str, int, bool]]:
+    """Return the modules imported by `statement` with their cumulative time in microseconds.
+
+    Each module comes with whether `statement` imported it directly, rather
+    than another module; the times of those add up to the total.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        # Nested imports are indented by two spaces per level.
+        imports.append((module.strip(), int(cumulative), not module[1:].startswith(" ")))
+    # A module is listed after the modules it imported, so the imports of the
+    # statement follow the last direct import made by the interpreter startup.
+    first = next(
+        i for i, (module, _, direct) in enumerate(imports) if direct and module == "slingshot"
+    )
+    startup = [i for i, (_, _, direct) in enumerate(imports[:first]) if direct]
+    return imports[startup[-1] + 1 if startup else 0 :]
+
+
+def main() -> None:
+    """Run the benchmark and print the import times."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    medians = {}
+    for statement in STATEMENTS:
+        samples = [_importtime(statement) for _ in range(runs)]
+        medians[statement] = (
+            statistics.median(
+                sum(time for _, time, direct in imports if direct) for imports in samples
+            )
+            / 1000
+        )
+        print(f"{statement:<40} median={medians[statement]:7.2f}ms")
+        slowest = sorted(samples[-1], key=lambda item: item[1], reverse=True)[:5]
+        for module, cumulative, _ in slowest:
+            print(f"    {module:<36} {cumulative / 1000:7.2f}ms")
+
+    total = medians[STATEMENTS[0]]
+    if budget_ms is not None and total > budget_ms:
+        print(f"import slingshot took {total:.2f}ms, over the {budget_ms}ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark the JSON codecs on pages of projects.
+
+This script builds pages of realistic projects, shaped like ``ProjectSchema``
+with settings, metrics and a creator, and times every available codec:
+
+- decoding a page, as ``SlingshotClient`` does for each response, and
+- encoding a batch of project updates, as it does for each request body.
+
+``OrjsonCodec`` is only timed if orjson is installed, which it is with the
+``fast`` extra: ``pip install "c1s-slingshot-sdk-py[fast]"``.
+
+Usage:
+    python benchmarks/bench_json_codec.py [page_size] [repeat]
+
+Arguments:
+    page_size: Number of projects per page (default: 100)
+    repeat: Number of times each operation is timed (default: 200)
+"""
+
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+from slingshot.codec import JSONCodec, OrjsonCodec
+
+
+def _project(i: int) -> dict[str, Any]:
+    return {
+        "created_at": "2025-03-14T09:26:53.589793Z",
+        "updated_at": "2025-06-02T17:45:12.000000Z",
+        "id": f"4c5d1f1e-9a1b-4e2f-8c3d-{i:012d}",
+        "name": f"nightly-etl-{i}",
+        "app_id": f"app-{i}",
+        "cluster_path": f"/Users/etl/clusters/cluster-{i % 17}",
+        "job_id": f"{900000000000 + i}",
+        "workspace_id": "1234567890123456",
+        "creator_id": "b7e1c2d3-0f4a-4b5c-9d6e-7f8091a2b3c4",
+        "description": "Aggregates the daily transactions into the reporting tables. " * 2,
+        "settings": {
+            "sla_minutes": 60 + i % 30,
+            "auto_apply_recs": i % 2 == 0,
+            "optimize_instance_size": True,
+        },
+        "metrics": {
+            "job_success_rate_percent": 97,
+            "sla_met_percent": 88,
+            "estimated_savings": 1250 + i,
+        },
+        "creator": {
+            "userId": "b7e1c2d3-0f4a-4b5c-9d6e-7f8091a2b3c4",
+            "auth0Id": "auth0|64f0c0ffee",
+            "tenantId": "TENANTID",
+            "isTenantAdmin": False,
+            "firstName": "Dana",
+            "lastName": "Rivera",
+            "email": "dana.rivera@example.com",
+            "createdAt": "2024-11-01T12:00:00.000Z",
+            "updatedAt": "2025-05-30T08:15:00.000Z",
+            "isActive": True,
+            "isRegistered": True,
+        },
+        "phase": "LEARNING" if i % 3 else "OPTIMIZING",
+        "product_name": "databricks",
+    }
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Run the benchmark and print the median time of each codec."""
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    page = {"page": 1, "pages": 10, "items": [_project(i) for i in range(page_size)]}
+    updates = [
+        {"name": project["name"], "settings": project["settings"]} for project in page["items"]
+    ]
+
+    codecs: list[JSONCodec] = [JSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed, only timing the stdlib codec")
+
+    body = JSONCodec().dumps(page)
+    print(f"page of {page_size} projects: {len(body) / 1024:.1f} KiB")
+    results = {}
+    for codec in codecs:
+        decode = _time(lambda codec=codec: codec.loads(body), repeat)
+        encode = _time(lambda codec=codec: [codec.dumps(update) for update in updates], repeat)
+        results[codec.name] = (decode, encode)
+        print(
+            f"{codec.name:<8} decode page={decode * 1000:7.3f}ms encode updates={encode * 1000:7.3f}ms"
+        )
+
+    if "orjson" in results:
+        json_decode, json_encode = results["json"]
+        orjson_decode, orjson_encode = results["orjson"]
+        print(
+            f"speedup: decode {json_decode / orjson_decode:.2f}x, encode {json_encode / orjson_encode:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
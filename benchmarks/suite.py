@@ -0,0 +1,261 @@
+"""Benchmark the hot paths of the SDK and compare the results with a baseline.
+
+This script times the SDK against a local
+:class:`~slingshot.testing.FakeSlingshotServer`, so it runs offline and is not
+affected by the load or the network latency of the real API:
+
+- ``iterate_projects``: projects per second when listing every page,
+- ``get_project``: p50 and p99 latency of fetching a project,
+- ``create_many``: projects per second when creating a batch,
+- ``remove_unset_keys``: cost of stripping ``UNSET`` values from a payload,
+- ``json_decode``: cost of decoding a page of projects with the client's codec,
+- ``retry_429``: p50 latency and retries per request while 20% of the
+  requests are throttled.
+
+Each benchmark runs ``--rounds`` times and the median of every metric is
+reported. The results are written as JSON, to stdout or to ``--output``, so
+that they can be stored as a baseline. With ``--baseline``, the results are
+compared with a stored run and the script exits with 1 when a metric got worse
+by more than ``--tolerance``. To judge an SDK upgrade, save a baseline with the
+current version, install the new one and run the suite again:
+
+    python benchmarks/suite.py --output baseline.json
+    pip install --upgrade c1s-slingshot-sdk-py
+    python benchmarks/suite.py --baseline baseline.json
+
+Usage:
+    python benchmarks/suite.py [--rounds N] [--quick] [--only NAME ...]
+        [--output PATH] [--baseline PATH] [--tolerance FRACTION]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from importlib.metadata import version
+from typing import Any, Callable
+
+from slingshot import RetryBudget, RetryPolicy, SlingshotClient
+from slingshot.client import _remove_unset_keys
+from slingshot.codec import default_codec
+from slingshot.testing import FakeSlingshotServer
+from slingshot.types import UNSET
+
+# Metric name -> (unit, whether a higher value is better).
+METRICS = {
+    "projects_per_second": ("1/s", True),
+    "p50_ms": ("ms", False),
+    "p99_ms": ("ms", False),
+    "us_per_call": ("us", False),
+    "ms_per_page": ("ms", False),
+    "retries_per_request": ("1", False),
+}
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+@contextmanager
+def _client(**server_options: Any) -> Iterator[tuple[FakeSlingshotServer, SlingshotClient]]:
+    """Start a fake server and a client of it that retries without long waits.
+
+    The retry budget allows a retry for every request, so that the throttled
+    requests of ``retry_429`` are all retried.
+    """
+    with FakeSlingshotServer(**server_options) as server:
+        policy = RetryPolicy(
+            max_attempts=10, base_delay=0.001, max_delay=0.005, budget=RetryBudget(ratio=1.0)
+        )
+        with SlingshotClient(
+            api_key="benchmark", api_url=server.url, retry_policy=policy
+        ) as client:
+            yield server, client
+
+
+def bench_iterate_projects(scale: int) -> dict[str, float]:
+    """Time listing every project, 100 per page."""
+    with _client() as (server, client):
+        server.add_projects(20 * scale * 100)
+        start = time.perf_counter()
+        count = sum(1 for _ in client.projects.iterate_projects(size=100))
+        return {"projects_per_second": count / (time.perf_counter() - start)}
+
+
+def bench_get_project(scale: int) -> dict[str, float]:
+    """Time fetching single projects one after another."""
+    with _client() as (server, client):
+        project_ids = [project["id"] for project in server.add_projects(100)]
+        samples = []
+        for i in range(200 * scale):
+            start = time.perf_counter()
+            client.projects.get_project(project_ids[i % len(project_ids)])
+            samples.append(time.perf_counter() - start)
+    return {"p50_ms": _percentile(samples, 50) * 1000, "p99_ms": _percentile(samples, 99) * 1000}
+
+
+def bench_create_many(scale: int) -> dict[str, float]:
+    """Time creating a batch of projects with the default concurrency."""
+    projects = [
+        {"name": f"Project {i}", "workspace_id": "1234", "job_id": str(i)}
+        for i in range(200 * scale)
+    ]
+    with _client() as (_, client):
+        start = time.perf_counter()
+        results = client.projects.create_many(projects)
+        elapsed = time.perf_counter() - start
+    assert all(outcome["error"] is None for outcome in results)
+    return {"projects_per_second": len(projects) / elapsed}
+
+
+def bench_remove_unset_keys(scale: int) -> dict[str, float]:
+    """Time stripping UNSET values from an update payload."""
+    payload = {
+        "name": "nightly-etl",
+        "description": UNSET,
+        "app_id": UNSET,
+        "settings": {"sla_minutes": 60, "auto_apply_recs": UNSET, "optimize_instance_size": True},
+        "tags": [{"key": f"k{i}", "value": UNSET if i % 2 else i} for i in range(20)],
+    }
+    calls = 2000 * scale
+    start = time.perf_counter()
+    for _ in range(calls):
+        _remove_unset_keys(payload)
+    return {"us_per_call": (time.perf_counter() - start) / calls * 1e6}
+
+
+def bench_json_decode(scale: int) -> dict[str, float]:
+    """Time decoding a page of 100 projects as served by the API."""
+    server = FakeSlingshotServer()
+    server.add_projects(100)
+    _, _, body = server.handle("GET", "/v1/projects?size=100&include=creator", {"Auth": "x"}, b"")
+    codec = default_codec()
+    pages = 200 * scale
+    start = time.perf_counter()
+    for _ in range(pages):
+        codec.loads(body)
+    return {"ms_per_page": (time.perf_counter() - start) / pages * 1000}
+
+
+def bench_retry_429(scale: int) -> dict[str, float]:
+    """Time fetching projects while a share of the requests is throttled."""
+    with _client(throttle_rate=0.2, retry_after=0.001, seed=0) as (server, client):
+        project_ids = [project["id"] for project in server.add_projects(100)]
+        requests = 100 * scale
+        samples = []
+        for i in range(requests):
+            start = time.perf_counter()
+            client.projects.get_project(project_ids[i % len(project_ids)])
+            samples.append(time.perf_counter() - start)
+        retries = client.retry_stats()["retries"]
+    return {"p50_ms": _percentile(samples, 50) * 1000, "retries_per_request": retries / requests}
+
+
+BENCHMARKS: dict[str, Callable[[int], dict[str, float]]] = {
+    "iterate_projects": bench_iterate_projects,
+    "get_project": bench_get_project,
+    "create_many": bench_create_many,
+    "remove_unset_keys": bench_remove_unset_keys,
+    "json_decode": bench_json_decode,
+    "retry_429": bench_retry_429,
+}
+
+
+def run(names: list[str], rounds: int, scale: int) -> dict[str, Any]:
+    """Run the benchmarks and return the results with the environment they ran in."""
+    results = {}
+    for name in names:
+        samples = [BENCHMARKS[name](scale) for _ in range(rounds)]
+        results[name] = {
+            metric: {
+                "value": statistics.median(sample[metric] for sample in samples),
+                "unit": METRICS[metric][0],
+                "higher_is_better": METRICS[metric][1],
+            }
+            for metric in samples[0]
+        }
+        summary = ", ".join(
+            f"{metric}={result['value']:.3f}{result['unit']}"
+            for metric, result in results[name].items()
+        )
+        print(f"{name:<20} {summary}", file=sys.stderr)
+    return {
+        "environment": {
+            "sdk_version": version("c1s-slingshot-sdk-py"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "codec": default_codec().name,
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "rounds": rounds,
+            "scale": scale,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerance: float) -> bool:
+    """Print how every metric changed since the baseline and return whether none regressed.
+
+    A change is the relative difference with the baseline, signed so that a
+    positive change is an improvement whichever direction is better.
+    """
+    print(
+        f"baseline: SDK {baseline['environment']['sdk_version']}, "
+        f"current: SDK {current['environment']['sdk_version']}"
+    )
+    if baseline["environment"]["platform"] != current["environment"]["platform"]:
+        print("warning: the baseline was recorded on another platform")
+    ok = True
+    for name, metrics in current["results"].items():
+        for metric, result in metrics.items():
+            previous = baseline["results"].get(name, {}).get(metric)
+            if previous is None or previous["value"] == 0:
+                print(f"{name + '.' + metric:<40} {result['value']:>12.3f}  (new)")
+                continue
+            change = result["value"] / previous["value"] - 1
+            if not result["higher_is_better"]:
+                change = -change
+            status = "REGRESSION" if change < -tolerance else ""
+            ok = ok and not status
+            print(
+                f"{name + '.' + metric:<40} {previous['value']:>12.3f} -> "
+                f"{result['value']:>12.3f} {result['unit']:<4} {change:+7.1%} {status}"
+            )
+    return ok
+
+
+def main() -> None:
+    """Parse the arguments, run the benchmarks and compare them with the baseline."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="runs of each benchmark")
+    parser.add_argument("--quick", action="store_true", help="run a smaller workload, e.g. in CI")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--output", help="file to write the results to instead of stdout")
+    parser.add_argument("--baseline", help="results of a previous run to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="largest accepted regression (default: 0.2)"
+    )
+    args = parser.parse_args()
+
+    current = run(args.only, args.rounds, scale=1 if args.quick else 5)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    elif not args.baseline:
+        print(json.dumps(current, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if not compare(baseline, current, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
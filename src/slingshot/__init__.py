@@ -1,6 +1,76 @@
 """Slingshot SDK for Python."""
 
-from .__vers import __version__
-from .client import SlingshotClient
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["SlingshotClient", "__version__"]
+if TYPE_CHECKING:
+    from .__vers import __version__
+    from .cache import ResponseCache, ValidatorCache
+    from .circuit import CircuitBreaker, CircuitOpenError
+    from .client import AsyncSlingshotClient, SlingshotClient
+    from .codec import JSONCodec, OrjsonCodec
+    from .hooks import RequestHooks
+    from .index import ProjectIndex
+    from .metrics import MetricsRegistry
+    from .ratelimit import RateLimiter
+    from .retry import RetryBudget, RetryPolicy
+    from .store import ProjectStore, sync_projects
+
+# The module defining each public name. They are imported on first use, so
+# that `import slingshot` stays fast and does not load httpx until a client
+# is needed.
+_LAZY_IMPORTS = {
+    "AsyncSlingshotClient": "client",
+    "CircuitBreaker": "circuit",
+    "CircuitOpenError": "circuit",
+    "JSONCodec": "codec",
+    "MetricsRegistry": "metrics",
+    "OrjsonCodec": "codec",
+    "ProjectIndex": "index",
+    "ProjectStore": "store",
+    "RateLimiter": "ratelimit",
+    "RequestHooks": "hooks",
+    "ResponseCache": "cache",
+    "RetryBudget": "retry",
+    "RetryPolicy": "retry",
+    "SlingshotClient": "client",
+    "ValidatorCache": "cache",
+    "__version__": "__vers",
+    "sync_projects": "store",
+}
+
+__all__ = [
+    "AsyncSlingshotClient",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "JSONCodec",
+    "MetricsRegistry",
+    "OrjsonCodec",
+    "ProjectIndex",
+    "ProjectStore",
+    "RateLimiter",
+    "RequestHooks",
+    "ResponseCache",
+    "RetryBudget",
+    "RetryPolicy",
+    "SlingshotClient",
+    "ValidatorCache",
+    "__version__",
+    "sync_projects",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public names of the package on first use."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Later lookups find the name directly, without calling __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names along with the names already imported."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,66 @@
+"""Helpers for running blocking API calls concurrently on a thread pool."""
+
+from collections.abc import Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from itertools import islice
+from typing import Callable, TypeVar
+
+from slingshot.types import BatchResult
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _as_batch_result(future: Future[R]) -> BatchResult[R]:
+    """Convert a finished future into a :class:`BatchResult`."""
+    error = future.exception()
+    if error is None:
+        return {"result": future.result(), "error": None}
+    if not isinstance(error, Exception):
+        # Do not swallow KeyboardInterrupt, SystemExit and the like.
+        raise error
+    return {"result": None, "error": error}
+
+
+def run_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> Generator[tuple[T, BatchResult[R]], None, None]:
+    """Call `fn` on every item with at most `max_workers` calls in flight.
+
+    Items are consumed lazily from `items`, so only the calls in flight are
+    held in memory. Each item is yielded together with the outcome of its
+    call as soon as that call finishes, so the output is in completion order.
+    Exceptions raised by `fn` are captured in the result instead of being
+    raised. Calls that have not started are cancelled if the generator is
+    closed early. Each call runs in a copy of the context of the caller, so
+    that context variables, such as the current tracing span, carry over to
+    the worker threads.
+
+    Args:
+        fn (Callable[[T], R]): The blocking function to call for each item.
+        items (Iterable[T]): The items to call `fn` on.
+        max_workers (int): The maximum number of concurrent calls.
+
+    Yields:
+        tuple[T, BatchResult[R]]: An item and the outcome of calling `fn` on it.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    remaining = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="slingshot-batch")
+    pending: dict[Future[R], T] = {}
+    try:
+        for item in islice(remaining, max_workers):
+            pending[executor.submit(copy_context().run, fn, item)] = item
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in islice(remaining, 1):
+                    pending[executor.submit(copy_context().run, fn, next_item)] = next_item
+                yield item, _as_batch_result(future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,146 @@
+"""Incremental decoding of an array inside a JSON object, such as the items of a page."""
+
+import json
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+
+
+class _NeedMore(Exception):
+    """Raised internally when the buffered text ends before the next token does."""
+
+
+class ArrayFieldParser:
+    """Decodes the elements of one array field of a JSON object as its text arrives.
+
+    Text is passed to :meth:`feed` in chunks of any size; each call returns
+    the array elements completed by the chunk. Only the element being decoded
+    is buffered, so memory use does not grow with the size of the array. The
+    other fields of the object, which may come before or after the array, are
+    collected in :attr:`rest`.
+
+    >>> parser = ArrayFieldParser("items")
+    >>> parser.feed('{"page": 1, "items": [{"id": "a"}, {"i')
+    [{'id': 'a'}]
+    >>> parser.feed('d": "b"}], "pages": 2}', final=True)
+    [{'id': 'b'}]
+    >>> parser.rest
+    {'page': 1, 'pages': 2}
+    """
+
+    def __init__(self, field: str):
+        """Initialize the parser.
+
+        Args:
+            field (str): The name of the array field whose elements are decoded.
+        """
+        self.field = field
+        self.rest: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._final = False
+        self._state = "object"
+        self._key = ""
+        self._array_seen = False
+
+    def feed(self, text: str, final: bool = False) -> list[Any]:
+        """Add the next chunk of text, returning the array elements it completed.
+
+        Args:
+            text (str): The next chunk of the JSON text.
+            final (bool, optional): Whether this is the last chunk. Defaults
+                to False.
+
+        Returns:
+            list[Any]: The decoded array elements, in order.
+
+        Raises:
+            ValueError: If the text is not a JSON object with the array field,
+                or if the last chunk leaves it incomplete.
+        """
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        self._final = final
+        items: list[Any] = []
+        while self._state != "done":
+            start = self._pos
+            try:
+                self._step(items)
+            except _NeedMore:
+                # Steps are atomic: resume from the start of the token next time.
+                self._pos = start
+                if final:
+                    raise ValueError("Incomplete JSON document") from None
+                return items
+        if self._buffer[self._pos :].strip(_WHITESPACE):
+            raise ValueError("Extra data after the JSON document")
+        if not self._array_seen:
+            raise ValueError(f"JSON document has no {self.field!r} array")
+        return items
+
+    def _next_char(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+        if self._pos == len(self._buffer):
+            raise _NeedMore
+        return self._buffer[self._pos]
+
+    def _expect(self, *chars: str) -> str:
+        """Consume the next character, which must be one of `chars`."""
+        char = self._next_char()
+        if char not in chars:
+            raise ValueError(f"Expected {' or '.join(chars)} at position {self._pos}, got {char!r}")
+        self._pos += 1
+        return char
+
+    def _close(self, char: str) -> bool:
+        """Consume the next character if it is `char`, returning whether it was."""
+        if self._next_char() != char:
+            return False
+        self._pos += 1
+        return True
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._next_char()
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            raise _NeedMore from None
+        # A number or literal at the end of the buffer may continue in the next chunk.
+        if end == len(self._buffer) and not self._final:
+            raise _NeedMore
+        self._pos = end
+        return value
+
+    def _step(self, items: list[Any]) -> None:
+        """Consume one token, moving to the next state."""
+        state = self._state
+        if state == "object":
+            self._expect("{")
+            self._state = "done" if self._close("}") else "key"
+        elif state == "key":
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("Expected a string key in the JSON object")
+            self._expect(":")
+            self._key = key
+            self._state = "array" if key == self.field else "value"
+        elif state == "value":
+            self.rest[self._key] = self._value()
+            self._state = "next_key"
+        elif state == "next_key":
+            self._state = "key" if self._expect(",", "}") == "," else "done"
+        elif state == "array":
+            self._expect("[")
+            self._array_seen = True
+            self._state = "next_key" if self._close("]") else "item"
+        elif state == "item":
+            items.append(self._value())
+            self._state = "next_item"
+        elif state == "next_item":
+            self._state = "item" if self._expect(",", "]") == "," else "next_key"
@@ -1,13 +1,30 @@
-from collections.abc import Iterator, Mapping
-from typing import Any, Optional, cast
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    Collection,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import islice
+from typing import Any, Callable, Optional, TypeVar, cast
 
 import httpx
 
-from slingshot.client import SlingshotClient
+from slingshot._concurrency import run_concurrently
+from slingshot.client import AsyncSlingshotClient, SlingshotClient, _retry_after_seconds
+from slingshot.hooks import _operation
 from slingshot.types import (
     JSON_TYPE,
     UNSET,
     AssignSettingsSchema,
+    BatchResult,
     Page,
     ProjectSchema,
     QueryParams,
@@ -15,6 +32,11 @@ from slingshot.types import (
 )
 
 MAX_PAGES = 1000
+# Recommendation states after which the state no longer changes.
+TERMINAL_RECOMMENDATION_STATES = ("SUCCESS", "FAILURE")
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def _dict_set_if_not_unset(
@@ -35,6 +57,143 @@ def _dict_set_if_not_unset(
         destination[key] = value
 
 
+def _poll_delays(initial_interval: float, max_interval: float) -> Iterator[float]:
+    """Yield exponentially growing delays between polls, with jitter.
+
+    Each delay is drawn uniformly from the upper half of the current interval,
+    so concurrent pollers spread out without ever polling much sooner than
+    the schedule intends.
+    """
+    interval = initial_interval
+    while True:
+        yield random.uniform(interval / 2, interval)
+        interval = min(max_interval, interval * 2)
+
+
+def _throttled_delay(error: httpx.HTTPStatusError) -> Optional[float]:
+    """Return how long to wait after a 429 or 503 response, or None for other errors.
+
+    The Retry-After header is honored when the response has one.
+    """
+    if error.response.status_code not in {429, 503}:
+        return None
+    retry_after = _retry_after_seconds(error.response)
+    return 0.0 if retry_after is None else retry_after
+
+
+def _is_terminal_recommendation(response: Optional[JSON_TYPE]) -> bool:
+    """Whether a recommendation response is final, so that it may be cached."""
+    result = response.get("result") if isinstance(response, dict) else None
+    return isinstance(result, dict) and result.get("state") in TERMINAL_RECOMMENDATION_STATES
+
+
+def _settings_payload(settings: Optional[AssignSettingsSchema]) -> JSON_TYPE:
+    """Build the "settings" object of a create or update request body."""
+    if settings is None:
+        return None
+    payload: dict[str, Any] = {}
+    for key in (
+        "sla_minutes",
+        "auto_apply_recs",
+        "optimize_instance_size",
+    ):
+        _dict_set_if_not_unset(settings, payload, key)
+    return payload
+
+
+def _create_payload(
+    name: str,
+    workspace_id: str,
+    description: Optional[str] = UNSET,
+    app_id: Optional[str] = UNSET,
+    job_id: Optional[str] = UNSET,
+    cluster_path: Optional[str] = UNSET,
+    settings: Optional[AssignSettingsSchema] = UNSET,
+) -> dict[str, JSON_TYPE]:
+    """Build the request body for creating a project, see :meth:`ProjectAPI.create`."""
+    # The Slingshot API expects "workspaceId" to be in camelCase, the rest
+    # of the keys are in snake_case.
+    json: dict[str, JSON_TYPE] = {"name": name, "workspaceId": workspace_id}
+
+    if app_id is not UNSET:
+        json["app_id"] = app_id
+    # cluster_path is the name of a job cluster prefixed by
+    # "job_clusters/" or the name of a task prefixed by "tasks/".
+    if cluster_path is not UNSET:
+        json["cluster_path"] = cluster_path
+    if job_id is not UNSET:
+        json["job_id"] = job_id
+    if description is not UNSET:
+        json["description"] = description
+    if settings is not UNSET:
+        json["settings"] = _settings_payload(settings)
+    return json
+
+
+def _update_payload(
+    name: Optional[str] = UNSET,
+    workspace_id: Optional[str] = UNSET,
+    description: Optional[str] = UNSET,
+    job_id: Optional[str] = UNSET,
+    cluster_path: Optional[str] = UNSET,
+    settings: Optional[AssignSettingsSchema] = UNSET,
+) -> dict[str, JSON_TYPE]:
+    """Build the request body for updating a project, see :meth:`ProjectAPI.update`."""
+    json: dict[str, JSON_TYPE] = {}
+
+    if name is not UNSET:
+        json["name"] = name
+    # cluster_path is the name of a job cluster prefixed by
+    # "job_clusters/" or the name of a task prefixed by "tasks/".
+    if cluster_path is not UNSET:
+        json["cluster_path"] = cluster_path
+    if job_id is not UNSET:
+        json["job_id"] = job_id
+    # The Slingshot API expects "workspaceId" to be in camelCase, the
+    # rest of the keys are in snake_case.
+    if workspace_id is not UNSET:
+        json["workspaceId"] = workspace_id
+    if description is not UNSET:
+        json["description"] = description
+    if settings is not UNSET:
+        json["settings"] = _settings_payload(settings)
+    return json
+
+
+def _include_params(include: Optional[list[str]]) -> QueryParams:
+    """Build the query parameters that select the attributes of a project."""
+    params: QueryParams = {}
+    if include:
+        params["include"] = include
+    return params
+
+
+def _list_params(
+    include: Optional[list[str]] = None,
+    creator_id: Optional[str] = None,
+    app_id: Optional[str] = None,
+    job_id: Optional[str] = None,
+    page: int = 1,
+    size: int = 50,
+) -> QueryParams:
+    """Build the query parameters for listing projects, see :meth:`ProjectAPI.get_projects`."""
+    params: QueryParams = {
+        "page": cast(str, page),
+        "size": cast(str, size),
+    }
+
+    if include:
+        # pyright is not happy with list[str] although QueryParams allows it
+        params["include"] = include  # pyright: ignore
+    if creator_id is not None:
+        params["creator_id"] = creator_id
+    if app_id is not None:
+        params["app_id"] = app_id
+    if job_id is not None:
+        params["job_id"] = job_id
+    return params
+
+
 class ProjectAPI:
     """API for managing projects in Slingshot."""
 
@@ -42,6 +201,7 @@ class ProjectAPI:
         """Initialize the ProjectAPI."""
         self.client = client
 
+    @_operation
     def create(
         self,
         name: str,
@@ -157,38 +317,23 @@ class ProjectAPI:
             ProjectSchema: The details of the newly created project.
 
         """
-        # The Slingshot API expects "workspaceId" to be in camelCase, the rest
-        # of the keys are in snake_case.
-        json: JSON_TYPE = {"name": name, "workspaceId": workspace_id}
-
-        if app_id is not UNSET:
-            json["app_id"] = app_id
-        # cluster_path is the name of a job cluster prefixed by
-        # "job_clusters/" or the name of a task prefixed by "tasks/".
-        if cluster_path is not UNSET:
-            json["cluster_path"] = cluster_path
-        if job_id is not UNSET:
-            json["job_id"] = job_id
-        if description is not UNSET:
-            json["description"] = description
-
-        if settings is not UNSET and settings is not None:
-            json["settings"] = {}
-            for key in (
-                "sla_minutes",
-                "auto_apply_recs",
-                "optimize_instance_size",
-            ):
-                _dict_set_if_not_unset(settings, json["settings"], key)
-        elif settings is None:
-            json["settings"] = None
-
+        json = _create_payload(
+            name=name,
+            workspace_id=workspace_id,
+            description=description,
+            app_id=app_id,
+            job_id=job_id,
+            cluster_path=cluster_path,
+            settings=settings,
+        )
         response = cast(
             dict[str, Any],
             self.client._api_request(
                 method="POST",
                 endpoint="/v1/projects",
                 json=json,
+                # The payload is built without UNSET values.
+                skip_unset=False,
             ),
         )
 
@@ -197,6 +342,7 @@ class ProjectAPI:
             response.get("result"),
         )
 
+    @_operation
     def update(
         self,
         project_id: str,
@@ -323,40 +469,21 @@ class ProjectAPI:
             ProjectSchema: The details of the updated project.
 
         """
-        json: JSON_TYPE = {}
-
-        if name is not UNSET:
-            json["name"] = name
-        # cluster_path is the name of a job cluster prefixed by
-        # "job_clusters/" or the name of a task prefixed by "tasks/".
-        if cluster_path is not UNSET:
-            json["cluster_path"] = cluster_path
-        if job_id is not UNSET:
-            json["job_id"] = job_id
-        # The Slingshot API expects "workspaceId" to be in camelCase, the
-        # rest of the keys are in snake_case.
-        if workspace_id is not UNSET:
-            json["workspaceId"] = workspace_id
-        if description is not UNSET:
-            json["description"] = description
-
-        if settings is not UNSET and settings is not None:
-            json["settings"] = {}
-            for key in (
-                "sla_minutes",
-                "auto_apply_recs",
-                "optimize_instance_size",
-            ):
-                _dict_set_if_not_unset(settings, json["settings"], key)
-        elif settings is None:
-            json["settings"] = None
-
+        json = _update_payload(
+            name=name,
+            workspace_id=workspace_id,
+            description=description,
+            job_id=job_id,
+            cluster_path=cluster_path,
+            settings=settings,
+        )
         response = cast(
             dict[str, Any],
             self.client._api_request(
                 method="PUT",
                 endpoint=f"/v1/projects/{project_id}",
                 json=json,
+                skip_unset=False,
             ),
         )
 
@@ -365,6 +492,7 @@ class ProjectAPI:
             response.get("result"),
         )
 
+    @_operation
     def delete(self, project_id: str) -> None:
         """Delete a Slingshot project by its ID.
 
@@ -380,6 +508,7 @@ class ProjectAPI:
         self.client._api_request(method="DELETE", endpoint=f"/v1/projects/{project_id}")
         return None
 
+    @_operation
     def reset(self, project_id: str) -> None:
         """Reset a Slingshot project by its ID, removing all previous job run data from the project.
 
@@ -400,6 +529,132 @@ class ProjectAPI:
         self.client._api_request(method="POST", endpoint=f"/v1/projects/{project_id}/reset")
         return None
 
+    def _run_batch(
+        self,
+        operation: Callable[[T], R],
+        items: Iterable[T],
+        max_workers: int,
+    ) -> list[BatchResult[R]]:
+        """Run `operation` on every item concurrently, returning the outcomes in input order.
+
+        Each worker waits out any pause caused by a retried 429 response
+        before starting its next item, so the whole batch backs off together.
+        """
+
+        def run(indexed_item: tuple[int, T]) -> R:
+            self.client._backpressure.wait()
+            return operation(indexed_item[1])
+
+        outcomes: dict[int, BatchResult[R]] = {}
+        for (index, _), outcome in run_concurrently(run, enumerate(items), max_workers):
+            outcomes[index] = outcome
+        return [outcomes[index] for index in range(len(outcomes))]
+
+    @_operation
+    def create_many(
+        self,
+        projects: Iterable[Mapping[str, Any]],
+        max_workers: int = 8,
+    ) -> list[BatchResult[ProjectSchema]]:
+        """Create many Slingshot projects concurrently.
+
+        A failure to create one project is reported in its result rather than
+        aborting the rest of the batch.
+
+        >>> results = client.projects.create_many(
+        ...     [
+        ...         {"name": "Project A", "workspace_id": "1234", "job_id": "111"},
+        ...         {"name": "Project B", "workspace_id": "1234", "job_id": "222"},
+        ...     ]
+        ... )
+        >>> failed = [outcome["error"] for outcome in results if outcome["error"]]
+
+        Args:
+            projects (Iterable[Mapping[str, Any]]): The keyword arguments of
+                :meth:`create` for each project to create.
+            max_workers (int, optional): The maximum number of projects created
+                at the same time. Defaults to 8.
+
+        Returns:
+            list[BatchResult[ProjectSchema]]: The outcome of each create, in the
+            same order as `projects`.
+
+        """
+        return self._run_batch(lambda project: self.create(**project), projects, max_workers)
+
+    @_operation
+    def update_many(
+        self,
+        updates: Iterable[Mapping[str, Any]],
+        max_workers: int = 8,
+    ) -> list[BatchResult[ProjectSchema]]:
+        """Update many Slingshot projects concurrently.
+
+        A failure to update one project is reported in its result rather than
+        aborting the rest of the batch.
+
+        >>> results = client.projects.update_many(
+        ...     [
+        ...         {"project_id": "project-id-1", "settings": {"sla_minutes": 30}},
+        ...         {"project_id": "project-id-2", "name": "Renamed project"},
+        ...     ]
+        ... )
+
+        Args:
+            updates (Iterable[Mapping[str, Any]]): The keyword arguments of
+                :meth:`update`, including `project_id`, for each project to
+                update.
+            max_workers (int, optional): The maximum number of projects updated
+                at the same time. Defaults to 8.
+
+        Returns:
+            list[BatchResult[ProjectSchema]]: The outcome of each update, in the
+            same order as `updates`.
+
+        """
+        return self._run_batch(lambda update: self.update(**update), updates, max_workers)
+
+    @_operation
+    def delete_many(
+        self,
+        project_ids: Iterable[str],
+        max_workers: int = 8,
+    ) -> list[BatchResult[None]]:
+        """Delete many Slingshot projects concurrently, see :meth:`delete`.
+
+        Args:
+            project_ids (Iterable[str]): The IDs of the projects to delete.
+            max_workers (int, optional): The maximum number of projects deleted
+                at the same time. Defaults to 8.
+
+        Returns:
+            list[BatchResult[None]]: The outcome of each delete, in the same
+            order as `project_ids`.
+
+        """
+        return self._run_batch(self.delete, project_ids, max_workers)
+
+    @_operation
+    def reset_many(
+        self,
+        project_ids: Iterable[str],
+        max_workers: int = 8,
+    ) -> list[BatchResult[None]]:
+        """Reset many Slingshot projects concurrently, see :meth:`reset`.
+
+        Args:
+            project_ids (Iterable[str]): The IDs of the projects to reset.
+            max_workers (int, optional): The maximum number of projects reset
+                at the same time. Defaults to 8.
+
+        Returns:
+            list[BatchResult[None]]: The outcome of each reset, in the same
+            order as `project_ids`.
+
+        """
+        return self._run_batch(self.reset, project_ids, max_workers)
+
+    @_operation
     def get_projects(
         self,
         include: Optional[list[str]] = None,
@@ -432,21 +687,14 @@ class ProjectAPI:
             page.
 
         """
-        params: QueryParams = {
-            "page": cast(str, page),
-            "size": cast(str, size),
-        }
-
-        if include:
-            # pyright is not happy with list[str] although QueryParams allows it
-            params["include"] = include  # pyright: ignore
-        if creator_id is not None:
-            params["creator_id"] = creator_id
-        if app_id is not None:
-            params["app_id"] = app_id
-        if job_id is not None:
-            params["job_id"] = job_id
-
+        params = _list_params(
+            include=include,
+            creator_id=creator_id,
+            app_id=app_id,
+            job_id=job_id,
+            page=page,
+            size=size,
+        )
         response: Page[ProjectSchema] = cast(
             Page[ProjectSchema],
             self.client._api_request(method="GET", endpoint="/v1/projects", params=params),
@@ -454,6 +702,7 @@ class ProjectAPI:
 
         return response
 
+    @_operation
     def iterate_projects(
         self,
         include: Optional[list[str]] = None,
@@ -462,9 +711,25 @@ class ProjectAPI:
         job_id: Optional[str] = None,
         size: int = 50,
         max_pages: int = MAX_PAGES,
-    ) -> Iterator[ProjectSchema]:
+        prefetch: int = 0,
+        stream: bool = False,
+    ) -> Generator[ProjectSchema, None, None]:
         """Fetch all projects page by page using a memory-efficient generator.
 
+        By default the next page is requested only after the previous page has
+        been consumed. With `prefetch`, the total number of pages reported by
+        the first page is used to request up to `prefetch` of the following
+        pages concurrently over the client's connection pool, while projects
+        are still yielded in page order. At most `prefetch` + 1 pages are held
+        in memory at a time, and pages that have not been requested yet are
+        cancelled if the generator is closed early.
+
+        With `stream`, each page is decoded as it is received and its projects
+        are yielded one at a time, so only one project is held in memory
+        instead of a whole page, and the first project is available before the
+        rest of the page has arrived. Streamed pages bypass the client's
+        response caches and request coalescing.
+
         Args:
             include (Optional[list[str]]): Attributes within :class:`ProjectSchema`
                 to include in the response. If not provided, all available
@@ -481,11 +746,44 @@ class ProjectAPI:
                 Defaults to 50.
             max_pages (int, optional): The maximum number of pages allowed to
                 traverse. Defaults to 1000.
+            prefetch (int, optional): The maximum number of pages to request
+                ahead of the page being consumed. Defaults to 0, which fetches
+                one page at a time.
+            stream (bool, optional): Whether to decode each page incrementally
+                as it is received. Cannot be combined with `prefetch`.
+                Defaults to False.
 
         Yields:
             Iterator[ProjectSchema]: A project object, one at a time.
 
+        Raises:
+            ValueError: If both `prefetch` and `stream` are given.
+
         """
+        if stream:
+            if prefetch > 0:
+                raise ValueError("prefetch cannot be combined with stream")
+            yield from self._iterate_projects_stream(
+                include=include,
+                creator_id=creator_id,
+                app_id=app_id,
+                job_id=job_id,
+                size=size,
+                max_pages=max_pages,
+            )
+            return
+        if prefetch > 0:
+            yield from self._iterate_projects_prefetch(
+                include=include,
+                creator_id=creator_id,
+                app_id=app_id,
+                job_id=job_id,
+                size=size,
+                max_pages=max_pages,
+                prefetch=prefetch,
+            )
+            return
+
         page = 1
         while True:
             try:
@@ -508,9 +806,98 @@ class ProjectAPI:
             except httpx.HTTPStatusError:
                 break
 
+    def _iterate_projects_stream(
+        self,
+        include: Optional[list[str]],
+        creator_id: Optional[str],
+        app_id: Optional[str],
+        job_id: Optional[str],
+        size: int,
+        max_pages: int,
+    ) -> Generator[ProjectSchema, None, None]:
+        """Fetch all projects, decoding each page as it is received."""
+        page = 1
+        while True:
+            params = _list_params(
+                include=include,
+                creator_id=creator_id,
+                app_id=app_id,
+                job_id=job_id,
+                page=page,
+                size=size,
+            )
+            rest: dict[str, Any] = {}
+            projects = self.client._stream_array("/v1/projects", params, "items", rest)
+            try:
+                first = next(projects)
+            except StopIteration:
+                pass
+            except httpx.HTTPStatusError:
+                break
+            else:
+                yield cast(ProjectSchema, first)
+                yield from cast(Iterator[ProjectSchema], projects)
+
+            page_number = rest["page"]
+            if page_number >= rest["pages"] or page_number >= max_pages:
+                break
+            page += 1
+
+    def _iterate_projects_prefetch(
+        self,
+        include: Optional[list[str]],
+        creator_id: Optional[str],
+        app_id: Optional[str],
+        job_id: Optional[str],
+        size: int,
+        max_pages: int,
+        prefetch: int,
+    ) -> Iterator[ProjectSchema]:
+        """Fetch all projects with up to `prefetch` pages requested ahead, see :meth:`iterate_projects`."""
+
+        def fetch(page: int) -> Page[ProjectSchema]:
+            return self.get_projects(
+                include=include,
+                creator_id=creator_id,
+                app_id=app_id,
+                job_id=job_id,
+                page=page,
+                size=size,
+            )
+
+        try:
+            first_page = fetch(1)
+        except httpx.HTTPStatusError:
+            return
+        yield from first_page["items"]
+
+        last_page = min(first_page["pages"], max_pages)
+        remaining_pages = iter(range(first_page["page"] + 1, last_page + 1))
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="slingshot-prefetch")
+        pending: deque[Future[Page[ProjectSchema]]] = deque(
+            executor.submit(copy_context().run, fetch, page)
+            for page in islice(remaining_pages, prefetch)
+        )
+        try:
+            while pending:
+                try:
+                    response_page = pending.popleft().result()
+                except httpx.HTTPStatusError:
+                    break
+                # Keep the window full while the caller consumes this page.
+                for page in islice(remaining_pages, 1):
+                    pending.append(executor.submit(copy_context().run, fetch, page))
+                yield from response_page["items"]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @_operation
     def get_project(self, project_id: str, include: Optional[list[str]] = None) -> ProjectSchema:
         """Fetch a project by its ID.
 
+        If the client has a :class:`~slingshot.cache.ResponseCache`, a
+        project fetched recently with the same `include` is served from it.
+
         Args:
             project_id (str): The ID of the project to fetch.
             include (Optional[list[str]]): Attributes within :class:`ProjectSchema`
@@ -521,17 +908,61 @@ class ProjectAPI:
             ProjectSchema: The project details.
 
         """
-        params: QueryParams = {}
-        if include:
-            params["include"] = include
         response = cast(
             dict[str, Any],
-            self.client._api_request(
-                method="GET", endpoint=f"/v1/projects/{project_id}", params=params
+            self.client._cached_get(
+                endpoint=f"/v1/projects/{project_id}",
+                params=_include_params(include),
             ),
         )
         return cast(ProjectSchema, response.get("result"))
 
+    @_operation
+    def get_projects_by_id(
+        self,
+        project_ids: Iterable[str],
+        include: Optional[list[str]] = None,
+        max_workers: int = 8,
+    ) -> Iterator[tuple[str, BatchResult[ProjectSchema]]]:
+        """Fetch many projects by their IDs concurrently.
+
+        The projects are fetched with :meth:`get_project` on a thread pool
+        that shares the client's connection pool. A failure to fetch one
+        project, such as a 404 or a 5xx response that persists after retries,
+        is reported in its result rather than aborting the whole batch.
+
+        Results are yielded as soon as each project has been fetched, so they
+        can be processed while the rest are still in flight, or collected into
+        a mapping of project ID to result:
+
+        >>> results = dict(client.projects.get_projects_by_id(project_ids))
+        >>> projects = {
+        ...     project_id: outcome["result"]
+        ...     for project_id, outcome in results.items()
+        ...     if outcome["error"] is None
+        ... }
+
+        Args:
+            project_ids (Iterable[str]): The IDs of the projects to fetch.
+                Duplicate IDs are fetched only once.
+            include (Optional[list[str]]): Attributes within :class:`ProjectSchema`
+                to include in the response. If not provided, all available
+                attributes are included. Defaults to None.
+            max_workers (int, optional): The maximum number of projects fetched
+                at the same time. Defaults to 8.
+
+        Yields:
+            Iterator[tuple[str, BatchResult[ProjectSchema]]]: A project ID and
+            the outcome of fetching it, in completion order.
+
+        """
+
+        def fetch(project_id: str) -> ProjectSchema:
+            return self.get_project(project_id=project_id, include=include)
+
+        yield from run_concurrently(fetch, dict.fromkeys(project_ids), max_workers)
+
+    @_operation
     def create_recommendation(self, project_id: str) -> RecommendationDetailsSchema:
         """Create a new recommendation for a Slingshot project.
 
@@ -593,6 +1024,7 @@ class ProjectAPI:
             response.get("result"),
         )
 
+    @_operation
     def get_recommendation(
         self,
         project_id: str,
@@ -605,6 +1037,10 @@ class ProjectAPI:
         within required SLAs. They are generated based on the previous job runs
         associated with the Slingshot project.
 
+        If the client has a :class:`~slingshot.cache.ResponseCache`,
+        recommendations in a terminal state are served from it; pending ones
+        are always fetched from the API.
+
         Args:
             project_id (str): The ID of the project that the recommendation
                 belongs to.
@@ -617,9 +1053,9 @@ class ProjectAPI:
         """
         response = cast(
             dict[str, Any],
-            self.client._api_request(
-                method="GET",
+            self.client._cached_get(
                 endpoint=f"/v1/projects/{project_id}/recommendations/{recommendation_id}",
+                cache_if=_is_terminal_recommendation,
             ),
         )
 
@@ -628,6 +1064,80 @@ class ProjectAPI:
             response.get("result"),
         )
 
+    @_operation
+    def wait_for_recommendation(
+        self,
+        project_id: str,
+        recommendation_id: str,
+        timeout: float = 600.0,
+        terminal_states: Collection[str] = TERMINAL_RECOMMENDATION_STATES,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> RecommendationDetailsSchema:
+        """Poll a recommendation until it reaches a terminal state.
+
+        A recommendation is in a "PENDING" state right after
+        :meth:`create_recommendation`. This method polls it with
+        :meth:`get_recommendation`, waiting exponentially longer between
+        polls (with random jitter) from `initial_interval` up to
+        `max_interval` seconds. If the API is throttling or unavailable (429
+        or 503) once the client's own retries are exhausted, polling continues
+        after the delay the response's Retry-After header asks for.
+
+        >>> recommendation = client.projects.create_recommendation(project_id)
+        >>> recommendation = client.projects.wait_for_recommendation(
+        ...     project_id=project_id, recommendation_id=recommendation["id"]
+        ... )
+        >>> if recommendation["state"] == "SUCCESS":
+        ...     client.projects.apply_recommendation(project_id, recommendation["id"])
+
+        Args:
+            project_id (str): The ID of the project that the recommendation
+                belongs to.
+            recommendation_id (str): The ID of the recommendation to wait for.
+            timeout (float, optional): The maximum number of seconds to wait.
+                Defaults to 600.
+            terminal_states (Collection[str], optional): The states to stop
+                waiting at. Defaults to ("SUCCESS", "FAILURE").
+            initial_interval (float, optional): The delay in seconds before the
+                second poll. Defaults to 1.
+            max_interval (float, optional): The maximum delay in seconds
+                between polls. Defaults to 30.
+
+        Returns:
+            RecommendationDetailsSchema: The details of the recommendation in
+            its terminal state.
+
+        Raises:
+            TimeoutError: If the recommendation has not reached a terminal
+                state within `timeout` seconds.
+
+        """
+        deadline = time.monotonic() + timeout
+        for delay in _poll_delays(initial_interval, max_interval):
+            try:
+                recommendation = self.get_recommendation(
+                    project_id=project_id, recommendation_id=recommendation_id
+                )
+            except httpx.HTTPStatusError as e:
+                throttled_delay = _throttled_delay(e)
+                if throttled_delay is None:
+                    raise
+                delay = max(delay, throttled_delay)
+            else:
+                if recommendation.get("state") in terminal_states:
+                    return recommendation
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+        raise TimeoutError(
+            f"Recommendation {recommendation_id} of project {project_id} did not reach one of "
+            f"the states {', '.join(terminal_states)} within {timeout} seconds"
+        )
+
+    @_operation
     def apply_recommendation(
         self,
         project_id: str,
@@ -668,3 +1178,360 @@ class ProjectAPI:
             project_id=project_id,
             recommendation_id=recommendation_id,
         )
+
+
+class AsyncProjectAPI:
+    """Asyncio API for managing projects in Slingshot.
+
+    Every method is a coroutine that mirrors the method of the same name in
+    :class:`ProjectAPI`; see there for details of the arguments.
+    """
+
+    def __init__(self, client: AsyncSlingshotClient):
+        """Initialize the AsyncProjectAPI."""
+        self.client = client
+
+    @_operation
+    async def create(
+        self,
+        name: str,
+        workspace_id: str,
+        description: Optional[str] = UNSET,
+        app_id: Optional[str] = UNSET,
+        job_id: Optional[str] = UNSET,
+        cluster_path: Optional[str] = UNSET,
+        settings: Optional[AssignSettingsSchema] = UNSET,
+    ) -> ProjectSchema:
+        """Create a new Slingshot project, see :meth:`ProjectAPI.create`.
+
+        Returns:
+            ProjectSchema: The details of the newly created project.
+
+        """
+        json = _create_payload(
+            name=name,
+            workspace_id=workspace_id,
+            description=description,
+            app_id=app_id,
+            job_id=job_id,
+            cluster_path=cluster_path,
+            settings=settings,
+        )
+        response = cast(
+            dict[str, Any],
+            await self.client._api_request(
+                method="POST", endpoint="/v1/projects", json=json, skip_unset=False
+            ),
+        )
+        return cast(ProjectSchema, response.get("result"))
+
+    @_operation
+    async def update(
+        self,
+        project_id: str,
+        name: Optional[str] = UNSET,
+        workspace_id: Optional[str] = UNSET,
+        description: Optional[str] = UNSET,
+        job_id: Optional[str] = UNSET,
+        cluster_path: Optional[str] = UNSET,
+        settings: Optional[AssignSettingsSchema] = UNSET,
+    ) -> ProjectSchema:
+        """Update the attributes of an existing Slingshot project, see :meth:`ProjectAPI.update`.
+
+        Returns:
+            ProjectSchema: The details of the updated project.
+
+        """
+        json = _update_payload(
+            name=name,
+            workspace_id=workspace_id,
+            description=description,
+            job_id=job_id,
+            cluster_path=cluster_path,
+            settings=settings,
+        )
+        response = cast(
+            dict[str, Any],
+            await self.client._api_request(
+                method="PUT", endpoint=f"/v1/projects/{project_id}", json=json, skip_unset=False
+            ),
+        )
+        return cast(ProjectSchema, response.get("result"))
+
+    @_operation
+    async def delete(self, project_id: str) -> None:
+        """Delete a Slingshot project by its ID, see :meth:`ProjectAPI.delete`."""
+        await self.client._api_request(method="DELETE", endpoint=f"/v1/projects/{project_id}")
+        return None
+
+    @_operation
+    async def reset(self, project_id: str) -> None:
+        """Reset a Slingshot project by its ID, see :meth:`ProjectAPI.reset`."""
+        await self.client._api_request(method="POST", endpoint=f"/v1/projects/{project_id}/reset")
+        return None
+
+    @_operation
+    async def get_projects(
+        self,
+        include: Optional[list[str]] = None,
+        creator_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        page: int = 1,
+        size: int = 50,
+    ) -> Page[ProjectSchema]:
+        """Retrieve a paginated list of projects, see :meth:`ProjectAPI.get_projects`.
+
+        Returns:
+            Page[ProjectSchema]: A list of project details for the requested
+            page.
+
+        """
+        params = _list_params(
+            include=include,
+            creator_id=creator_id,
+            app_id=app_id,
+            job_id=job_id,
+            page=page,
+            size=size,
+        )
+        return cast(
+            Page[ProjectSchema],
+            await self.client._api_request(method="GET", endpoint="/v1/projects", params=params),
+        )
+
+    @_operation
+    async def aiterate_projects(
+        self,
+        include: Optional[list[str]] = None,
+        creator_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        size: int = 50,
+        max_pages: int = MAX_PAGES,
+        concurrency: int = 4,
+        ordered: bool = True,
+    ) -> AsyncGenerator[ProjectSchema, None]:
+        """Fetch all projects with concurrent page requests, see :meth:`ProjectAPI.iterate_projects`.
+
+        The first page is fetched on its own to learn the total number of
+        pages; the remaining pages are then requested concurrently, with at
+        most `concurrency` requests in flight. Outstanding requests are
+        cancelled if the generator is closed early.
+
+        >>> async for project in client.projects.aiterate_projects(include=["name"]):
+        ...     print(project["name"])
+
+        Args:
+            include (Optional[list[str]]): Attributes within :class:`ProjectSchema`
+                to include in the response. Defaults to None.
+            creator_id (Optional[str], optional): The ID of the project creator
+                to filter projects by. Defaults to None.
+            app_id (Optional[str], optional): The application ID to filter
+                projects by. Defaults to None.
+            job_id (Optional[str], optional): The Databricks job ID to filter
+                projects by. Defaults to None.
+            size (int, optional): The number of projects to retrieve per page.
+                Defaults to 50.
+            max_pages (int, optional): The maximum number of pages allowed to
+                traverse. Defaults to 1000.
+            concurrency (int, optional): The maximum number of page requests
+                in flight at once. Defaults to 4.
+            ordered (bool, optional): Whether to yield projects in page order.
+                If False, the projects of each page are yielded as soon as the
+                page arrives. Defaults to True.
+
+        Yields:
+            AsyncIterator[ProjectSchema]: A project object, one at a time.
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        async def fetch(page: int) -> Page[ProjectSchema]:
+            return await self.get_projects(
+                include=include,
+                creator_id=creator_id,
+                app_id=app_id,
+                job_id=job_id,
+                page=page,
+                size=size,
+            )
+
+        try:
+            first_page = await fetch(1)
+        except httpx.HTTPStatusError:
+            return
+        for project in first_page["items"]:
+            yield project
+
+        last_page = min(first_page["pages"], max_pages)
+        remaining_pages = iter(range(first_page["page"] + 1, last_page + 1))
+        pending: deque[asyncio.Task[Page[ProjectSchema]]] = deque(
+            asyncio.ensure_future(fetch(page)) for page in islice(remaining_pages, concurrency)
+        )
+        try:
+            while pending:
+                if ordered:
+                    task = pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = done.pop()
+                    pending.remove(task)
+                try:
+                    response_page = await task
+                except httpx.HTTPStatusError:
+                    break
+                for page in islice(remaining_pages, 1):
+                    pending.append(asyncio.ensure_future(fetch(page)))
+                for project in response_page["items"]:
+                    yield project
+        finally:
+            for task in pending:
+                task.cancel()
+            # Retrieve the outcome of every abandoned request so that none of
+            # them is reported as an unhandled task exception.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    @_operation
+    async def get_project(
+        self, project_id: str, include: Optional[list[str]] = None
+    ) -> ProjectSchema:
+        """Fetch a project by its ID, see :meth:`ProjectAPI.get_project`.
+
+        Returns:
+            ProjectSchema: The project details.
+
+        """
+        response = cast(
+            dict[str, Any],
+            await self.client._cached_get(
+                endpoint=f"/v1/projects/{project_id}",
+                params=_include_params(include),
+            ),
+        )
+        return cast(ProjectSchema, response.get("result"))
+
+    @_operation
+    async def create_recommendation(self, project_id: str) -> RecommendationDetailsSchema:
+        """Create a new recommendation for a project, see :meth:`ProjectAPI.create_recommendation`.
+
+        Returns:
+            RecommendationDetailsSchema: A dictionary with details about the
+            recommendation that was created, in a "PENDING" state.
+
+        """
+        response = cast(
+            dict[str, Any],
+            await self.client._api_request(
+                method="POST",
+                endpoint=f"/v1/projects/{project_id}/recommendations",
+            ),
+        )
+        return cast(RecommendationDetailsSchema, response.get("result"))
+
+    @_operation
+    async def get_recommendation(
+        self,
+        project_id: str,
+        recommendation_id: str,
+    ) -> RecommendationDetailsSchema:
+        """Fetch a specific recommendation for a project, see :meth:`ProjectAPI.get_recommendation`.
+
+        Returns:
+            RecommendationDetailsSchema: A dictionary with details of the
+            recommendation.
+
+        """
+        response = cast(
+            dict[str, Any],
+            await self.client._cached_get(
+                endpoint=f"/v1/projects/{project_id}/recommendations/{recommendation_id}",
+                cache_if=_is_terminal_recommendation,
+            ),
+        )
+        return cast(RecommendationDetailsSchema, response.get("result"))
+
+    @_operation
+    async def wait_for_recommendation(
+        self,
+        project_id: str,
+        recommendation_id: str,
+        timeout: float = 600.0,
+        terminal_states: Collection[str] = TERMINAL_RECOMMENDATION_STATES,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> RecommendationDetailsSchema:
+        """Poll a recommendation until it reaches a terminal state, see :meth:`ProjectAPI.wait_for_recommendation`.
+
+        Waiting does not block the event loop, so many recommendations can be
+        awaited at once:
+
+        >>> recommendations = await asyncio.gather(
+        ...     *(
+        ...         client.projects.wait_for_recommendation(project_id, recommendation_id)
+        ...         for project_id, recommendation_id in pending
+        ...     )
+        ... )
+
+        Returns:
+            RecommendationDetailsSchema: The details of the recommendation in
+            its terminal state.
+
+        Raises:
+            TimeoutError: If the recommendation has not reached a terminal
+                state within `timeout` seconds.
+
+        """
+        deadline = time.monotonic() + timeout
+        for delay in _poll_delays(initial_interval, max_interval):
+            try:
+                recommendation = await self.get_recommendation(
+                    project_id=project_id, recommendation_id=recommendation_id
+                )
+            except httpx.HTTPStatusError as e:
+                throttled_delay = _throttled_delay(e)
+                if throttled_delay is None:
+                    raise
+                delay = max(delay, throttled_delay)
+            else:
+                if recommendation.get("state") in terminal_states:
+                    return recommendation
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+        raise TimeoutError(
+            f"Recommendation {recommendation_id} of project {project_id} did not reach one of "
+            f"the states {', '.join(terminal_states)} within {timeout} seconds"
+        )
+
+    @_operation
+    async def apply_recommendation(
+        self,
+        project_id: str,
+        recommendation_id: str,
+    ) -> RecommendationDetailsSchema:
+        """Apply a recommendation to a project, see :meth:`ProjectAPI.apply_recommendation`.
+
+        Returns:
+            RecommendationDetailsSchema: A dictionary with details of the
+            recommendation that was applied.
+
+        """
+        # Apply the recommendation to the project. This raises an error if
+        # unsuccessful.
+        await self.client._api_request(
+            method="POST",
+            endpoint=f"/v1/projects/{project_id}/recommendations/{recommendation_id}/apply",
+        )
+
+        # Retrieve the recommendation after successful application
+        return await self.get_recommendation(
+            project_id=project_id,
+            recommendation_id=recommendation_id,
+        )
@@ -0,0 +1,277 @@
+"""In-memory caching of Slingshot API responses."""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+from urllib.parse import urlencode
+
+from slingshot.types import CacheStats, QueryParams
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def _cache_key(endpoint: str, params: Optional[QueryParams] = None) -> str:
+    """Return the cache key of a GET request, which does not depend on the order of the params."""
+    if not params:
+        return endpoint
+    return f"{endpoint}?{urlencode(sorted(params.items()), doseq=True)}"
+
+
+def _freeze(value: Any) -> bytes:
+    """Return a snapshot of a decoded JSON response that callers cannot modify."""
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _thaw(snapshot: bytes) -> Any:
+    """Return a new copy of a response from its snapshot.
+
+    Unpickling is several times faster than :func:`copy.deepcopy` and than
+    decoding the JSON again.
+    """
+    # Snapshots are only made by _freeze, so they are safe to unpickle.
+    return pickle.loads(snapshot)
+
+
+def _resource(endpoint: str) -> Optional[str]:
+    """Return the resource a request to `endpoint` writes to, e.g. "/v1/projects/abc".
+
+    Returns None for endpoints of collections, such as "/v1/projects", since
+    writing to them (creating a project) does not change the resources already
+    in them.
+    """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    if len(segments) < 3:
+        return None
+    return "/" + "/".join(segments[:3])
+
+
+def _keys_under(keys: Iterable[str], prefix: str) -> list[str]:
+    """Return the cache keys of `prefix` and of the endpoints below it."""
+    return [key for key in keys if key == prefix or key.startswith((f"{prefix}/", f"{prefix}?"))]
+
+
+class ResponseCache:
+    """A thread-safe cache of API responses with a time to live and LRU eviction.
+
+    Pass a cache to :class:`~slingshot.client.SlingshotClient` or
+    :class:`~slingshot.client.AsyncSlingshotClient` to serve
+    :meth:`~slingshot.api.projects.ProjectAPI.get_project` and
+    :meth:`~slingshot.api.projects.ProjectAPI.get_recommendation` from memory.
+    Responses are keyed by endpoint and query parameters, so the same project
+    fetched with different `include` attributes is cached separately.
+    Recommendations are only cached once they reached a terminal state.
+
+    Any write made through the client to a project (such as ``update``,
+    ``delete``, ``reset`` or ``apply_recommendation``) removes the cached
+    responses of that project and its recommendations. Changes made outside
+    the client are picked up once the cached responses expire.
+
+    >>> from slingshot import ResponseCache, SlingshotClient
+    >>> cache = ResponseCache(max_entries=512, ttl=30)
+    >>> client = SlingshotClient(cache=cache)
+    >>> client.projects.get_project("project-id")  # Sent to the API.
+    >>> client.projects.get_project("project-id")  # Served from the cache.
+    >>> cache.stats()["hits"]
+    1
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0):
+        """Initialize the response cache.
+
+        Args:
+            max_entries (int, optional): The maximum number of responses kept;
+                the least recently used response is evicted to make room for
+                a new one. Defaults to 1024.
+            ttl (float, optional): The number of seconds a response is served
+                from the cache. Defaults to 60.
+
+        Raises:
+            ValueError: If `max_entries` is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # Key -> (expiry time, response snapshot), least recently used first.
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._stats: CacheStats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def __repr__(self):
+        """Return a string representation of the ResponseCache."""
+        return f"ResponseCache(max_entries={self._max_entries}, ttl={self._ttl})"
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired ones not yet removed."""
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a response, returning whether it was found and a copy of it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        # Callers own the returned response and may modify it.
+        return True, _thaw(entry[1])
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a copy of a response, evicting the least recently used one if the cache is full."""
+        snapshot = _freeze(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, prefix: str) -> None:
+        """Remove the responses of `prefix` and of the endpoints below it."""
+        with self._lock:
+            stale = _keys_under(self._entries, prefix)
+            for key in stale:
+                del self._entries[key]
+            self._stats["invalidations"] += len(stale)
+
+    def invalidate_for_write(self, endpoint: str) -> None:
+        """Remove the responses that a write to `endpoint` may have made stale."""
+        resource = _resource(endpoint)
+        if resource is not None:
+            self.invalidate(resource)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit, miss, eviction and invalidation counts."""
+        with self._lock:
+            return self._stats.copy()
+
+
+class _Validated(NamedTuple):
+    """A response body with the validators the API sent along with it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    snapshot: bytes
+
+    def headers(self) -> dict[str, str]:
+        """Return the headers that make a GET request conditional on the body having changed."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """A thread-safe LRU cache of response bodies and their ETag and Last-Modified validators.
+
+    Pass a validator cache to :class:`~slingshot.client.SlingshotClient` or
+    :class:`~slingshot.client.AsyncSlingshotClient` to make GET requests
+    conditional. When the API sent an ETag or a Last-Modified header with a
+    response, the next GET request to the same endpoint with the same query
+    parameters carries If-None-Match or If-Modified-Since. If the resource has
+    not changed, the API answers 304 Not Modified without a body, and the
+    client returns the body it already has instead of downloading and
+    decoding it again.
+
+    Unlike :class:`ResponseCache`, every request still reaches the API, so
+    responses are never stale. The two caches can be used together.
+
+    >>> from slingshot import SlingshotClient, ValidatorCache
+    >>> validators = ValidatorCache()
+    >>> client = SlingshotClient(validator_cache=validators)
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the validator cache.
+
+        Args:
+            max_entries (int, optional): The maximum number of responses kept;
+                the least recently used response is evicted to make room for
+                a new one. Defaults to 1024.
+
+        Raises:
+            ValueError: If `max_entries` is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Validated] = OrderedDict()
+        self._stats: CacheStats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def __repr__(self):
+        """Return a string representation of the ValidatorCache."""
+        return f"ValidatorCache(max_entries={self._max_entries})"
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def lookup(self, key: str) -> Optional[_Validated]:
+        """Return the cached response of a GET request, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def not_modified(self, entry: _Validated) -> Any:
+        """Return a copy of the body of `entry` after the API answered 304 Not Modified."""
+        with self._lock:
+            self._stats["hits"] += 1
+        return _thaw(entry.snapshot)
+
+    def store(self, key: str, response: "httpx.Response", body: Any) -> None:
+        """Cache the decoded body of a successful response if it came with validators."""
+        with self._lock:
+            self._stats["misses"] += 1
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code != 200 or (etag is None and last_modified is None):
+            return
+        entry = _Validated(etag, last_modified, _freeze(body))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate_for_write(self, endpoint: str) -> None:
+        """Remove the responses that a write to `endpoint` changed, whose validators no longer match."""
+        resource = _resource(endpoint)
+        if resource is None:
+            return
+        with self._lock:
+            stale = _keys_under(self._entries, resource)
+            for key in stale:
+                del self._entries[key]
+            self._stats["invalidations"] += len(stale)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit, miss, eviction and invalidation counts.
+
+        Hits are 304 responses answered from the cache, and misses are GET
+        responses whose body was downloaded.
+        """
+        with self._lock:
+            return self._stats.copy()
@@ -0,0 +1,166 @@
+"""Circuit breaking for Slingshot API requests."""
+
+import logging
+import threading
+import time
+from typing import Callable, Literal, Optional
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half-open"]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit for its endpoint is open."""
+
+    def __init__(self, group: str, retry_in: float):
+        """Initialize the error.
+
+        Args:
+            group (str): The endpoint group whose circuit is open.
+            retry_in (float): The number of seconds until the circuit lets a
+                trial request through.
+        """
+        super().__init__(f"Circuit for {group} is open; retry in {retry_in:.1f}s")
+        self.group = group
+        self.retry_in = retry_in
+
+
+def _default_group(endpoint: str) -> str:
+    """Group an endpoint by its API version and top-level resource, e.g. "/v1/projects"."""
+    return "/" + "/".join(endpoint.split("?", 1)[0].strip("/").split("/")[:2])
+
+
+class _Circuit:
+    """The state of the circuit for one endpoint group."""
+
+    def __init__(self) -> None:
+        self.state: CircuitState = "closed"
+        self.failures = 0
+        # When the circuit opened, or when the current trial request started.
+        self.changed_at = 0.0
+
+
+class CircuitBreaker:
+    """Fails requests fast while the API keeps failing.
+
+    Each endpoint group has its own circuit. A circuit starts closed and lets
+    every request through. After `failure_threshold` consecutive failures, a
+    request that times out, cannot connect, or gets a 5xx response, it opens:
+    requests raise :class:`CircuitOpenError` right away, without being sent
+    or retried. After `reset_timeout` seconds the circuit is half-open and
+    lets a single trial request through; the circuit closes if the trial
+    succeeds and opens again if it fails.
+
+    Any other response, including 4xx and 429, shows that the API is up and
+    counts as a success. A breaker can be shared between clients:
+
+    >>> from slingshot import CircuitBreaker, SlingshotClient
+    >>> breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    >>> client = SlingshotClient(circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        group_by: Optional[Callable[[str], str]] = None,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold (int, optional): The number of consecutive
+                failures that opens a circuit. Defaults to 5.
+            reset_timeout (float, optional): The number of seconds an open
+                circuit waits before letting a trial request through.
+                Defaults to 30.
+            group_by (Optional[Callable[[str], str]], optional): A function
+                mapping an endpoint path such as "/v1/projects/abc" to the
+                group whose circuit it uses. Defaults to grouping by API
+                version and top-level resource, e.g. "/v1/projects".
+
+        Raises:
+            ValueError: If `failure_threshold` is less than 1.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._group_by = group_by if group_by is not None else _default_group
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def __repr__(self):
+        """Return a string representation of the CircuitBreaker."""
+        return (
+            f"CircuitBreaker(failure_threshold={self._failure_threshold}, "
+            f"reset_timeout={self._reset_timeout})"
+        )
+
+    def _circuit(self, group: str) -> _Circuit:
+        """Return the circuit of a group, creating it if needed. Requires the lock."""
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit()
+        return circuit
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Return the state of the circuit used by `endpoint`."""
+        with self._lock:
+            return self._circuit(self._group_by(endpoint)).state
+
+    def before_request(self, endpoint: str) -> str:
+        """Check that a request to `endpoint` may be sent, returning its group.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                trial request already in flight.
+        """
+        group = self._group_by(endpoint)
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.state == "closed":
+                return group
+            now = time.monotonic()
+            # A half-open circuit whose trial never reported back (for
+            # example because it was cancelled) admits a new trial as well.
+            retry_in = circuit.changed_at + self._reset_timeout - now
+            if retry_in > 0:
+                raise CircuitOpenError(group, retry_in)
+            circuit.state = "half-open"
+            circuit.changed_at = now
+            return group
+
+    def record(self, group: str, failed: bool) -> None:
+        """Record the outcome of a request admitted by :meth:`before_request`."""
+        with self._lock:
+            circuit = self._circuit(group)
+            if not failed:
+                if circuit.state != "closed":
+                    logger.info("Circuit for %s closed", group)
+                circuit.state = "closed"
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if circuit.state == "half-open" or circuit.failures >= self._failure_threshold:
+                if circuit.state != "open":
+                    logger.warning(
+                        "Circuit for %s opened after %d consecutive failures",
+                        group,
+                        circuit.failures,
+                    )
+                circuit.state = "open"
+                circuit.changed_at = time.monotonic()
+
+    def cancel(self, group: str) -> None:
+        """Release a request admitted by :meth:`before_request` that ended without an outcome.
+
+        A request interrupted or cancelled while it was sent says nothing
+        about the API, so it is not counted. If it was the trial of a
+        half-open circuit, the next request is let through as the trial.
+        """
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.state == "half-open":
+                circuit.state = "open"
+                circuit.changed_at = time.monotonic() - self._reset_timeout
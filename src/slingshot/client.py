@@ -1,27 +1,54 @@
 import logging
 import os
-from functools import cached_property
-from typing import TYPE_CHECKING, Literal, Optional
+import threading
+import time
+from collections.abc import Awaitable, Generator, Sequence
+from functools import cached_property, partial
+from itertools import islice
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar, Union
 
-import backoff
-import httpx
-
-from slingshot.types import JSON_TYPE, UNSET, QueryParams
-
-from .__vers import __version__
+from slingshot.types import (
+    JSON_TYPE,
+    UNSET,
+    CoalescingStats,
+    EndpointMetrics,
+    QueryParams,
+    RetryStats,
+)
 
+# httpx, asyncio and the modules of the optional features are only imported
+# once a client is created or a feature is used, so that importing the
+# client stays fast.
 if TYPE_CHECKING:
-    from .api.projects import ProjectAPI
+    import httpx
+
+    from .api.projects import AsyncProjectAPI, ProjectAPI
+    from .cache import ResponseCache, ValidatorCache
+    from .circuit import CircuitBreaker
+    from .codec import JSONCodec
+    from .hooks import RequestHooks, _AttemptTrace
+    from .metrics import MetricsRegistry
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
 
 
-USER_AGENT = f"Slingshot Library/{__version__} (c1s-slingshot-sdk-py)"
 DEFAULT_API_URL = "https://slingshot.capitalone.com/prod/api/gradient"
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+# How long batch operations pause after a 429 response without Retry-After.
+DEFAULT_BACKPRESSURE_DELAY = 1.0
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def _httpx_giveup_codes(e: Exception) -> bool:
     """Determine whether to give up on retrying based on the HTTP status code."""
+    import httpx
+
     if not isinstance(e, httpx.HTTPStatusError):
         return False
     if e.response is None:
@@ -34,20 +61,195 @@ def _httpx_giveup_codes(e: Exception) -> bool:
 
 
 def _remove_unset_keys(obj):
-    """Recursively removes items or key-value pairs that are UNSET."""
+    """Recursively removes items or key-value pairs that are UNSET.
+
+    Only the dicts and lists that hold an UNSET value, directly or further
+    down, are copied; the others are returned as they are. A payload without
+    UNSET values is therefore walked once and not copied at all.
+    """
     if isinstance(obj, dict):
-        # Create a new dict, skipping keys where the value is UNSET
-        return {k: _remove_unset_keys(v) for k, v in obj.items() if v is not UNSET}
+        copy = None
+        for i, (key, value) in enumerate(obj.items()):
+            cleaned = value if value is UNSET else _remove_unset_keys(value)
+            if copy is None and (cleaned is not value or value is UNSET):
+                # Copy the items seen so far, which were all kept unchanged.
+                copy = dict(islice(obj.items(), i))
+            if copy is not None and value is not UNSET:
+                copy[key] = cleaned
+        return obj if copy is None else copy
     elif isinstance(obj, list):
-        # Create a new list, filtering out any UNSET items
-        return [_remove_unset_keys(i) for i in obj if i is not UNSET]
+        copy = None
+        for i, item in enumerate(obj):
+            cleaned = item if item is UNSET else _remove_unset_keys(item)
+            if copy is None and (cleaned is not item or item is UNSET):
+                copy = obj[:i]
+            if copy is not None and item is not UNSET:
+                copy.append(cleaned)
+        return obj if copy is None else copy
     else:
         return obj
 
 
+def _user_agent() -> str:
+    """Return the User-Agent of the requests, which names the version of the SDK.
+
+    Looking up the version imports importlib.metadata, so it is only done
+    once a client is created.
+    """
+    from .__vers import __version__
+
+    return f"Slingshot Library/{__version__} (c1s-slingshot-sdk-py)"
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """Return the API key, falling back to the SLINGSHOT_API_KEY environment variable."""
+    if not api_key:
+        api_key = os.getenv("SLINGSHOT_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "API key must be provided either as a parameter or in the environment variable SLINGSHOT_API_KEY"
+            )
+    return api_key
+
+
+def _resolve_api_url(api_url: Optional[str]) -> str:
+    """Return the API URL, falling back to SLINGSHOT_API_URL and then the default URL."""
+    return api_url or os.getenv("SLINGSHOT_API_URL") or DEFAULT_API_URL
+
+
+def _json_body(
+    codec: "JSONCodec", json: Optional[JSON_TYPE], headers: Optional[dict[str, str]]
+) -> tuple[Optional[bytes], Optional[dict[str, str]]]:
+    """Return the content and headers of a request with `json` encoded by `codec` as its body."""
+    if json is None:
+        return None, headers
+    return codec.dumps(json), {**(headers or {}), "Content-Type": "application/json"}
+
+
+def _parse_response(
+    response: "httpx.Response", codec: "JSONCodec", trace: Optional["_AttemptTrace"] = None
+) -> Optional[JSON_TYPE]:
+    """Raise for error statuses and decode the JSON body of a Slingshot API response.
+
+    The time spent decoding is recorded in `trace`, if given.
+    """
+    if response.status_code == 304:
+        # Only requests made with validators from a ValidatorCache are conditional.
+        raise RuntimeError("Unhandled API response: 304 Not Modified to an unconditional request")
+    response.raise_for_status()
+    if (
+        response.headers
+        and response.headers.get("content-type", "") == "application/json"
+        and response.content  # Some routes can return content-type json without data, usually with 204 code.
+    ):
+        if trace is None:
+            return codec.loads(response.content)
+        start = time.perf_counter()
+        body = codec.loads(response.content)
+        trace.decode = time.perf_counter() - start
+        return body
+    elif response.status_code == 204:
+        return None
+    else:
+        raise RuntimeError("Unhandled API response: response was not of type 'application/json'")
+
+
+def _retry_after_seconds(response: "httpx.Response") -> Optional[float]:
+    """Return the delay requested by a Retry-After header, in seconds.
+
+    The header may hold either a number of seconds or an HTTP date. Returns
+    None if the header is missing or cannot be parsed.
+    """
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _record_outcome(breaker: "CircuitBreaker", group: str, failed: Optional[bool]) -> None:
+    """Report a request admitted by `breaker`, which ended without an outcome if `failed` is None."""
+    if failed is None:
+        breaker.cancel(group)
+    else:
+        breaker.record(group, failed=failed)
+
+
+def _with_default_limits(options: dict[str, Any]) -> dict[str, Any]:
+    """Return the options of an HTTP client, with the default connection limits if none are set."""
+    if options["limits"] is not None:
+        return options
+    return {**options, "limits": _default_limits()}
+
+
+def _default_limits() -> "httpx.Limits":
+    """Return the connection limits of the HTTP client when none are given."""
+    import httpx
+
+    return httpx.Limits(
+        max_connections=DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+# Module constants that need httpx or the package metadata, built on first use.
+_LAZY_CONSTANTS: dict[str, Callable[[], Any]] = {
+    "USER_AGENT": _user_agent,
+    "DEFAULT_LIMITS": _default_limits,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Build the constants that are slow to import on first use."""
+    factory = _LAZY_CONSTANTS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    # Later lookups find the name directly, without calling __getattr__.
+    globals()[name] = value
+    return value
+
+
+class _Backpressure:
+    """A pause shared by every thread of a client after the API responds with 429.
+
+    Batch operations wait for the pause to end before starting each item, so
+    a 429 seen by one worker slows down the whole batch instead of letting
+    the other workers keep hitting the rate limit.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Pause for `seconds`, extending any pause already in progress."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def wait(self) -> None:
+        """Block until the current pause, if any, has ended."""
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
 class SlingshotClient:
     """SlingshotClient is a client for interacting with the Slingshot API.
 
+    The client keeps a pool of HTTP connections alive between requests, so it
+    should be reused rather than created per call. Call :meth:`close` (or use
+    the client as a context manager) to release the connections when done.
+
     Get an API key from: https://slingshot.capitalone.com/configurations/api-keys
     """
 
@@ -55,6 +257,18 @@ class SlingshotClient:
         self,
         api_key: Optional[str] = None,
         api_url: Optional[str] = None,
+        timeout: Union[float, "httpx.Timeout"] = DEFAULT_TIMEOUT,
+        limits: Optional["httpx.Limits"] = None,
+        transport: Optional["httpx.BaseTransport"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        cache: Optional["ResponseCache"] = None,
+        validator_cache: Optional["ValidatorCache"] = None,
+        coalesce_requests: bool = False,
+        codec: Optional["JSONCodec"] = None,
+        hooks: Optional[Sequence["RequestHooks"]] = None,
+        metrics: Optional["MetricsRegistry"] = None,
     ):
         """Initialize the Slingshot client.
 
@@ -64,6 +278,56 @@ class SlingshotClient:
             api_url (str): The base URL for the Slingshot API. If not provided, it will look
                 for the environment variable SLINGSHOT_API_URL, if not set, it will default
                 to "https://slingshot.capitalone.com/prod/api/gradient".
+            timeout (Union[float, httpx.Timeout]): The timeout in seconds for
+                each request, or an :class:`httpx.Timeout` for separate
+                connect/read/write/pool timeouts. Defaults to 5 seconds.
+            limits (Optional[httpx.Limits]): The connection pool limits.
+                Defaults to None, which allows 100 connections, 20 of which
+                are kept alive between requests.
+            transport (Optional[httpx.BaseTransport]): A custom transport for
+                the underlying :class:`httpx.Client`, for example a transport
+                with retries on connection errors, a proxy, or an
+                :class:`httpx.MockTransport` in tests. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): A rate limiter consulted
+                before every request, which is throttled when the API responds
+                with 429. It can be shared with other clients and threads to
+                keep their combined traffic under the API's rate limit.
+                Defaults to None, which sends requests as fast as they are made.
+            retry_policy (Optional[RetryPolicy]): How requests that fail with
+                a retryable status code are retried. Share a policy between
+                clients to share its retry budget. Defaults to a
+                :class:`~slingshot.retry.RetryPolicy` with default settings.
+            circuit_breaker (Optional[CircuitBreaker]): A circuit breaker that
+                makes requests fail fast with
+                :class:`~slingshot.circuit.CircuitOpenError` while the API
+                keeps failing, instead of waiting for every retry. It can be
+                shared with other clients. Defaults to None.
+            cache (Optional[ResponseCache]): A cache that serves repeated
+                :meth:`~slingshot.api.projects.ProjectAPI.get_project` and
+                :meth:`~slingshot.api.projects.ProjectAPI.get_recommendation`
+                calls from memory. Writes made through the client invalidate
+                the affected responses. Defaults to None, which sends every
+                call to the API.
+            validator_cache (Optional[ValidatorCache]): A cache of response
+                bodies and their ETag and Last-Modified validators, which
+                makes GET requests conditional. When the API answers 304 Not
+                Modified, the cached body is returned. Defaults to None.
+            coalesce_requests (bool): Whether a GET request made while an
+                identical one is in flight, typically by another thread,
+                waits for its response instead of being sent. Defaults to
+                False.
+            codec (Optional[JSONCodec]): How request bodies are encoded and
+                response bodies decoded. Defaults to an
+                :class:`~slingshot.codec.OrjsonCodec` if orjson is installed,
+                and to a :class:`~slingshot.codec.JSONCodec` otherwise.
+            hooks (Optional[Sequence[RequestHooks]]): Callbacks invoked
+                around every attempt of a request, with its endpoint, status
+                code, attempt number and a breakdown of where its time went,
+                for example to feed a metrics system. Defaults to None.
+            metrics (Optional[MetricsRegistry]): A registry that counts the
+                requests made by the client, with latency histograms, per
+                endpoint and status class. It can be shared with other
+                clients. See :meth:`metrics`. Defaults to None.
 
         Raises:
             ValueError: If the API key is not provided and not found in the environment.
@@ -73,59 +337,361 @@ class SlingshotClient:
             >>> # Or:
             >>> # from slingshot import SlingshotClient
             >>> client = SlingshotClient(api_key="your_api_key")
+            >>> # Release the pooled connections when done:
+            >>> client.close()
+            >>> # Or let a context manager do it:
+            >>> with SlingshotClient(api_key="your_api_key") as client:
+            ...     client.projects.get_projects()
 
         """
-        if not api_key:
-            api_key = os.getenv("SLINGSHOT_API_KEY")
-            if not api_key:
-                raise ValueError(
-                    "API key must be provided either as a parameter or in the environment variable SLINGSHOT_API_KEY"
-                )
-        self._api_key = api_key
+        from .codec import default_codec
+        from .hooks import _Hooks
+        from .retry import RetryPolicy, _Retrier
 
-        self._api_url = api_url or os.getenv("SLINGSHOT_API_URL") or DEFAULT_API_URL
+        self._api_key = _resolve_api_key(api_key)
+        self._api_url = _resolve_api_url(api_url)
+
+        # Creating the HTTP client loads the TLS certificates, which takes
+        # a while, so it is deferred until the first request.
+        self._http_options: dict[str, Any] = {
+            "headers": {
+                "Auth": self._api_key,
+                "User-Agent": _user_agent(),
+            },
+            "timeout": timeout,
+            "limits": limits,
+            "transport": transport,
+        }
+        self._http_client: Optional[httpx.Client] = None
+        self._closed = False
+        self._http_lock = threading.Lock()
+        self._backpressure = _Backpressure()
+        self._rate_limiter = rate_limiter
+        self._retrier = _Retrier(
+            retry_policy if retry_policy is not None else RetryPolicy(),
+            giveup=_httpx_giveup_codes,
+            retry_after=_retry_after_seconds,
+        )
+        self._circuit_breaker = circuit_breaker
+        self._cache = cache
+        self._validator_cache = validator_cache
+        self._singleflight = None
+        if coalesce_requests:
+            from .singleflight import SingleFlight
+
+            self._singleflight = SingleFlight()
+        self._codec = codec if codec is not None else default_codec()
+        self._metrics = metrics
+        self._hooks = _Hooks([*(hooks or ()), *([metrics] if metrics is not None else [])])
 
     def __repr__(self):
         """Return a string representation of the SlingshotClient."""
         return f'SlingshotClient(api_url="{self._api_url}", api_key="***")'
 
-    @backoff.on_exception(
-        backoff.expo,
-        httpx.HTTPStatusError,
-        logger=logger,
-        max_tries=5,
-        giveup=_httpx_giveup_codes,
-    )
+    def __enter__(self) -> "SlingshotClient":
+        """Enter the runtime context, returning the client itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the runtime context, closing the pooled connections."""
+        self.close()
+
+    @property
+    def _http(self) -> "httpx.Client":
+        """The HTTP client that pools the connections, created on first use."""
+        if self._http_client is None:
+            import httpx
+
+            with self._http_lock:
+                if self._http_client is None:
+                    http = httpx.Client(**_with_default_limits(self._http_options))
+                    if self._closed:
+                        # Closed before its first request, so httpx refuses to send any.
+                        http.close()
+                    self._http_client = http
+        return self._http_client
+
+    def close(self) -> None:
+        """Close the client and release its pooled connections.
+
+        The client cannot be used to make requests after it has been closed.
+        """
+        with self._http_lock:
+            self._closed = True
+            http = self._http_client
+        if http is not None:
+            http.close()
+
+    def retry_stats(self) -> RetryStats:
+        """Return a snapshot of the retries made by this client.
+
+        Returns:
+            RetryStats: Counts of requests, retries and the retries that were
+            skipped, and the total time spent waiting before retries.
+        """
+        return self._retrier.stats()
+
+    def coalescing_stats(self) -> CoalescingStats:
+        """Return a snapshot of the GET requests coalesced by this client.
+
+        Returns:
+            CoalescingStats: The number of GET requests sent and of the
+            identical ones that waited for them. Both are zero unless the
+            client was created with `coalesce_requests=True`.
+        """
+        if self._singleflight is None:
+            return {"calls": 0, "coalesced": 0}
+        return self._singleflight.stats()
+
+    def metrics(self) -> list[EndpointMetrics]:
+        """Return a snapshot of the metrics of the requests made by this client.
+
+        Returns:
+            list[EndpointMetrics]: The counters and latency histogram of every
+            method, endpoint template and status class. Empty unless the
+            client was created with a `metrics` registry; a registry shared
+            with other clients includes their requests as well.
+        """
+        if self._metrics is None:
+            return []
+        return self._metrics.snapshot()
+
     def _api_request(
         self,
         method: Literal["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
         endpoint: str,
         json: Optional[JSON_TYPE] = None,
         params: Optional[QueryParams] = None,
+        skip_unset: bool = True,
     ) -> Optional[JSON_TYPE]:
-        """Make an API request to the Slingshot API."""
-        headers = {
-            "Auth": self._api_key,
-            "User-Agent": USER_AGENT,
-        }
-        url = f"{self._api_url}{endpoint}"
-        # Removes all the UNSET values from the json
-
-        json = _remove_unset_keys(json)
-        response = httpx.request(method=method, url=url, headers=headers, json=json, params=params)
-        response.raise_for_status()
-        if (
-            response.headers
-            and response.headers.get("content-type", "") == "application/json"
-            and response.text  # Some routes can return content-type json without data, usually with 204 code.
-        ):
-            return response.json()
-        elif response.status_code == 204:
-            return None
-        else:
-            raise RuntimeError(
-                "Unhandled API response: response was not of type 'application/json'"
+        """Make an API request to the Slingshot API.
+
+        Pass `skip_unset=False` for a `json` payload built without UNSET
+        values, to send it without walking it first.
+        """
+        if skip_unset:
+            # Removes all the UNSET values from the json
+            json = _remove_unset_keys(json)
+        send = partial(self._send, method, endpoint, json, params)
+        if method == "GET" and self._singleflight is not None:
+            from .cache import _cache_key
+
+            return self._singleflight.do(
+                _cache_key(endpoint, params),
+                lambda: self._retrying_request(method, endpoint, send),
             )
+        return self._retrying_request(method, endpoint, send)
+
+    def _retrying_request(
+        self, method: str, endpoint: str, send: Callable[[Optional["_AttemptTrace"]], T]
+    ) -> T:
+        """Make an API request with `send`, retrying it according to the retry policy.
+
+        Every attempt is reported to the hooks, with the trace of its timings
+        passed to `send`.
+        """
+        import httpx
+
+        self._retrier.record_request()
+        attempt = 1
+        delay = None
+        while True:
+            trace = self._hooks.start(method, endpoint, attempt)
+            try:
+                result = send(trace)
+            except httpx.HTTPStatusError as e:
+                delay = self._retrier.next_delay(e, attempt, delay)
+                if delay is None:
+                    self._hooks.error(trace, e)
+                    raise
+                if e.response.status_code == 429:
+                    self._pause_batches(e.response)
+                self._hooks.retry(trace, e, delay)
+            except Exception as e:
+                self._hooks.error(trace, e)
+                raise
+            else:
+                self._hooks.response(trace)
+                return result
+            finally:
+                # Even a failed write may have changed the resource.
+                if method != "GET":
+                    self._invalidate_for_write(endpoint)
+            time.sleep(delay)
+            attempt += 1
+
+    def _pause_batches(self, response: "httpx.Response") -> None:
+        """Pause the items of batch operations after a 429 response that is retried.
+
+        The pause lasts as long as the Retry-After header asks for, capped at
+        the `max_retry_after` of the retry policy.
+        """
+        retry_after = _retry_after_seconds(response)
+        self._backpressure.pause(
+            min(
+                DEFAULT_BACKPRESSURE_DELAY if retry_after is None else retry_after,
+                self._retrier.policy.max_retry_after,
+            )
+        )
+
+    def _invalidate_for_write(self, endpoint: str) -> None:
+        """Drop the cached responses that a write to `endpoint` may have changed."""
+        if self._cache is not None:
+            self._cache.invalidate_for_write(endpoint)
+        if self._validator_cache is not None:
+            self._validator_cache.invalidate_for_write(endpoint)
+
+    def _cached_get(
+        self,
+        endpoint: str,
+        params: Optional[QueryParams] = None,
+        cache_if: Optional[Callable[[JSON_TYPE], bool]] = None,
+    ) -> Optional[JSON_TYPE]:
+        """Make a GET request, served from the response cache if the client has one.
+
+        Responses are only cached if `cache_if` is None or returns True for them.
+        """
+        if self._cache is None:
+            return self._api_request(method="GET", endpoint=endpoint, params=params)
+        from .cache import _cache_key
+
+        key = _cache_key(endpoint, params)
+        found, response = self._cache.get(key)
+        if found:
+            return response
+        response = self._api_request(method="GET", endpoint=endpoint, params=params)
+        if cache_if is None or cache_if(response):
+            self._cache.put(key, response)
+        return response
+
+    def _stream_array(
+        self,
+        endpoint: str,
+        params: Optional[QueryParams],
+        field: str,
+        rest: dict[str, JSON_TYPE],
+    ) -> Generator[JSON_TYPE, None, None]:
+        """Make a GET request and yield the elements of an array field of its JSON object body.
+
+        The elements are decoded as the body is received, without holding the
+        whole body in memory. The other fields of the object are stored in
+        `rest` once the body has been read.
+        """
+        response = self._retrying_request(
+            "GET", endpoint, partial(self._open_stream, endpoint, params)
+        )
+        from ._jsonstream import ArrayFieldParser
+
+        try:
+            parser = ArrayFieldParser(field)
+            for text in response.iter_text():
+                yield from parser.feed(text)
+            yield from parser.feed("", final=True)
+            rest.update(parser.rest)
+        finally:
+            response.close()
+
+    def _open_stream(
+        self, endpoint: str, params: Optional[QueryParams], trace: Optional["_AttemptTrace"]
+    ) -> "httpx.Response":
+        """Send a single attempt of a GET request, returning the response before reading its body.
+
+        The attempt, and its trace, ends once the response headers are received.
+        """
+        response = self._send_request("GET", endpoint, None, params, stream=True, trace=trace)
+        if response.is_success and response.headers.get("content-type", "") == "application/json":
+            return response
+        try:
+            response.read()
+        finally:
+            response.close()
+        _parse_response(response, self._codec)
+        raise RuntimeError("Unhandled API response: expected a JSON object")
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[JSON_TYPE],
+        params: Optional[QueryParams],
+        trace: Optional["_AttemptTrace"] = None,
+    ) -> Optional[JSON_TYPE]:
+        """Send a single attempt of an API request and decode its response."""
+        validators = self._validator_cache if method == "GET" else None
+        key = ""
+        validated = None
+        if validators is not None:
+            from .cache import _cache_key
+
+            key = _cache_key(endpoint, params)
+            validated = validators.lookup(key)
+        response = self._send_request(
+            method,
+            endpoint,
+            json,
+            params,
+            headers=validated.headers() if validated else None,
+            trace=trace,
+        )
+        if validators is not None:
+            if response.status_code == 304 and validated is not None:
+                return validators.not_modified(validated)
+            body = _parse_response(response, self._codec, trace)
+            validators.store(key, response, body)
+            return body
+        return _parse_response(response, self._codec, trace)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[JSON_TYPE],
+        params: Optional[QueryParams],
+        headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
+        trace: Optional["_AttemptTrace"] = None,
+    ) -> "httpx.Response":
+        """Send a single attempt of an API request through the circuit breaker and rate limiter.
+
+        The timings of the request are recorded in `trace`, if given.
+        """
+        import httpx
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        content, headers = _json_body(self._codec, json, headers)
+        request = self._http.build_request(
+            method=method,
+            url=f"{self._api_url}{endpoint}",
+            content=content,
+            params=params,
+            headers=headers,
+            extensions={"trace": trace.trace} if trace is not None else None,
+        )
+        breaker = self._circuit_breaker
+        group = breaker.before_request(endpoint) if breaker is not None else None
+        if trace is not None:
+            trace.sending(content)
+        failed: Optional[bool] = None
+        try:
+            response = self._http.send(request, stream=stream)
+            failed = response.status_code >= 500
+        except httpx.TransportError:
+            failed = True
+            raise
+        finally:
+            if breaker is not None and group is not None:
+                _record_outcome(breaker, group, failed)
+        if trace is not None:
+            trace.received(response)
+        if response.status_code == 429 and self._rate_limiter is not None:
+            self._rate_limiter.throttle()
+        return response
 
     @cached_property
     def projects(self) -> "ProjectAPI":
@@ -133,3 +699,358 @@ class SlingshotClient:
         from .api.projects import ProjectAPI
 
         return ProjectAPI(self)
+
+
+class AsyncSlingshotClient:
+    """AsyncSlingshotClient is an asyncio client for interacting with the Slingshot API.
+
+    It exposes the same API as :class:`SlingshotClient`, with coroutine
+    methods that do not block the event loop, so a single process can drive
+    many concurrent Slingshot calls. Use it as an async context manager, or
+    call :meth:`aclose` when done.
+
+    Get an API key from: https://slingshot.capitalone.com/configurations/api-keys
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        timeout: Union[float, "httpx.Timeout"] = DEFAULT_TIMEOUT,
+        limits: Optional["httpx.Limits"] = None,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        cache: Optional["ResponseCache"] = None,
+        validator_cache: Optional["ValidatorCache"] = None,
+        coalesce_requests: bool = False,
+        codec: Optional["JSONCodec"] = None,
+        hooks: Optional[Sequence["RequestHooks"]] = None,
+        metrics: Optional["MetricsRegistry"] = None,
+    ):
+        """Initialize the async Slingshot client.
+
+        Args:
+            api_key (str): The API key for authentication. If not provided, it will look
+                for the environment variable SLINGSHOT_API_KEY.
+            api_url (str): The base URL for the Slingshot API. If not provided, it will look
+                for the environment variable SLINGSHOT_API_URL, if not set, it will default
+                to "https://slingshot.capitalone.com/prod/api/gradient".
+            timeout (Union[float, httpx.Timeout]): The timeout in seconds for
+                each request, or an :class:`httpx.Timeout`. Defaults to 5 seconds.
+            limits (Optional[httpx.Limits]): The connection pool limits.
+                Defaults to None, which allows 100 connections, 20 of which
+                are kept alive between requests.
+            transport (Optional[httpx.AsyncBaseTransport]): A custom transport
+                for the underlying :class:`httpx.AsyncClient`. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): A rate limiter awaited before
+                every request and throttled when the API responds with 429. It
+                can be shared with other clients and tasks. Defaults to None.
+            retry_policy (Optional[RetryPolicy]): How requests that fail with
+                a retryable status code are retried. Defaults to a
+                :class:`~slingshot.retry.RetryPolicy` with default settings.
+            circuit_breaker (Optional[CircuitBreaker]): A circuit breaker that
+                makes requests fail fast while the API keeps failing. It can
+                be shared with other clients. Defaults to None.
+            cache (Optional[ResponseCache]): A cache that serves repeated
+                ``get_project`` and ``get_recommendation`` calls from memory.
+                Defaults to None.
+            validator_cache (Optional[ValidatorCache]): A cache of response
+                bodies and their validators, which makes GET requests
+                conditional. Defaults to None.
+            coalesce_requests (bool): Whether a GET request made while an
+                identical one is in flight, typically by another task, waits
+                for its response instead of being sent. Defaults to False.
+            codec (Optional[JSONCodec]): How request bodies are encoded and
+                response bodies decoded. Defaults to an
+                :class:`~slingshot.codec.OrjsonCodec` if orjson is installed,
+                and to a :class:`~slingshot.codec.JSONCodec` otherwise.
+            hooks (Optional[Sequence[RequestHooks]]): Callbacks invoked
+                around every attempt of a request. See
+                :class:`~slingshot.hooks.RequestHooks`. Defaults to None.
+            metrics (Optional[MetricsRegistry]): A registry that counts the
+                requests made by the client, with latency histograms, per
+                endpoint and status class. It can be shared with other
+                clients. See :meth:`metrics`. Defaults to None.
+
+        Raises:
+            ValueError: If the API key is not provided and not found in the environment.
+
+        Example:
+            >>> from slingshot import AsyncSlingshotClient
+            >>> async with AsyncSlingshotClient(api_key="your_api_key") as client:
+            ...     project = await client.projects.get_project("your_project_id")
+
+        """
+        from .codec import default_codec
+        from .hooks import _Hooks
+        from .retry import RetryPolicy, _Retrier
+
+        self._api_key = _resolve_api_key(api_key)
+        self._api_url = _resolve_api_url(api_url)
+
+        # Creating the HTTP client loads the TLS certificates, which takes
+        # a while, so it is deferred until the first request.
+        self._http_options: dict[str, Any] = {
+            "headers": {
+                "Auth": self._api_key,
+                "User-Agent": _user_agent(),
+            },
+            "timeout": timeout,
+            "limits": limits,
+            "transport": transport,
+        }
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._closed = False
+        self._rate_limiter = rate_limiter
+        self._retrier = _Retrier(
+            retry_policy if retry_policy is not None else RetryPolicy(),
+            giveup=_httpx_giveup_codes,
+            retry_after=_retry_after_seconds,
+        )
+        self._circuit_breaker = circuit_breaker
+        self._cache = cache
+        self._validator_cache = validator_cache
+        self._singleflight = None
+        if coalesce_requests:
+            from .singleflight import AsyncSingleFlight
+
+            self._singleflight = AsyncSingleFlight()
+        self._codec = codec if codec is not None else default_codec()
+        self._metrics = metrics
+        self._hooks = _Hooks([*(hooks or ()), *([metrics] if metrics is not None else [])])
+
+    def __repr__(self):
+        """Return a string representation of the AsyncSlingshotClient."""
+        return f'AsyncSlingshotClient(api_url="{self._api_url}", api_key="***")'
+
+    async def __aenter__(self) -> "AsyncSlingshotClient":
+        """Enter the async runtime context, returning the client itself."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the async runtime context, closing the pooled connections."""
+        await self.aclose()
+
+    @property
+    def _http(self) -> "httpx.AsyncClient":
+        """The HTTP client that pools the connections, created on first use.
+
+        Raises:
+            RuntimeError: If the client was closed before its first request.
+        """
+        if self._http_client is None:
+            if self._closed:
+                raise RuntimeError("Cannot send a request, as the client has been closed.")
+            import httpx
+
+            self._http_client = httpx.AsyncClient(**_with_default_limits(self._http_options))
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the client and release its pooled connections.
+
+        The client cannot be used to make requests after it has been closed.
+        """
+        self._closed = True
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    def retry_stats(self) -> RetryStats:
+        """Return a snapshot of the retries made by this client.
+
+        Returns:
+            RetryStats: Counts of requests, retries and the retries that were
+            skipped, and the total time spent waiting before retries.
+        """
+        return self._retrier.stats()
+
+    def coalescing_stats(self) -> CoalescingStats:
+        """Return a snapshot of the GET requests coalesced by this client.
+
+        Returns:
+            CoalescingStats: The number of GET requests sent and of the
+            identical ones that waited for them. Both are zero unless the
+            client was created with `coalesce_requests=True`.
+        """
+        if self._singleflight is None:
+            return {"calls": 0, "coalesced": 0}
+        return self._singleflight.stats()
+
+    def metrics(self) -> list[EndpointMetrics]:
+        """Return a snapshot of the metrics of the requests made by this client.
+
+        Returns:
+            list[EndpointMetrics]: The counters and latency histogram of every
+            method, endpoint template and status class. Empty unless the
+            client was created with a `metrics` registry; a registry shared
+            with other clients includes their requests as well.
+        """
+        if self._metrics is None:
+            return []
+        return self._metrics.snapshot()
+
+    async def _api_request(
+        self,
+        method: Literal["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
+        endpoint: str,
+        json: Optional[JSON_TYPE] = None,
+        params: Optional[QueryParams] = None,
+        skip_unset: bool = True,
+    ) -> Optional[JSON_TYPE]:
+        """Make an API request to the Slingshot API without blocking the event loop.
+
+        See :meth:`SlingshotClient._api_request`.
+        """
+        if skip_unset:
+            json = _remove_unset_keys(json)
+        send = partial(self._send, method, endpoint, json, params)
+        if method == "GET" and self._singleflight is not None:
+            from .cache import _cache_key
+
+            return await self._singleflight.do(
+                _cache_key(endpoint, params),
+                lambda: self._retrying_request(method, endpoint, send),
+            )
+        return await self._retrying_request(method, endpoint, send)
+
+    async def _retrying_request(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[Optional["_AttemptTrace"]], Awaitable[T]],
+    ) -> T:
+        """Make an API request with `send`, retrying it according to the retry policy.
+
+        Every attempt is reported to the hooks, with the trace of its timings
+        passed to `send`.
+        """
+        import asyncio
+
+        import httpx
+
+        self._retrier.record_request()
+        attempt = 1
+        delay = None
+        while True:
+            trace = self._hooks.start(method, endpoint, attempt)
+            try:
+                result = await send(trace)
+            except httpx.HTTPStatusError as e:
+                delay = self._retrier.next_delay(e, attempt, delay)
+                if delay is None:
+                    self._hooks.error(trace, e)
+                    raise
+                self._hooks.retry(trace, e, delay)
+            except Exception as e:
+                self._hooks.error(trace, e)
+                raise
+            else:
+                self._hooks.response(trace)
+                return result
+            finally:
+                # Even a failed write may have changed the resource.
+                if method != "GET":
+                    self._invalidate_for_write(endpoint)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _invalidate_for_write(self, endpoint: str) -> None:
+        """Drop the cached responses that a write to `endpoint` may have changed."""
+        if self._cache is not None:
+            self._cache.invalidate_for_write(endpoint)
+        if self._validator_cache is not None:
+            self._validator_cache.invalidate_for_write(endpoint)
+
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: Optional[QueryParams] = None,
+        cache_if: Optional[Callable[[JSON_TYPE], bool]] = None,
+    ) -> Optional[JSON_TYPE]:
+        """Make a GET request, served from the response cache if the client has one.
+
+        Responses are only cached if `cache_if` is None or returns True for them.
+        """
+        if self._cache is None:
+            return await self._api_request(method="GET", endpoint=endpoint, params=params)
+        from .cache import _cache_key
+
+        key = _cache_key(endpoint, params)
+        found, response = self._cache.get(key)
+        if found:
+            return response
+        response = await self._api_request(method="GET", endpoint=endpoint, params=params)
+        if cache_if is None or cache_if(response):
+            self._cache.put(key, response)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[JSON_TYPE],
+        params: Optional[QueryParams],
+        trace: Optional["_AttemptTrace"] = None,
+    ) -> Optional[JSON_TYPE]:
+        """Send a single attempt of an API request, recording its timings in `trace` if given."""
+        import httpx
+
+        validators = self._validator_cache if method == "GET" else None
+        key = ""
+        validated = None
+        if validators is not None:
+            from .cache import _cache_key
+
+            key = _cache_key(endpoint, params)
+            validated = validators.lookup(key)
+        content, headers = _json_body(
+            self._codec, json, validated.headers() if validated is not None else None
+        )
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+        breaker = self._circuit_breaker
+        group = breaker.before_request(endpoint) if breaker is not None else None
+        if trace is not None:
+            trace.sending(content)
+        failed: Optional[bool] = None
+        try:
+            response = await self._http.request(
+                method=method,
+                url=f"{self._api_url}{endpoint}",
+                content=content,
+                params=params,
+                headers=headers,
+                extensions={"trace": trace.atrace} if trace is not None else None,
+            )
+            failed = response.status_code >= 500
+        except httpx.TransportError:
+            failed = True
+            raise
+        finally:
+            if breaker is not None and group is not None:
+                _record_outcome(breaker, group, failed)
+        if trace is not None:
+            trace.received(response)
+        if response.status_code == 429 and self._rate_limiter is not None:
+            self._rate_limiter.throttle()
+        if validators is not None:
+            if response.status_code == 304 and validated is not None:
+                return validators.not_modified(validated)
+            body = _parse_response(response, self._codec, trace)
+            validators.store(key, response, body)
+            return body
+        return _parse_response(response, self._codec, trace)
+
+    @cached_property
+    def projects(self) -> "AsyncProjectAPI":
+        """Get the async projects API client."""
+        from .api.projects import AsyncProjectAPI
+
+        return AsyncProjectAPI(self)
@@ -0,0 +1,70 @@
+"""JSON encoding of request bodies and decoding of response bodies."""
+
+import importlib
+import json
+from typing import Any
+
+
+class JSONCodec:
+    """Encodes and decodes JSON with the standard library's :mod:`json` module.
+
+    Request bodies are encoded the way :mod:`httpx` encodes them: compact,
+    UTF-8, and without NaN or infinity. To use another JSON library, subclass
+    the codec, override :meth:`dumps` and :meth:`loads`, and pass an instance
+    to :class:`~slingshot.client.SlingshotClient` or
+    :class:`~slingshot.client.AsyncSlingshotClient`.
+    """
+
+    name = "json"
+
+    def __repr__(self):
+        """Return a string representation of the codec."""
+        return f"{type(self).__name__}()"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a request body to UTF-8 JSON."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a response body."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON with `orjson <https://github.com/ijl/orjson>`_.
+
+    orjson is several times faster than the standard library, both to decode
+    pages of projects and to encode request bodies. It is installed with the
+    ``fast`` extra: ``pip install "c1s-slingshot-sdk-py[fast]"``.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        try:
+            self._orjson = importlib.import_module("orjson")
+        except ImportError as e:
+            raise ImportError(
+                'OrjsonCodec requires orjson: pip install "c1s-slingshot-sdk-py[fast]"'
+            ) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a request body to UTF-8 JSON."""
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a response body."""
+        return self._orjson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """Return an :class:`OrjsonCodec` if orjson is installed, and a :class:`JSONCodec` otherwise."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
@@ -0,0 +1,191 @@
+"""Columnar export of projects to Apache Arrow and Parquet."""
+
+import importlib
+import os
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, Union
+
+from slingshot.types import ProjectSchema
+
+# Column name -> (path of the value in a project, Arrow type name), in the order of the columns.
+COLUMNS = {
+    "id": (("id",), "string"),
+    "name": (("name",), "string"),
+    "description": (("description",), "string"),
+    "app_id": (("app_id",), "string"),
+    "job_id": (("job_id",), "string"),
+    "workspace_id": (("workspace_id",), "string"),
+    "cluster_path": (("cluster_path",), "string"),
+    "creator_id": (("creator_id",), "string"),
+    "phase": (("phase",), "string"),
+    "product_name": (("product_name",), "string"),
+    "created_at": (("created_at",), "timestamp"),
+    "updated_at": (("updated_at",), "timestamp"),
+    "settings_sla_minutes": (("settings", "sla_minutes"), "int64"),
+    "settings_auto_apply_recs": (("settings", "auto_apply_recs"), "bool"),
+    "settings_optimize_instance_size": (("settings", "optimize_instance_size"), "bool"),
+    "metrics_job_success_rate_percent": (("metrics", "job_success_rate_percent"), "float64"),
+    "metrics_sla_met_percent": (("metrics", "sla_met_percent"), "float64"),
+    "metrics_estimated_savings": (("metrics", "estimated_savings"), "float64"),
+}
+
+
+def _pyarrow() -> Any:
+    """Import pyarrow, explaining how to install it if it is missing."""
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError as e:
+        raise ImportError(
+            'Exporting projects requires pyarrow: pip install "c1s-slingshot-sdk-py[arrow]"'
+        ) from e
+
+
+def _value(project: ProjectSchema, path: tuple[str, ...]) -> Any:
+    """Return the value at `path` in a project, or None if it or a parent is missing."""
+    value: Any = project
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def project_schema() -> Any:
+    """Return the Arrow schema of exported projects.
+
+    The nested `settings` and `metrics` of a project are flattened into
+    columns prefixed with their name, such as ``metrics_estimated_savings``.
+    `created_at` and `updated_at` are UTC timestamps, and the metrics are
+    floats, so that averages and sums need no conversion.
+
+    Returns:
+        pyarrow.Schema: The schema of the record batches and tables.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _pyarrow()
+    types = {
+        "string": pa.string(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "int64": pa.int64(),
+        "bool": pa.bool_(),
+        "float64": pa.float64(),
+    }
+    return pa.schema([(name, types[type_name]) for name, (_, type_name) in COLUMNS.items()])
+
+
+def record_batches(projects: Iterable[ProjectSchema], batch_size: int = 1000) -> Iterator[Any]:
+    """Convert projects to Arrow record batches as they are iterated.
+
+    `projects` is typically
+    :meth:`~slingshot.api.projects.ProjectAPI.iterate_projects`, which fetches
+    the pages as the batches are consumed, so at most `batch_size` projects
+    are held as dicts at a time, however many there are. See
+    :func:`project_schema` for the columns.
+
+    >>> from slingshot.export import record_batches
+    >>> for batch in record_batches(client.projects.iterate_projects(prefetch=2)):
+    ...     print(batch.num_rows)
+
+    Args:
+        projects (Iterable[ProjectSchema]): The projects to convert.
+        batch_size (int, optional): The maximum number of rows of a batch.
+            Defaults to 1000.
+
+    Yields:
+        pyarrow.RecordBatch: The projects, `batch_size` at a time.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If `batch_size` is less than 1.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    pa = _pyarrow()
+    schema = project_schema()
+    projects = iter(projects)
+    while True:
+        batch = list(islice(projects, batch_size))
+        if not batch:
+            return
+        arrays = []
+        for name, (path, _) in COLUMNS.items():
+            field = schema.field(name)
+            values = [_value(project, path) for project in batch]
+            if pa.types.is_timestamp(field.type):
+                # Arrow parses ISO 8601 strings, with their time zone, faster than Python.
+                arrays.append(pa.array(values, type=pa.string()).cast(field.type))
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_table(projects: Iterable[ProjectSchema], batch_size: int = 1000) -> Any:
+    """Convert projects to an Arrow table.
+
+    The projects are converted `batch_size` at a time, as with
+    :func:`record_batches`, so only the columnar table is held in memory.
+    Call ``to_pandas()`` on the table for a DataFrame.
+
+    >>> from slingshot.export import to_table
+    >>> table = to_table(client.projects.iterate_projects())
+    >>> table.column("metrics_estimated_savings")
+
+    Args:
+        projects (Iterable[ProjectSchema]): The projects to convert.
+        batch_size (int, optional): The number of projects converted at a
+            time. Defaults to 1000.
+
+    Returns:
+        pyarrow.Table: The projects, one per row.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _pyarrow()
+    return pa.Table.from_batches(list(record_batches(projects, batch_size)), project_schema())
+
+
+def write_parquet(
+    projects: Iterable[ProjectSchema],
+    path: Union[str, os.PathLike],
+    batch_size: int = 1000,
+    compression: str = "zstd",
+) -> int:
+    """Write projects to a Parquet file, one record batch at a time.
+
+    Only one batch of projects is held in memory, so projects can be
+    exported straight from
+    :meth:`~slingshot.api.projects.ProjectAPI.iterate_projects` whatever
+    their number.
+
+    >>> from slingshot.export import write_parquet
+    >>> write_parquet(client.projects.iterate_projects(prefetch=2), "projects.parquet")
+    1234
+
+    Args:
+        projects (Iterable[ProjectSchema]): The projects to write.
+        path (Union[str, os.PathLike]): The path of the Parquet file, which
+            is overwritten if it exists.
+        batch_size (int, optional): The number of projects converted at a
+            time, which is also the size of the row groups of the file.
+            Defaults to 1000.
+        compression (str, optional): The compression codec of the file.
+            Defaults to "zstd".
+
+    Returns:
+        int: The number of projects written.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    _pyarrow()
+    parquet = importlib.import_module("pyarrow.parquet")
+    rows = 0
+    with parquet.ParquetWriter(
+        os.fspath(path), project_schema(), compression=compression
+    ) as writer:
+        for batch in record_batches(projects, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
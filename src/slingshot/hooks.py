@@ -0,0 +1,345 @@
+"""Callbacks for instrumenting the requests made by a client."""
+
+import inspect
+import itertools
+import logging
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from slingshot.types import (
+    ErrorEvent,
+    OperationEndEvent,
+    OperationEvent,
+    RequestEvent,
+    RequestTimings,
+    ResponseEvent,
+    RetryEvent,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+
+def _endpoint_template(endpoint: str) -> str:
+    """Return `endpoint` with its IDs replaced by placeholders named after their collection.
+
+    >>> _endpoint_template("/v1/projects/abc/recommendations/def/apply")
+    '/v1/projects/{project_id}/recommendations/{recommendation_id}/apply'
+    """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    # Paths alternate collections and IDs after the version: /v1/<collection>/<id>/...
+    for i in range(2, len(segments), 2):
+        collection = segments[i - 1]
+        segments[i] = f"{{{collection[:-1] if collection.endswith('s') else collection}_id}}"
+    return "/" + "/".join(segments)
+
+
+class RequestHooks:
+    """Callbacks invoked by a client around its operations and every attempt of a request.
+
+    Subclass it and override the callbacks of interest, then pass instances
+    to the client with `hooks`. Every attempt, including retries, first calls
+    :meth:`on_request_start` and then exactly one of :meth:`on_response`,
+    :meth:`on_retry` and :meth:`on_error`. Responses served by a
+    :class:`~slingshot.cache.ResponseCache`, and GET requests coalesced with
+    an identical one in flight, make no attempt.
+
+    The methods of the API modules, such as
+    :meth:`~slingshot.api.projects.ProjectAPI.iterate_projects`, are
+    operations: :meth:`on_operation_start` and :meth:`on_operation_end` are
+    called around them, and the events of the attempts they make, including
+    those made on the client's thread pools, name the innermost one. An
+    operation that returns an iterator lasts until the iterator is exhausted
+    or closed.
+
+    The callbacks are called synchronously, from the thread or task making
+    the request, so they should be quick. Exceptions they raise are logged
+    and otherwise ignored.
+
+    >>> class SlowRequestLogger(RequestHooks):
+    ...     def on_response(self, event):
+    ...         if event["timings"]["total"] > 1:
+    ...             print(event["endpoint_template"], event["timings"])
+    >>> client = SlingshotClient(hooks=[SlowRequestLogger()])
+    """
+
+    def on_operation_start(self, event: OperationEvent) -> None:
+        """Called when an operation, such as a method of an API module, starts."""
+
+    def on_operation_end(self, event: OperationEndEvent) -> None:
+        """Called when an operation ends, successfully or not."""
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before an attempt of a request is sent."""
+
+    def on_response(self, event: ResponseEvent) -> None:
+        """Called after an attempt of a request succeeded."""
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Called after an attempt of a request failed with a status code that is retried."""
+
+    def on_error(self, event: ErrorEvent) -> None:
+        """Called after an attempt of a request failed with an error that is raised."""
+
+
+class _Operation:
+    """An operation in progress, such as a call of a method of an API module."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str, parent: Optional["_Operation"]) -> None:
+        self.event: OperationEvent = {
+            "name": name,
+            "operation_id": next(self._ids),
+            "parent_id": parent.event["operation_id"] if parent is not None else None,
+        }
+        self._start = time.perf_counter()
+
+    def end(self, error: Optional[Exception]) -> OperationEndEvent:
+        """Return the event of the end of the operation, which ends now."""
+        return {**self.event, "duration": time.perf_counter() - self._start, "error": error}
+
+
+# The innermost operation of the current thread or task, if the client has hooks.
+_current_operation: ContextVar[Optional[_Operation]] = ContextVar(
+    "slingshot_operation", default=None
+)
+
+
+class _AttemptTrace:
+    """The timings of one attempt of a request, collected from httpx's trace extension."""
+
+    def __init__(self, method: str, endpoint: str, attempt: int) -> None:
+        operation = _current_operation.get()
+        self.event: RequestEvent = {
+            "method": method,
+            "endpoint": endpoint,
+            "endpoint_template": _endpoint_template(endpoint),
+            "attempt": attempt,
+            "operation": operation.event["name"] if operation is not None else None,
+            "operation_id": operation.event["operation_id"] if operation is not None else None,
+        }
+        self.status_code: Optional[int] = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.decode = 0.0
+        self._start = time.perf_counter()
+        self._sent: Optional[float] = None
+        # Trace event name, without the connection type, -> when it happened.
+        self._events: dict[str, float] = {}
+
+    def sending(self, content: Optional[bytes]) -> None:
+        """Record that the request, with `content` as its body, is handed to the HTTP client."""
+        self._sent = time.perf_counter()
+        self.bytes_sent = len(content) if content else 0
+
+    def received(self, response: "httpx.Response") -> None:
+        """Record the status code and the bytes received so far of the response."""
+        self.status_code = response.status_code
+        self.bytes_received = response.num_bytes_downloaded
+
+    def trace(self, name: str, info: dict[str, Any]) -> None:
+        """Record an event of the HTTP transport, such as "http11.send_request_headers.started"."""
+        self._events.setdefault(name.split(".", 1)[-1], time.perf_counter())
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        """Record an event of the async HTTP transport."""
+        self.trace(name, info)
+
+    def _span(self, operation: str, end: Optional[str] = None) -> float:
+        """Return the time from the start of `operation` to its end, or to the end of `end`."""
+        started = self._events.get(f"{operation}.started")
+        complete = self._events.get(f"{end or operation}.complete")
+        return complete - started if started is not None and complete is not None else 0.0
+
+    def timings(self) -> RequestTimings:
+        """Return the timings of the attempt, which ends now."""
+        now = time.perf_counter()
+        first = min(self._events.values(), default=self._sent)
+        sent = self._events.get("send_request_body.complete")
+        headers = self._events.get("receive_response_headers.complete")
+        return {
+            "queue": first - self._start if first is not None else 0.0,
+            "connect": self._span("connect_tcp"),
+            "tls": self._span("start_tls"),
+            "send": self._span("send_request_headers", "send_request_body"),
+            "server": headers - sent if sent is not None and headers is not None else 0.0,
+            "download": self._span("receive_response_body"),
+            "decode": self.decode,
+            "total": now - self._start,
+        }
+
+
+class _Hooks:
+    """Dispatches the events of a client's operations and requests to its :class:`RequestHooks`."""
+
+    def __init__(self, hooks: Sequence[RequestHooks]) -> None:
+        self._hooks = tuple(hooks)
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def _emit(self, callback: str, event: Any) -> None:
+        for hooks in self._hooks:
+            try:
+                getattr(hooks, callback)(event)
+            except Exception:
+                logger.exception("%s.%s failed", type(hooks).__name__, callback)
+
+    def _start_operation(self, name: str) -> _Operation:
+        operation = _Operation(name, _current_operation.get())
+        self._emit("on_operation_start", dict(operation.event))
+        return operation
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[None]:
+        """Report the code run in the context as the operation `name`."""
+        operation = self._start_operation(name)
+        token = _current_operation.set(operation)
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _current_operation.reset(token)
+            self._emit("on_operation_end", operation.end(error))
+
+    def generator(self, name: str, items: Generator[T, None, None]) -> Iterator[T]:
+        """Report the iteration of `items` as the operation `name`."""
+        operation = self._start_operation(name)
+        error = None
+        try:
+            while True:
+                # Only the code of `items` runs in the operation, not the caller's.
+                token = _current_operation.set(operation)
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                finally:
+                    _current_operation.reset(token)
+                yield item
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            items.close()
+            self._emit("on_operation_end", operation.end(error))
+
+    async def async_generator(self, name: str, items: AsyncGenerator[T, None]) -> AsyncIterator[T]:
+        """Report the iteration of `items` as the operation `name`."""
+        operation = self._start_operation(name)
+        error = None
+        try:
+            while True:
+                token = _current_operation.set(operation)
+                try:
+                    item = await items.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_operation.reset(token)
+                yield item
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            await items.aclose()
+            self._emit("on_operation_end", operation.end(error))
+
+    def start(self, method: str, endpoint: str, attempt: int) -> Optional[_AttemptTrace]:
+        """Start tracing an attempt, or return None if there are no hooks to call."""
+        if not self._hooks:
+            return None
+        trace = _AttemptTrace(method, endpoint, attempt)
+        self._emit("on_request_start", dict(trace.event))
+        return trace
+
+    def response(self, trace: Optional[_AttemptTrace]) -> None:
+        """Report that the attempt succeeded."""
+        if trace is not None:
+            event: ResponseEvent = {
+                **trace.event,
+                "status_code": trace.status_code or 0,
+                "bytes_sent": trace.bytes_sent,
+                "bytes_received": trace.bytes_received,
+                "timings": trace.timings(),
+            }
+            self._emit("on_response", event)
+
+    def retry(
+        self, trace: Optional[_AttemptTrace], error: "httpx.HTTPStatusError", delay: float
+    ) -> None:
+        """Report that the attempt failed with `error` and is retried after `delay` seconds."""
+        if trace is not None:
+            event: RetryEvent = {
+                **trace.event,
+                "status_code": error.response.status_code,
+                "bytes_sent": trace.bytes_sent,
+                "bytes_received": trace.bytes_received,
+                "timings": trace.timings(),
+                "delay": delay,
+            }
+            self._emit("on_retry", event)
+
+    def error(self, trace: Optional[_AttemptTrace], error: Exception) -> None:
+        """Report that the attempt failed with `error`, which is raised."""
+        if trace is not None:
+            event: ErrorEvent = {
+                **trace.event,
+                "status_code": trace.status_code,
+                "bytes_sent": trace.bytes_sent,
+                "bytes_received": trace.bytes_received,
+                "timings": trace.timings(),
+                "error": error,
+            }
+            self._emit("on_error", event)
+
+
+def _operation(method: F) -> F:
+    """Report the calls of `method`, a method of an API module, as operations to the client's hooks.
+
+    The name of the operation is the qualified name of the method, such as
+    "ProjectAPI.get_project". Without hooks, the method is called directly.
+    """
+    name = method.__qualname__
+
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def run_coroutine(self: Any, *args: Any, **kwargs: Any) -> Any:
+            hooks: _Hooks = self.client._hooks
+            if not hooks:
+                return await method(self, *args, **kwargs)
+            with hooks.operation(name):
+                return await method(self, *args, **kwargs)
+
+        return run_coroutine  # pyright: ignore[reportReturnType]
+
+    is_generator = inspect.isgeneratorfunction(method)
+    is_async_generator = inspect.isasyncgenfunction(method)
+
+    @wraps(method)
+    def run(self: Any, *args: Any, **kwargs: Any) -> Any:
+        hooks: _Hooks = self.client._hooks
+        if not hooks:
+            return method(self, *args, **kwargs)
+        if is_generator:
+            return hooks.generator(name, method(self, *args, **kwargs))
+        if is_async_generator:
+            return hooks.async_generator(name, method(self, *args, **kwargs))
+        with hooks.operation(name):
+            return method(self, *args, **kwargs)
+
+    return run  # pyright: ignore[reportReturnType]
@@ -0,0 +1,227 @@
+"""An in-memory index of the projects of a Slingshot tenant."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+from typing import Optional, cast
+
+from slingshot.client import SlingshotClient
+from slingshot.types import ProjectSchema
+
+logger = logging.getLogger(__name__)
+
+# The attributes of a project that several projects can share.
+_SHARED_KEYS = ("app_id", "job_id", "workspace_id", "cluster_path")
+
+
+class _Snapshot:
+    """The projects listed by one refresh, with hash indexes over their IDs."""
+
+    def __init__(self, projects: Iterable[ProjectSchema]) -> None:
+        self.projects = tuple(projects)
+        self.by_id: dict[str, ProjectSchema] = {
+            project["id"]: project for project in self.projects if project["id"] is not None
+        }
+        # Attribute -> value -> the projects with that value, in listing order.
+        self.by_key: dict[str, dict[str, tuple[ProjectSchema, ...]]] = {}
+        for key in _SHARED_KEYS:
+            groups: dict[str, list[ProjectSchema]] = {}
+            for project in self.projects:
+                value = cast(Optional[str], project.get(key))
+                if value is not None:
+                    groups.setdefault(value, []).append(project)
+            self.by_key[key] = {value: tuple(group) for value, group in groups.items()}
+        self.refreshed_at = time.time()
+
+
+class ProjectIndex:
+    """An in-memory copy of every project, with constant-time lookups by their IDs.
+
+    The index lists all the projects once, with
+    :meth:`~slingshot.api.projects.ProjectAPI.get_projects`, and keeps hash
+    indexes over their `id`, `app_id`, `job_id`, `workspace_id` and
+    `cluster_path`, so that finding the project of a Databricks job is a
+    dictionary lookup instead of a request. Lookups take no lock and never
+    wait for a refresh: a refresh lists the projects again and then replaces
+    the indexes all at once.
+
+    With `refresh_interval`, a background thread refreshes the index
+    periodically. A refresh that fails is logged and retried at the next
+    interval, while lookups keep using the projects of the last successful
+    one; check :attr:`age` to detect an index that has gone stale.
+
+    The projects returned by lookups are shared by all callers and must not
+    be modified.
+
+    >>> from slingshot import ProjectIndex, SlingshotClient
+    >>> index = ProjectIndex(SlingshotClient(), refresh_interval=300)
+    >>> projects = index.find(job_id="1234")
+    >>> index.close()
+    """
+
+    def __init__(
+        self,
+        client: SlingshotClient,
+        refresh_interval: Optional[float] = None,
+        size: int = 200,
+    ):
+        """Build the index, listing every project.
+
+        Args:
+            client (SlingshotClient): The client listing the projects.
+            refresh_interval (Optional[float], optional): The number of
+                seconds between background refreshes. Defaults to None, which
+                only refreshes the index when :meth:`refresh` is called.
+            size (int, optional): The number of projects per page. Defaults to
+                200, the largest page size of the API.
+
+        Raises:
+            ValueError: If `refresh_interval` is not positive.
+            httpx.HTTPStatusError: If listing the projects failed.
+        """
+        if refresh_interval is not None and refresh_interval <= 0:
+            raise ValueError("refresh_interval must be positive")
+        self._client = client
+        self._size = size
+        self._refresh_interval = refresh_interval
+        self._refresh_lock = threading.Lock()
+        self._snapshot = _Snapshot(self._list_projects())
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if refresh_interval is not None:
+            self._thread = threading.Thread(
+                target=self._refresh_periodically,
+                name="slingshot-index-refresh",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def __repr__(self):
+        """Return a string representation of the ProjectIndex."""
+        return f"ProjectIndex(projects={len(self)}, refresh_interval={self._refresh_interval})"
+
+    def __enter__(self) -> "ProjectIndex":
+        """Enter the runtime context, returning the index itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the runtime context, stopping the background refreshes."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the background refreshes, waiting for one in progress to finish.
+
+        The index can still be used for lookups and refreshed with
+        :meth:`refresh` afterwards.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _list_projects(self) -> list[ProjectSchema]:
+        """List every project, raising if a page fails rather than returning a partial list."""
+        projects: list[ProjectSchema] = []
+        page = 1
+        while True:
+            response = self._client.projects.get_projects(page=page, size=self._size)
+            projects.extend(response["items"])
+            if response["page"] >= response["pages"]:
+                return projects
+            page += 1
+
+    def refresh(self) -> None:
+        """List the projects again and replace the indexes with theirs.
+
+        Raises:
+            httpx.HTTPStatusError: If listing the projects failed, in which
+                case the index keeps its projects.
+        """
+        with self._refresh_lock:
+            self._snapshot = _Snapshot(self._list_projects())
+
+    def _refresh_periodically(self) -> None:
+        """Refresh the index every `refresh_interval` seconds until it is closed."""
+        while not self._stopped.wait(self._refresh_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.warning("Refreshing the project index failed", exc_info=True)
+
+    @property
+    def age(self) -> float:
+        """The number of seconds since the projects of the index were listed."""
+        return time.time() - self._snapshot.refreshed_at
+
+    def __len__(self) -> int:
+        """Return the number of projects in the index."""
+        return len(self._snapshot.projects)
+
+    def __iter__(self) -> Iterator[ProjectSchema]:
+        """Iterate over the projects of the index, in listing order."""
+        return iter(self._snapshot.projects)
+
+    def __contains__(self, project_id: object) -> bool:
+        """Return whether the index has a project with the ID `project_id`."""
+        return project_id in self._snapshot.by_id
+
+    def get(self, project_id: str) -> Optional[ProjectSchema]:
+        """Return a project by its ID.
+
+        Args:
+            project_id (str): The ID of the project.
+
+        Returns:
+            Optional[ProjectSchema]: The project, or None if it is not in the index.
+        """
+        return self._snapshot.by_id.get(project_id)
+
+    def find(
+        self,
+        app_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        cluster_path: Optional[str] = None,
+    ) -> list[ProjectSchema]:
+        """Return the projects matching all of the given filters.
+
+        Each filter is a hash lookup; with several filters, the projects
+        matching the first one are checked against the others.
+
+        Args:
+            app_id (Optional[str], optional): The application ID of the
+                projects. Defaults to None.
+            job_id (Optional[str], optional): The Databricks job ID of the
+                projects. Defaults to None.
+            workspace_id (Optional[str], optional): The Databricks workspace
+                ID of the projects. Defaults to None.
+            cluster_path (Optional[str], optional): The cluster path of the
+                projects. Defaults to None.
+
+        Returns:
+            list[ProjectSchema]: The matching projects, in listing order. All
+            the projects of the index if no filter is given.
+        """
+        snapshot = self._snapshot
+        filters = {
+            "app_id": app_id,
+            "job_id": job_id,
+            "workspace_id": workspace_id,
+            "cluster_path": cluster_path,
+        }
+        given = [(key, value) for key, value in filters.items() if value is not None]
+        if not given:
+            return list(snapshot.projects)
+        (key, value), *others = given
+        return [
+            project
+            for project in snapshot.by_key[key].get(value, ())
+            if all(project.get(other) == other_value for other, other_value in others)
+        ]
@@ -0,0 +1,245 @@
+"""In-process metrics of the requests made by clients."""
+
+import bisect
+import math
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+from slingshot.hooks import RequestHooks
+from slingshot.types import (
+    EndpointMetrics,
+    ErrorEvent,
+    RequestTimings,
+    ResponseEvent,
+    RetryEvent,
+)
+
+# The default upper bounds of the latency buckets, in seconds, as used by
+# Prometheus client libraries.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _status_class(status_code: Optional[int]) -> str:
+    """Return the class of a status code, such as "4xx", or "error" without a response."""
+    return f"{status_code // 100}xx" if status_code else "error"
+
+
+class _Series:
+    """The metrics of one method, endpoint template and status class."""
+
+    def __init__(self, num_buckets: int) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.decode_seconds = 0.0
+        # The number of attempts in each bucket, the last one being unbounded.
+        self.bucket_counts = [0] * (num_buckets + 1)
+        self.latency_sum = 0.0
+
+
+class MetricsRegistry(RequestHooks):
+    """Counters and latency histograms of the requests made by clients, per endpoint.
+
+    Pass a registry to :class:`~slingshot.client.SlingshotClient` or
+    :class:`~slingshot.client.AsyncSlingshotClient` with `metrics`, then read
+    its metrics with :meth:`~slingshot.client.SlingshotClient.metrics` or
+    :meth:`snapshot`. Every attempt of a request, including retries, is
+    counted under its method, endpoint template (such as
+    ``/v1/projects/{project_id}``) and status class, with its duration, the
+    size of its request and response bodies and the time spent decoding the
+    response. Retried and throttled (429) attempts are counted as well.
+
+    A registry can be shared by several clients to aggregate their metrics,
+    and :meth:`prometheus_text` formats them for a Prometheus scrape:
+
+    >>> from slingshot import MetricsRegistry, SlingshotClient
+    >>> registry = MetricsRegistry()
+    >>> client = SlingshotClient(metrics=registry)
+    >>> client.projects.get_projects()
+    >>> print(registry.prometheus_text())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "slingshot"):
+        """Initialize the metrics registry.
+
+        Args:
+            buckets (Sequence[float], optional): The upper bounds of the
+                latency histogram buckets, in seconds, in increasing order.
+                Defaults to :data:`DEFAULT_BUCKETS`, from 5 ms to 10 s.
+            prefix (str, optional): The prefix of the metric names in
+                :meth:`prometheus_text`. Defaults to "slingshot".
+
+        Raises:
+            ValueError: If `buckets` is empty or not strictly increasing.
+        """
+        if not buckets or any(a >= b for a, b in zip(buckets, buckets[1:])):
+            raise ValueError("buckets must be a non-empty increasing sequence")
+        self._buckets = tuple(float(bound) for bound in buckets)
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        # (method, endpoint template, status class) -> metrics.
+        self._series: dict[tuple[str, str, str], _Series] = {}
+
+    def __repr__(self):
+        """Return a string representation of the MetricsRegistry."""
+        return f"MetricsRegistry(buckets={self._buckets!r}, prefix={self._prefix!r})"
+
+    def _observe(
+        self,
+        event: Any,
+        status_code: Optional[int],
+        timings: RequestTimings,
+        retried: bool = False,
+    ) -> None:
+        """Count an attempt of a request."""
+        key = (event["method"], event["endpoint_template"], _status_class(status_code))
+        latency = timings["total"]
+        bucket = bisect.bisect_left(self._buckets, latency)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self._buckets))
+            series.requests += 1
+            series.retries += retried
+            series.throttled += status_code == 429
+            series.bytes_sent += event["bytes_sent"]
+            series.bytes_received += event["bytes_received"]
+            series.decode_seconds += timings["decode"]
+            series.bucket_counts[bucket] += 1
+            series.latency_sum += latency
+
+    def on_response(self, event: ResponseEvent) -> None:
+        """Count a successful attempt."""
+        self._observe(event, event["status_code"], event["timings"])
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Count an attempt that is retried."""
+        self._observe(event, event["status_code"], event["timings"], retried=True)
+
+    def on_error(self, event: ErrorEvent) -> None:
+        """Count a failed attempt."""
+        self._observe(event, event["status_code"], event["timings"])
+
+    def snapshot(self) -> list[EndpointMetrics]:
+        """Return the metrics counted so far.
+
+        Returns:
+            list[EndpointMetrics]: The metrics of every method, endpoint
+            template and status class that had attempts, sorted by them.
+        """
+        with self._lock:
+            items = sorted(self._series.items())
+            metrics: list[EndpointMetrics] = []
+            for (method, template, status_class), series in items:
+                cumulative = 0
+                buckets = []
+                for bound, count in zip((*self._buckets, math.inf), series.bucket_counts):
+                    cumulative += count
+                    buckets.append((bound, cumulative))
+                metrics.append(
+                    {
+                        "method": method,
+                        "endpoint_template": template,
+                        "status_class": status_class,
+                        "requests": series.requests,
+                        "retries": series.retries,
+                        "throttled": series.throttled,
+                        "bytes_sent": series.bytes_sent,
+                        "bytes_received": series.bytes_received,
+                        "decode_seconds": series.decode_seconds,
+                        "latency": {
+                            "buckets": buckets,
+                            "count": series.requests,
+                            "sum": series.latency_sum,
+                        },
+                    }
+                )
+        return metrics
+
+    def clear(self) -> None:
+        """Forget the metrics counted so far."""
+        with self._lock:
+            self._series.clear()
+
+    def prometheus_text(self) -> str:
+        """Return the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, ready to be served to a Prometheus scrape.
+        """
+        return format_prometheus(self.snapshot(), self._prefix)
+
+
+# Counter name suffix -> (help text, field of EndpointMetrics).
+_COUNTERS = {
+    "requests_total": ("Attempts of requests to the Slingshot API.", "requests"),
+    "retries_total": ("Attempts of requests that were retried.", "retries"),
+    "throttled_total": ("Attempts of requests answered with 429.", "throttled"),
+    "request_bytes_total": ("Bytes of request bodies sent.", "bytes_sent"),
+    "response_bytes_total": ("Bytes of response bodies received.", "bytes_received"),
+    "decode_seconds_total": ("Seconds spent decoding response bodies.", "decode_seconds"),
+}
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(metrics: EndpointMetrics, **extra: str) -> str:
+    """Return the labels of a sample, such as '{method="GET",...}'."""
+    labels = {
+        "method": metrics["method"],
+        "endpoint": metrics["endpoint_template"],
+        "status_class": metrics["status_class"],
+        **extra,
+    }
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    """Format a sample value, or a bucket bound, for the Prometheus text format."""
+    if value == math.inf:
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def format_prometheus(metrics: Iterable[EndpointMetrics], prefix: str = "slingshot") -> str:
+    """Format metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics (Iterable[EndpointMetrics]): The metrics, as returned by
+            :meth:`MetricsRegistry.snapshot` or
+            :meth:`~slingshot.client.SlingshotClient.metrics`.
+        prefix (str, optional): The prefix of the metric names. Defaults to
+            "slingshot".
+
+    Returns:
+        str: The metrics, one sample per line, with their HELP and TYPE
+        comments.
+    """
+    metrics = list(metrics)
+    lines = []
+    for suffix, (help_text, field) in _COUNTERS.items():
+        name = f"{prefix}_{suffix}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels(m)} {_number(m[field])}" for m in metrics]
+    name = f"{prefix}_request_duration_seconds"
+    lines += [
+        f"# HELP {name} Durations of the attempts of requests to the Slingshot API.",
+        f"# TYPE {name} histogram",
+    ]
+    for m in metrics:
+        latency = m["latency"]
+        lines += [
+            f"{name}_bucket{_labels(m, le=_number(bound))} {count}"
+            for bound, count in latency["buckets"]
+        ]
+        lines += [
+            f"{name}_sum{_labels(m)} {_number(latency['sum'])}",
+            f"{name}_count{_labels(m)} {latency['count']}",
+        ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,129 @@
+"""Client-side rate limiting for Slingshot API requests."""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """A token bucket that spaces out requests to stay under the API's rate limit.
+
+    Each request takes one token from the bucket, which refills at `rate`
+    tokens per second up to `burst` tokens. A request that finds the bucket
+    empty reserves the next token and waits until it is available, so
+    callers are served in order at a steady pace instead of retrying in
+    bursts.
+
+    When the API responds with 429 anyway, the client calls :meth:`throttle`,
+    which halves the refill rate (down to `min_rate`). The rate then recovers
+    linearly to its configured value over `recovery_time` seconds.
+
+    A single limiter can be shared by several clients, threads and asyncio
+    tasks; pass it to :class:`~slingshot.client.SlingshotClient` or
+    :class:`~slingshot.client.AsyncSlingshotClient`:
+
+    >>> from slingshot import RateLimiter, SlingshotClient
+    >>> limiter = RateLimiter(rate=10, burst=20)
+    >>> client = SlingshotClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        min_rate: Optional[float] = None,
+        recovery_time: float = 30.0,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            rate (float): The sustained number of requests per second.
+            burst (Optional[int], optional): The maximum number of requests
+                that can be sent at once after a quiet period. Defaults to
+                `rate` rounded up, and at least 1.
+            min_rate (Optional[float], optional): The lowest rate that
+                :meth:`throttle` can reduce the limiter to. Defaults to a
+                tenth of `rate`.
+            recovery_time (float, optional): The number of seconds it takes a
+                throttled limiter to recover its full rate. Defaults to 30.
+
+        Raises:
+            ValueError: If `rate` or `burst` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._max_rate = float(rate)
+        self._min_rate = float(min_rate) if min_rate is not None else self._max_rate / 10
+        self._burst = float(burst if burst is not None else max(1, math.ceil(rate)))
+        self._recovery_time = recovery_time
+
+        self._lock = threading.Lock()
+        self._rate = self._max_rate
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self._throttled_at = float("-inf")
+
+    def __repr__(self):
+        """Return a string representation of the RateLimiter."""
+        return f"RateLimiter(rate={self._max_rate}, burst={int(self._burst)})"
+
+    @property
+    def rate(self) -> float:
+        """The current refill rate in requests per second, lower than configured while throttled."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._rate
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update and recover the rate. Requires the lock."""
+        elapsed = now - self._updated_at
+        if elapsed <= 0:
+            return
+        if self._rate < self._max_rate:
+            self._rate = min(
+                self._max_rate,
+                self._rate + (self._max_rate - self._min_rate) * elapsed / self._recovery_time,
+            )
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before it may be used."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttle(self) -> None:
+        """Halve the rate after the API responded with 429.
+
+        A burst of 429 responses to requests that were sent together only
+        halves the rate once per second.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now - self._throttled_at < 1.0:
+                return
+            self._throttled_at = now
+            self._rate = max(self._min_rate, self._rate / 2)
+            # Drop the unused burst so the lower rate takes effect immediately.
+            self._tokens = min(self._tokens, 0.0)
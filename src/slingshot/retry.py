@@ -0,0 +1,223 @@
+"""Retrying of failed Slingshot API requests."""
+
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from slingshot.types import RetryStats
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class RetryBudget:
+    """Caps retries to a fraction of the requests made recently.
+
+    Without a budget, every request retries up to its maximum number of
+    attempts during an outage, multiplying the load on a struggling API. The
+    budget allows at most `min_retries` plus `ratio` times the number of
+    requests made in the last `window` seconds; further retries are skipped
+    and the error is raised right away.
+
+    The budget is thread-safe. Share a single budget between clients (through
+    their :class:`RetryPolicy`) to cap their combined retries.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        """Initialize the retry budget.
+
+        Args:
+            ratio (float, optional): The number of retries allowed per request
+                made in the window. Defaults to 0.2.
+            min_retries (int, optional): The number of retries allowed in the
+                window regardless of traffic, so that a client making few
+                requests can still retry them. Defaults to 10.
+            window (float, optional): The length in seconds of the sliding
+                window. Defaults to 10.
+        """
+        self._ratio = ratio
+        self._min_retries = min_retries
+        self._bucket_width = window / 10
+        self._lock = threading.Lock()
+        # Per-bucket [requests, retries], keyed by bucket number.
+        self._buckets: dict[int, list[int]] = {}
+
+    def _current_bucket(self) -> list[int]:
+        """Return the counts of the current bucket, dropping expired ones. Requires the lock."""
+        number = int(time.monotonic() / self._bucket_width)
+        if number not in self._buckets:
+            for expired in [n for n in self._buckets if n <= number - 10]:
+                del self._buckets[expired]
+            self._buckets[number] = [0, 0]
+        return self._buckets[number]
+
+    def record_request(self) -> None:
+        """Record a request, which adds `ratio` retries to the budget."""
+        with self._lock:
+            self._current_bucket()[0] += 1
+
+    def try_spend(self) -> bool:
+        """Record a retry if the budget allows it, returning whether it does."""
+        with self._lock:
+            bucket = self._current_bucket()
+            requests = sum(counts[0] for counts in self._buckets.values())
+            retries = sum(counts[1] for counts in self._buckets.values())
+            if retries >= self._min_retries + self._ratio * requests:
+                return False
+            bucket[1] += 1
+            return True
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Delays follow "decorrelated jitter": each delay is drawn at random between
+    `base_delay` and three times the previous delay, capped at `max_delay`.
+    This spreads retries from many clients apart while still backing off
+    quickly. When the response has a Retry-After header, the delay is at
+    least what the header asks for; a request is not retried at all if the
+    header asks for more than `max_retry_after` seconds.
+
+    Which status codes are retried does not depend on the policy: GET,
+    DELETE, HEAD and OPTIONS requests are retried on 429 and 5xx gateway
+    errors, POST and PUT requests only on 429.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.25,
+        max_delay: float = 30.0,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts (int, optional): The maximum number of attempts per
+                request, including the first. Defaults to 5.
+            base_delay (float, optional): The minimum delay in seconds before
+                a retry. Defaults to 0.25.
+            max_delay (float, optional): The maximum delay in seconds computed
+                by the jitter. Defaults to 30.
+            max_retry_after (float, optional): The longest Retry-After delay in
+                seconds that is waited for. Defaults to 60.
+            budget (Optional[RetryBudget], optional): The budget that caps
+                retries across requests. Defaults to a new
+                :class:`RetryBudget` with default settings.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def __repr__(self):
+        """Return a string representation of the RetryPolicy."""
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, max_retry_after={self.max_retry_after})"
+        )
+
+    def jittered_delay(self, previous_delay: Optional[float]) -> float:
+        """Return the next delay, given the previous one (None before the first retry)."""
+        upper = 3 * (self.base_delay if previous_delay is None else previous_delay)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+class _Retrier:
+    """Applies a :class:`RetryPolicy` on behalf of one client and counts what it does."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        giveup: Callable[[Exception], bool],
+        retry_after: Callable[["httpx.Response"], Optional[float]],
+    ) -> None:
+        self.policy = policy
+        self._giveup = giveup
+        self._retry_after = retry_after
+        self._lock = threading.Lock()
+        self._stats: RetryStats = {
+            "requests": 0,
+            "retries": 0,
+            "giveups": 0,
+            "budget_exhausted": 0,
+            "retry_after_honored": 0,
+            "retry_delay_seconds": 0.0,
+        }
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def stats(self) -> RetryStats:
+        """Return a snapshot of the retry statistics."""
+        with self._lock:
+            return self._stats.copy()
+
+    def record_request(self) -> None:
+        """Record the first attempt of a request."""
+        self._count("requests")
+        self.policy.budget.record_request()
+
+    def next_delay(
+        self,
+        error: "httpx.HTTPStatusError",
+        attempt: int,
+        previous_delay: Optional[float],
+    ) -> Optional[float]:
+        """Return how long to wait before retrying after `error`, or None to give up."""
+        request = error.request
+        if self._giveup(error):
+            return None
+        if attempt >= self.policy.max_attempts:
+            self._count("giveups")
+            logger.warning(
+                "Giving up %s %s after %d attempts: HTTP %d",
+                request.method,
+                request.url,
+                attempt,
+                error.response.status_code,
+            )
+            return None
+
+        delay = self.policy.jittered_delay(previous_delay)
+        retry_after = self._retry_after(error.response)
+        if retry_after is not None:
+            if retry_after > self.policy.max_retry_after:
+                self._count("giveups")
+                logger.warning(
+                    "Giving up %s %s: Retry-After of %.1fs exceeds the maximum of %.1fs",
+                    request.method,
+                    request.url,
+                    retry_after,
+                    self.policy.max_retry_after,
+                )
+                return None
+            self._count("retry_after_honored")
+            delay = max(delay, retry_after)
+
+        if not self.policy.budget.try_spend():
+            self._count("budget_exhausted")
+            logger.warning(
+                "Not retrying %s %s: the retry budget is exhausted", request.method, request.url
+            )
+            return None
+
+        self._count("retries")
+        self._count("retry_delay_seconds", delay)
+        logger.info(
+            "Backing off %s %s for %.2fs after HTTP %d (attempt %d of %d)",
+            request.method,
+            request.url,
+            delay,
+            error.response.status_code,
+            attempt,
+            self.policy.max_attempts,
+        )
+        return delay
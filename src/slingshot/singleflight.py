@@ -0,0 +1,146 @@
+"""Coalescing of identical in-flight requests."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, TypeVar
+
+from slingshot.cache import _freeze, _thaw
+from slingshot.types import CoalescingStats
+
+T = TypeVar("T")
+
+
+class _Call:
+    """The outcome of a call that other callers are waiting for."""
+
+    def __init__(self) -> None:
+        self.duplicates = 0
+        self.snapshot: Optional[bytes] = None
+        self.error: Optional[Exception] = None
+        # Set if the call was interrupted, e.g. cancelled, without an outcome
+        # to share; the waiting callers then make the call themselves.
+        self.interrupted = False
+
+    def outcome(self) -> Any:
+        """Return a copy of the result, or raise the error of the call."""
+        if self.error is not None:
+            raise self.error
+        return _thaw(self.snapshot) if self.snapshot is not None else None
+
+
+class _Flights:
+    """The calls in flight, keyed by request, and the counts shared by both flavors."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, tuple[_Call, Any]] = {}
+        self._stats: CoalescingStats = {"calls": 0, "coalesced": 0}
+
+    def stats(self) -> CoalescingStats:
+        """Return a snapshot of the number of calls made and of the calls that joined them."""
+        with self._lock:
+            return self._stats.copy()
+
+    def _join(self, call: _Call, leading: bool) -> None:
+        """Count a call that is made, or that waits for `call`. Requires the lock."""
+        if leading:
+            self._stats["calls"] += 1
+        else:
+            self._stats["coalesced"] += 1
+            call.duplicates += 1
+
+    def _land(self, key: str, call: _Call, result: Any) -> None:
+        """Stop accepting callers for `call` and share its result with those waiting."""
+        with self._lock:
+            del self._calls[key]
+            # No caller can join anymore, so the duplicates are final.
+            if call.duplicates and call.error is None and not call.interrupted:
+                call.snapshot = _freeze(result)
+
+
+class SingleFlight(_Flights):
+    """Lets threads that make the same call at the same time share a single call.
+
+    The first thread to call :meth:`do` with a key makes the call; threads
+    calling :meth:`do` with the same key before it finishes wait for its
+    outcome instead. Each of them gets its own copy of the result, or the
+    same exception.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single flight group."""
+        super().__init__()
+        self._calls: dict[str, tuple[_Call, threading.Event]] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Call `fn`, or wait for the call of `fn` already in flight for `key`."""
+        with self._lock:
+            leading = key not in self._calls
+            if leading:
+                self._calls[key] = (_Call(), threading.Event())
+            call, done = self._calls[key]
+            self._join(call, leading)
+
+        if not leading:
+            done.wait()
+            if call.interrupted:
+                return fn()
+            return call.outcome()
+
+        result = None
+        try:
+            result = fn()
+            return result
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.interrupted = True
+            raise
+        finally:
+            self._land(key, call, result)
+            done.set()
+
+
+class AsyncSingleFlight(_Flights):
+    """Lets asyncio tasks that make the same call at the same time share a single call.
+
+    See :class:`SingleFlight`. A task that is cancelled while waiting does
+    not cancel the shared call, and if the task making the call is
+    cancelled, the waiting tasks make the call themselves.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single flight group."""
+        super().__init__()
+        self._calls: dict[str, tuple[_Call, asyncio.Future[None]]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await `fn`, or wait for the call of `fn` already in flight for `key`."""
+        with self._lock:
+            leading = key not in self._calls
+            if leading:
+                self._calls[key] = (_Call(), asyncio.get_running_loop().create_future())
+            call, done = self._calls[key]
+            self._join(call, leading)
+
+        if not leading:
+            await asyncio.shield(done)
+            if call.interrupted:
+                return await fn()
+            return call.outcome()
+
+        result = None
+        try:
+            result = await fn()
+            return result
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.interrupted = True
+            raise
+        finally:
+            self._land(key, call, result)
+            done.set_result(None)
@@ -0,0 +1,342 @@
+"""A local SQLite mirror of the projects of a Slingshot tenant."""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Optional, Union, cast
+
+from slingshot.client import SlingshotClient
+from slingshot.codec import JSONCodec, default_codec
+from slingshot.types import ProjectSchema, SyncStats
+
+# The version of the database schema, stored in its user_version.
+SCHEMA_VERSION = 1
+
+# The attributes of a project that are stored in their own indexed column.
+INDEXED_COLUMNS = ("app_id", "job_id", "workspace_id", "creator_id")
+
+_SCHEMA = f"""
+PRAGMA journal_mode = WAL;
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    {", ".join(f"{column} TEXT" for column in INDEXED_COLUMNS)},
+    updated_at TEXT,
+    data BLOB NOT NULL
+);
+{"".join(f"CREATE INDEX IF NOT EXISTS projects_{c} ON projects ({c});" for c in INDEXED_COLUMNS)}
+CREATE INDEX IF NOT EXISTS projects_updated_at ON projects (updated_at);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+
+class ProjectStore:
+    """A local SQLite copy of the projects listed by the API, indexed by their IDs.
+
+    :meth:`sync` mirrors the projects listed by
+    :meth:`~slingshot.api.projects.ProjectAPI.get_projects` into the
+    database, after which :meth:`get` and :meth:`find` read them locally, in
+    microseconds and without any request. The database persists between runs,
+    so a reporting job can sync the projects changed since its last run
+    instead of downloading all of them again.
+
+    Projects are looked up by `id`, `app_id`, `job_id`, `workspace_id` and
+    `creator_id`, which are indexed. Each sync only writes the projects that
+    are new or whose `updated_at` changed, and removes the projects that the
+    API no longer lists once every page was fetched.
+
+    The store is safe to share between threads. The database is in WAL mode,
+    so other processes can read it while a sync writes to it.
+
+    >>> from slingshot import ProjectStore, SlingshotClient
+    >>> with ProjectStore("projects.db") as store:
+    ...     store.sync(SlingshotClient())
+    ...     store.find(job_id="1234")
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike] = ":memory:", codec: Optional[JSONCodec] = None
+    ):
+        """Open the store, creating the database if it does not exist.
+
+        Args:
+            path (Union[str, os.PathLike], optional): The path of the SQLite
+                database. Defaults to ":memory:", a database that lasts as
+                long as the store.
+            codec (Optional[JSONCodec], optional): How projects are encoded
+                in the database. Defaults to an
+                :class:`~slingshot.codec.OrjsonCodec` if orjson is installed,
+                and to a :class:`~slingshot.codec.JSONCodec` otherwise.
+
+        Raises:
+            ValueError: If the database was created by a newer version of
+                the SDK.
+        """
+        self._path = os.fspath(path)
+        self._codec = codec if codec is not None else default_codec()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self._path, check_same_thread=False)
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            self._db.close()
+            raise ValueError(
+                f"{self._path} has schema version {version}, newer than {SCHEMA_VERSION}"
+            )
+        self._db.executescript(_SCHEMA)
+
+    def __repr__(self):
+        """Return a string representation of the ProjectStore."""
+        return f'ProjectStore("{self._path}")'
+
+    def __enter__(self) -> "ProjectStore":
+        """Enter the runtime context, returning the store itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the runtime context, closing the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        """Return the number of projects in the store."""
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM projects").fetchone()[0]
+
+    def __iter__(self) -> Iterator[ProjectSchema]:
+        """Iterate over the projects in the store, ordered by ID."""
+        return iter(self._select("ORDER BY id"))
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """The latest `updated_at` of the projects in the store, or None if it is empty."""
+        with self._lock:
+            return self._db.execute("SELECT max(updated_at) FROM projects").fetchone()[0]
+
+    def _select(self, clause: str, params: tuple[str, ...] = ()) -> list[ProjectSchema]:
+        """Return the projects of the rows selected by an SQL `clause`."""
+        with self._lock:
+            rows = self._db.execute(f"SELECT data FROM projects {clause}", params).fetchall()
+        return [cast(ProjectSchema, self._codec.loads(data)) for (data,) in rows]
+
+    def get(self, project_id: str) -> Optional[ProjectSchema]:
+        """Return a project of the store by its ID.
+
+        Args:
+            project_id (str): The ID of the project.
+
+        Returns:
+            Optional[ProjectSchema]: The project, or None if it is not in the store.
+        """
+        projects = self._select("WHERE id = ?", (project_id,))
+        return projects[0] if projects else None
+
+    def find(
+        self,
+        app_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        creator_id: Optional[str] = None,
+    ) -> list[ProjectSchema]:
+        """Return the projects of the store matching all of the given filters.
+
+        Args:
+            app_id (Optional[str], optional): The application ID of the
+                projects. Defaults to None.
+            job_id (Optional[str], optional): The Databricks job ID of the
+                projects. Defaults to None.
+            workspace_id (Optional[str], optional): The Databricks workspace
+                ID of the projects. Defaults to None.
+            creator_id (Optional[str], optional): The ID of the creator of the
+                projects. Defaults to None.
+
+        Returns:
+            list[ProjectSchema]: The matching projects, ordered by ID. All the
+            projects of the store if no filter is given.
+        """
+        filters = {
+            "app_id": app_id,
+            "job_id": job_id,
+            "workspace_id": workspace_id,
+            "creator_id": creator_id,
+        }
+        columns = [column for column, value in filters.items() if value is not None]
+        where = f"WHERE {' AND '.join(f'{c} = ?' for c in columns)} " if columns else ""
+        return self._select(f"{where}ORDER BY id", tuple(cast(str, filters[c]) for c in columns))
+
+    def _write(self, projects: list[ProjectSchema]) -> None:
+        """Insert or replace projects in the store, in one transaction."""
+        rows = [
+            (
+                project["id"],
+                *(project.get(column) for column in INDEXED_COLUMNS),
+                project.get("updated_at"),
+                self._codec.dumps(project),
+            )
+            for project in projects
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO projects VALUES ({', '.join('?' * len(rows[0]))})",
+                rows,
+            )
+
+    def _delete_except(self, project_ids: set[str]) -> int:
+        """Remove the projects whose ID is not in `project_ids`, returning how many were removed."""
+        with self._lock, self._db:
+            stale = [
+                (project_id,)
+                for (project_id,) in self._db.execute("SELECT id FROM projects")
+                if project_id not in project_ids
+            ]
+            self._db.executemany("DELETE FROM projects WHERE id = ?", stale)
+        return len(stale)
+
+    def sync(
+        self,
+        client: SlingshotClient,
+        full: bool = False,
+        newest_first: bool = False,
+        size: int = 200,
+    ) -> SyncStats:
+        """Update the store with the projects listed by the API.
+
+        The projects are listed page by page, and those that are new or whose
+        `updated_at` differs from the stored one are written, one transaction
+        per page. Once every page is fetched, the stored projects that were
+        not listed are fetched by their IDs, since a project deleted during
+        the sync shifts the pages after it, and those that no longer exist
+        are removed.
+
+        The API does not document the order in which it lists projects. If
+        it lists the most recently updated ones first, pass `newest_first` to
+        stop at the first page of projects all updated before the
+        :attr:`watermark`, the latest `updated_at` in the store, so that a
+        sync only downloads the pages of the projects changed since the last
+        one. Such syncs cannot detect deleted projects, and changes made in
+        the same second as the watermark may be missed if the timestamps
+        have a one-second resolution; run a `full` sync from time to time to
+        catch up.
+
+        Args:
+            client (SlingshotClient): The client listing the projects.
+            full (bool, optional): Whether to fetch every page even with
+                `newest_first`. Defaults to False.
+            newest_first (bool, optional): Whether the API lists the most
+                recently updated projects first, which allows stopping early.
+                Defaults to False.
+            size (int, optional): The number of projects per page. Defaults to
+                200, the largest page size of the API.
+
+        Returns:
+            SyncStats: The number of pages and projects fetched, and of the
+            projects written and deleted.
+
+        Raises:
+            httpx.HTTPStatusError: If listing a page, or fetching an unlisted
+                project, failed with another status than 404. The pages
+                fetched before are kept.
+        """
+        with self._lock:
+            stored = dict(self._db.execute("SELECT id, updated_at FROM projects"))
+        watermark = max((u for u in stored.values() if u is not None), default=None)
+        can_stop = newest_first and not full and watermark is not None
+        stats: SyncStats = {"pages": 0, "fetched": 0, "written": 0, "deleted": 0, "complete": False}
+        seen: set[str] = set()
+        page = 1
+        while True:
+            response = client.projects.get_projects(page=page, size=size)
+            projects = response["items"]
+            stats["pages"] += 1
+            stats["fetched"] += len(projects)
+            changed = [
+                project
+                for project in projects
+                if project["id"] not in stored or stored[project["id"]] != project["updated_at"]
+            ]
+            if changed:
+                self._write(changed)
+                stats["written"] += len(changed)
+            seen.update(cast(str, project["id"]) for project in projects)
+            if response["page"] >= response["pages"]:
+                break
+            if can_stop and all(
+                project["updated_at"] is not None and project["updated_at"] < cast(str, watermark)
+                for project in projects
+            ):
+                return stats
+            page += 1
+        # A project deleted on the server during the walk shifts the projects
+        # of the later pages, so one may be skipped. The stored projects that
+        # were not listed are fetched again and only those gone are removed.
+        unlisted = [project_id for project_id in stored if project_id not in seen]
+        relisted = []
+        for project_id, outcome in client.projects.get_projects_by_id(unlisted):
+            project = outcome["result"]
+            if project is None:
+                if not _is_not_found(cast(Exception, outcome["error"])):
+                    raise cast(Exception, outcome["error"])
+                continue
+            seen.add(project_id)
+            if stored[project_id] != project["updated_at"]:
+                relisted.append(project)
+        if relisted:
+            self._write(relisted)
+            stats["written"] += len(relisted)
+        stats["deleted"] = self._delete_except(seen)
+        stats["complete"] = True
+        return stats
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Return whether `error` is the response to a request for a resource that does not exist."""
+    import httpx
+
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404
+
+
+def sync_projects(
+    db_path: Union[str, os.PathLike],
+    client: Optional[SlingshotClient] = None,
+    full: bool = False,
+    newest_first: bool = False,
+) -> SyncStats:
+    """Mirror the projects listed by the API into a SQLite database.
+
+    A shortcut for opening a :class:`ProjectStore`, calling its
+    :meth:`~ProjectStore.sync` method and closing it, for example from a
+    scheduled job:
+
+    >>> from slingshot import sync_projects
+    >>> sync_projects("projects.db")["written"]
+    3
+
+    Args:
+        db_path (Union[str, os.PathLike]): The path of the SQLite database,
+            which is created if it does not exist.
+        client (Optional[SlingshotClient], optional): The client listing the
+            projects. Defaults to a client configured from the environment,
+            which is closed afterwards.
+        full (bool, optional): Whether to fetch every page even with
+            `newest_first`. Defaults to False.
+        newest_first (bool, optional): Whether the API lists the most recently
+            updated projects first, see :meth:`ProjectStore.sync`. Defaults to
+            False.
+
+    Returns:
+        SyncStats: What the sync did.
+    """
+    with ProjectStore(db_path) as store:
+        if client is not None:
+            return store.sync(client, full=full, newest_first=newest_first)
+        with SlingshotClient() as own_client:
+            return store.sync(own_client, full=full, newest_first=newest_first)
@@ -0,0 +1,687 @@
+"""A local stand-in for the Slingshot API, for tests, load tests and benchmarks."""
+
+import copy
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Callable, Optional, cast
+from urllib.parse import parse_qs, urlsplit
+
+from typing_extensions import TypedDict
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+_CREATOR = {
+    "userId": "user-fake0001",
+    "auth0Id": "auth0|fake0001",
+    "tenantId": "tenant-fake",
+    "isTenantAdmin": False,
+    "firstName": "Fake",
+    "lastName": "User",
+    "email": "fake.user@example.com",
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-01T00:00:00Z",
+    "isActive": True,
+    "isRegistered": True,
+}
+
+_CONFIGURATION = {
+    "enable_elastic_disk": True,
+    "node_type_id": "r5.2xlarge",
+    "num_workers": 4,
+    "driver_node_type_id": "r5.xlarge",
+    "autoscale": {"min_workers": 2, "max_workers": 8},
+    "aws_attributes": {
+        "availability": "SPOT_WITH_FALLBACK",
+        "ebs_volume_count": 1,
+        "ebs_volume_size": 100,
+        "ebs_volume_type": "GENERAL_PURPOSE_SSD",
+        "first_on_demand": 1,
+        "spot_bid_price_percent": 100,
+    },
+}
+
+_PROJECT = r"/v1/projects/(?P<project_id>[^/]+)"
+_RECOMMENDATION = _PROJECT + r"/recommendations/(?P<recommendation_id>[^/]+)"
+
+# Path pattern -> method -> name of the FakeSlingshotServer method handling it.
+_ROUTES = [
+    (re.compile(r"/v1/projects"), {"GET": "_list_projects", "POST": "_create_project"}),
+    (
+        re.compile(_PROJECT),
+        {"GET": "_get_project", "PUT": "_update_project", "DELETE": "_delete_project"},
+    ),
+    (re.compile(_PROJECT + "/reset"), {"POST": "_reset_project"}),
+    (re.compile(_PROJECT + "/recommendations"), {"POST": "_create_recommendation"}),
+    (re.compile(_RECOMMENDATION), {"GET": "_get_recommendation"}),
+    (re.compile(_RECOMMENDATION + "/apply"), {"POST": "_apply_recommendation"}),
+]
+
+
+class ServerStats(TypedDict):
+    """Counts of the requests answered by a :class:`FakeSlingshotServer`.
+
+    requests: The number of requests received.
+    throttled: The number of requests answered with 429 Too Many Requests.
+    errors: The number of requests answered with an injected 5xx error.
+    not_modified: The number of GET requests answered with 304 Not Modified.
+    """
+
+    requests: int
+    throttled: int
+    errors: int
+    not_modified: int
+
+
+class _HTTPError(Exception):
+    """An error response of the API."""
+
+    def __init__(self, status: int, detail: Any):
+        """Initialize the error with its status code and the detail of its body."""
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def _now() -> str:
+    """Return the current time as an ISO 8601 timestamp, as the API formats them."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _query_int(query: dict[str, list[str]], name: str, default: int, maximum: int) -> int:
+    """Return an integer query parameter, validated like the API does."""
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        value = 0
+    if not 1 <= value <= maximum:
+        raise _HTTPError(
+            422,
+            [
+                {
+                    "loc": ["query", name],
+                    "msg": f"Must be between 1 and {maximum}.",
+                    "type": "value_error",
+                }
+            ],
+        )
+    return value
+
+
+class FakeSlingshotServer:
+    """An in-memory implementation of the Slingshot API served on a local port.
+
+    The server implements the endpoints of ``docs/openapi.yaml`` used by the
+    SDK: listing, creating, fetching, updating, deleting and resetting
+    projects, and creating, fetching and applying recommendations. It speaks
+    HTTP/1.1 with keep-alive over a real socket and answers requests from
+    several threads at a time, so connection pooling, concurrency, retries,
+    rate limiting and caching behave as they do against the API.
+
+    Slowness and failures can be injected: a fixed `latency` per request,
+    random 429 and 5xx responses, a rate limit, and exact responses queued
+    with :meth:`inject`. GET responses carry an ETag and honor
+    If-None-Match.
+
+    Recommendations stay PENDING for `recommendation_delay` seconds, then
+    succeed, unless the project has no ``job_id``, in which case they fail
+    like the API does without job run data.
+
+    >>> from slingshot import SlingshotClient
+    >>> from slingshot.testing import FakeSlingshotServer
+    >>> with FakeSlingshotServer() as server:
+    ...     projects = server.add_projects(120)
+    ...     client = SlingshotClient(api_key="test", api_url=server.url)
+    ...     len(list(client.projects.iterate_projects(size=50)))
+    120
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: Optional[float] = 1.0,
+        rate_limit: Optional[float] = None,
+        recommendation_delay: float = 0.0,
+        api_key: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the server, which listens once started.
+
+        Args:
+            host (str, optional): The address to listen on. Defaults to
+                "127.0.0.1".
+            port (int, optional): The port to listen on. Defaults to 0, which
+                picks a free port; see :attr:`url`.
+            latency (float, optional): The number of seconds every request
+                takes before it is answered. Defaults to 0.
+            throttle_rate (float, optional): The share of requests, between 0
+                and 1, answered with 429 Too Many Requests. Defaults to 0.
+            error_rate (float, optional): The share of requests, between 0 and
+                1, answered with `error_status`. Defaults to 0.
+            error_status (int, optional): The status code of the injected
+                errors. Defaults to 503.
+            retry_after (Optional[float], optional): The Retry-After header,
+                in seconds, of 429 responses and of injected 503 responses.
+                Defaults to 1. None leaves the header out.
+            rate_limit (Optional[float], optional): The number of requests
+                allowed per second; requests above it are answered with 429
+                and a Retry-After header of the time until the next one is
+                allowed. Defaults to None, which allows any rate.
+            recommendation_delay (float, optional): The number of seconds a
+                recommendation stays PENDING. Defaults to 0.
+            api_key (Optional[str], optional): The API key requests must
+                send in the Auth header. Defaults to None, which accepts any
+                key but still requires one.
+            seed (Optional[int], optional): The seed of the random numbers
+                used for IDs and injected failures, to make runs repeatable.
+                Defaults to None.
+        """
+        self._address = (host, port)
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.rate_limit = rate_limit
+        self.recommendation_delay = recommendation_delay
+        self.api_key = api_key
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._projects: dict[str, dict[str, Any]] = {}
+        self._recommendations: dict[str, dict[str, dict[str, Any]]] = {}
+        self._ready_at: dict[str, float] = {}
+        self._injected: deque[tuple[int, Optional[float]]] = deque()
+        self._recent: deque[float] = deque()
+        self._stats: ServerStats = {"requests": 0, "throttled": 0, "errors": 0, "not_modified": 0}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self):
+        """Return a string representation of the FakeSlingshotServer."""
+        return f"FakeSlingshotServer(url={self.url!r})" if self._server else "FakeSlingshotServer()"
+
+    def __enter__(self) -> "FakeSlingshotServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server, to pass as the `api_url` of a client.
+
+        Raises:
+            RuntimeError: If the server is not started.
+        """
+        if self._server is None:
+            raise RuntimeError("The server is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeSlingshotServer":
+        """Start answering requests in a background thread, returning the server itself."""
+        if self._server is None:
+            self._server = _Server(self._address, _Handler, self)
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="FakeSlingshotServer",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and close its socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def add_project(self, name: str, workspace_id: str = "1234567890123456", **fields: Any) -> dict:
+        """Add a project as if it had been created through the API.
+
+        Args:
+            name (str): The name of the project.
+            workspace_id (str, optional): The Databricks workspace ID.
+                Defaults to "1234567890123456".
+            **fields (Any): Other attributes of :class:`~slingshot.types.ProjectSchema`.
+
+        Returns:
+            dict: A copy of the project.
+        """
+        with self._lock:
+            project = self._new_project({"name": name, "workspaceId": workspace_id})
+            project.update(copy.deepcopy(fields))
+            return copy.deepcopy(project)
+
+    def add_projects(self, count: int) -> list[dict]:
+        """Add `count` projects with realistic attributes, returning copies of them."""
+        projects = []
+        for i in range(count):
+            projects.append(
+                self.add_project(
+                    name=f"Project {i}",
+                    description=f"Optimizes the Spark job {i}",
+                    app_id=f"app-{i}",
+                    job_id=str(100000000 + i),
+                    cluster_path="job_clusters/main-cluster",
+                    phase="ACTIVE",
+                    metrics={
+                        "job_success_rate_percent": 90 + i % 11,
+                        "sla_met_percent": 80 + i % 21,
+                        "estimated_savings": 100 * (i % 50),
+                    },
+                )
+            )
+        return projects
+
+    @property
+    def projects(self) -> list[dict]:
+        """Copies of the projects, in the order they were created."""
+        with self._lock:
+            return copy.deepcopy(list(self._projects.values()))
+
+    def inject(self, status: int, count: int = 1, retry_after: Optional[float] = None) -> None:
+        """Answer the next `count` requests with `status`, whatever they are.
+
+        Args:
+            status (int): The status code of the responses, e.g. 429 or 503.
+            count (int, optional): The number of requests. Defaults to 1.
+            retry_after (Optional[float], optional): The Retry-After header of
+                the responses, in seconds. Defaults to None, which leaves it out.
+        """
+        with self._lock:
+            self._injected.extend([(status, retry_after)] * count)
+
+    def stats(self) -> ServerStats:
+        """Return a snapshot of the counts of requests answered."""
+        with self._lock:
+            return self._stats.copy()
+
+    def handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer a request, returning the status code, headers and body of the response.
+
+        This is what the HTTP server calls for every request; it is public so
+        that the fake can also be used without a socket, for example from an
+        :class:`httpx.MockTransport`.
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        if self.latency > 0:
+            time.sleep(self.latency)
+        with self._lock:
+            self._stats["requests"] += 1
+            failure = self._failure()
+        if failure is not None:
+            status, retry_after = failure
+            extra = {} if retry_after is None else {"Retry-After": f"{retry_after:g}"}
+            return self._error(_HTTPError(status, _detail(status)), extra)
+
+        url = urlsplit(target)
+        try:
+            if not headers.get("auth") or self.api_key not in (None, headers["auth"]):
+                raise _HTTPError(401, "Authentication required.")
+            handler, params = _route(method, url.path)
+            payload = json.loads(body) if body else None
+            with self._lock:
+                status, result = getattr(self, handler)(
+                    query=parse_qs(url.query), payload=payload, **params
+                )
+                # Serialized under the lock, as results share the stored state.
+                content = b"" if result is None else json.dumps(result).encode()
+        except _HTTPError as e:
+            return self._error(e)
+        except json.JSONDecodeError:
+            return self._error(_HTTPError(422, "The request body is not valid JSON."))
+
+        if result is None:
+            return status, {}, b""
+        response_headers = {"Content-Type": "application/json"}
+        if method == "GET":
+            etag = f'"{hashlib.sha1(content).hexdigest()[:16]}"'
+            response_headers["ETag"] = etag
+            if headers.get("if-none-match") == etag:
+                with self._lock:
+                    self._stats["not_modified"] += 1
+                return 304, {"ETag": etag}, b""
+        return status, response_headers, content
+
+    def _failure(self) -> Optional[tuple[int, Optional[float]]]:
+        """Return the status code and Retry-After of an injected failure, if any. Requires the lock."""
+        failure = None
+        if self._injected:
+            failure = self._injected.popleft()
+        elif self.rate_limit is not None and (wait := self._rate_limited()) is not None:
+            failure = (429, wait)
+        elif self.throttle_rate and self._random.random() < self.throttle_rate:
+            failure = (429, self.retry_after)
+        elif self.error_rate and self._random.random() < self.error_rate:
+            failure = (self.error_status, self.retry_after if self.error_status == 503 else None)
+        if failure is not None:
+            self._stats["throttled" if failure[0] == 429 else "errors"] += 1
+        return failure
+
+    def _rate_limited(self) -> Optional[float]:
+        """Count a request against the rate limit, returning how long to wait if it is over it."""
+        assert self.rate_limit is not None
+        now = time.monotonic()
+        while self._recent and self._recent[0] <= now - 1.0:
+            self._recent.popleft()
+        if len(self._recent) >= self.rate_limit:
+            return round(self._recent[0] + 1.0 - now, 3)
+        self._recent.append(now)
+        return None
+
+    def _error(
+        self, error: _HTTPError, headers: Optional[dict[str, str]] = None
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Return an error response with the API's error body."""
+        content = json.dumps({"detail": error.detail}).encode()
+        return error.status, {"Content-Type": "application/json", **(headers or {})}, content
+
+    def _new_id(self) -> str:
+        """Return a new UUID, drawn from the seeded random numbers."""
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+    def _new_project(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Create a project from the body of a create request. Requires the lock."""
+        now = _now()
+        project = {
+            "id": self._new_id(),
+            "name": payload["name"],
+            "description": payload.get("description"),
+            "app_id": payload.get("app_id"),
+            "job_id": payload.get("job_id"),
+            "workspace_id": payload["workspaceId"],
+            "cluster_path": payload.get("cluster_path"),
+            "creator_id": _CREATOR["userId"],
+            "phase": "PENDING",
+            "product_name": "Slingshot",
+            "created_at": now,
+            "updated_at": now,
+            "settings": _settings(None, payload.get("settings")),
+            "metrics": None,
+        }
+        self._projects[project["id"]] = project
+        self._recommendations[project["id"]] = {}
+        return project
+
+    def _project(self, project_id: str) -> dict[str, Any]:
+        """Return a project, or raise 404 if it does not exist."""
+        project = self._projects.get(project_id)
+        if project is None:
+            raise _HTTPError(404, "The requested resource was not found.")
+        return project
+
+    def _recommendation(self, project_id: str, recommendation_id: str) -> dict[str, Any]:
+        """Return a recommendation with its current state, or raise 404 if it does not exist."""
+        recommendation = self._recommendations.get(project_id, {}).get(recommendation_id)
+        if recommendation is None:
+            raise _HTTPError(404, "The requested resource was not found.")
+        if recommendation["state"] == "PENDING" and time.monotonic() >= self._ready_at.get(
+            recommendation_id, 0.0
+        ):
+            self._finish(self._projects[project_id], recommendation)
+        return recommendation
+
+    def _finish(self, project: dict[str, Any], recommendation: dict[str, Any]) -> None:
+        """Move a pending recommendation to its final state."""
+        recommendation["updated_at"] = _now()
+        if project["job_id"] is None:
+            recommendation["state"] = "FAILURE"
+            recommendation["error"] = "Insufficient job run data to generate recommendation"
+            return
+        recommendation["state"] = "SUCCESS"
+        recommendation["recommendation"] = {
+            "metrics": {"spark_duration_minutes": 45, "spark_cost_requested_usd": 12},
+            "configuration": copy.deepcopy(_CONFIGURATION),
+            "settings": copy.deepcopy(project["settings"]),
+        }
+
+    def _list_projects(self, query: dict[str, list[str]], payload: Any) -> tuple[int, Any]:
+        """Return a page of the projects matching the filters."""
+        page = _query_int(query, "page", 1, maximum=2**31)
+        size = _query_int(query, "size", DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE)
+        projects = [
+            project
+            for project in self._projects.values()
+            if all(
+                project[name] in query[name]
+                for name in ("creator_id", "app_id", "job_id")
+                if name in query
+            )
+        ]
+        items = projects[(page - 1) * size : page * size]
+        include = query.get("include", [])
+        return 200, {
+            "page": page,
+            "pages": max(1, math.ceil(len(projects) / size)),
+            "items": [_view(project, include) for project in items],
+        }
+
+    def _create_project(self, query: dict[str, list[str]], payload: Any) -> tuple[int, Any]:
+        """Create a project, rejecting a missing name or workspace and a duplicate app_id."""
+        if not isinstance(payload, dict):
+            raise _HTTPError(422, "The request body must be a JSON object.")
+        missing = [
+            name for name in ("name", "workspaceId") if not isinstance(payload.get(name), str)
+        ]
+        if missing:
+            raise _HTTPError(
+                422,
+                [
+                    {
+                        "loc": ["body", name],
+                        "msg": "This field is required.",
+                        "type": "value_error.missing",
+                    }
+                    for name in missing
+                ],
+            )
+        app_id = payload.get("app_id")
+        if app_id is not None and any(p["app_id"] == app_id for p in self._projects.values()):
+            raise _HTTPError(409, "Project with this app_id already exists.")
+        return 200, {"result": self._new_project(payload)}
+
+    def _get_project(
+        self, query: dict[str, list[str]], payload: Any, project_id: str
+    ) -> tuple[int, Any]:
+        """Return a project."""
+        return 200, {"result": _view(self._project(project_id), query.get("include", []))}
+
+    def _update_project(
+        self, query: dict[str, list[str]], payload: Any, project_id: str
+    ) -> tuple[int, Any]:
+        """Update the attributes of a project present in the request body."""
+        project = self._project(project_id)
+        if not isinstance(payload, dict):
+            raise _HTTPError(422, "The request body must be a JSON object.")
+        for name in ("name", "description", "job_id", "cluster_path"):
+            if name in payload:
+                project[name] = payload[name]
+        if "workspaceId" in payload:
+            project["workspace_id"] = payload["workspaceId"]
+        if "settings" in payload:
+            project["settings"] = (
+                None
+                if payload["settings"] is None
+                else _settings(project["settings"], payload["settings"])
+            )
+        project["updated_at"] = _now()
+        return 200, {"result": project}
+
+    def _delete_project(
+        self, query: dict[str, list[str]], payload: Any, project_id: str
+    ) -> tuple[int, Any]:
+        """Delete a project and its recommendations."""
+        self._project(project_id)
+        del self._projects[project_id]
+        for recommendation_id in self._recommendations.pop(project_id, {}):
+            self._ready_at.pop(recommendation_id, None)
+        return 200, {"result": "OK"}
+
+    def _reset_project(
+        self, query: dict[str, list[str]], payload: Any, project_id: str
+    ) -> tuple[int, Any]:
+        """Remove the job run data of a project."""
+        project = self._project(project_id)
+        # Resetting removes the job run data the metrics are computed from.
+        project["metrics"] = None
+        project["phase"] = "PENDING"
+        project["updated_at"] = _now()
+        return 204, None
+
+    def _create_recommendation(
+        self, query: dict[str, list[str]], payload: Any, project_id: str
+    ) -> tuple[int, Any]:
+        """Start generating a recommendation, which stays PENDING for a while."""
+        self._project(project_id)
+        now = _now()
+        recommendation = {
+            "id": self._new_id(),
+            "state": "PENDING",
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            "recommendation": None,
+        }
+        self._recommendations[project_id][recommendation["id"]] = recommendation
+        self._ready_at[recommendation["id"]] = time.monotonic() + self.recommendation_delay
+        return 202, {"result": recommendation}
+
+    def _get_recommendation(
+        self, query: dict[str, list[str]], payload: Any, project_id: str, recommendation_id: str
+    ) -> tuple[int, Any]:
+        """Return a recommendation."""
+        return 200, {"result": self._recommendation(project_id, recommendation_id)}
+
+    def _apply_recommendation(
+        self, query: dict[str, list[str]], payload: Any, project_id: str, recommendation_id: str
+    ) -> tuple[int, Any]:
+        """Apply a recommendation, unless it failed."""
+        recommendation = self._recommendation(project_id, recommendation_id)
+        if recommendation["state"] == "FAILURE":
+            raise _HTTPError(409, "A recommendation in FAILURE state cannot be applied.")
+        project = self._projects[project_id]
+        project["phase"] = "ACTIVE"
+        project["updated_at"] = _now()
+        return 200, {"result": "Recommendation applied successfully"}
+
+
+def _detail(status: int) -> str:
+    """Return the error detail the API sends with an injected status code."""
+    if status == 429:
+        return "Rate limit exceeded. Please try again later."
+    if status == 503:
+        return "Service temporarily unavailable."
+    return "Internal server error."
+
+
+def _route(method: str, path: str) -> tuple[str, dict[str, str]]:
+    """Return the name of the method handling a request and its path parameters."""
+    for pattern, handlers in _ROUTES:
+        match = pattern.fullmatch(path)
+        if match is not None:
+            if method not in handlers:
+                raise _HTTPError(405, "Method not allowed.")
+            return handlers[method], match.groupdict()
+    raise _HTTPError(404, "The requested resource was not found.")
+
+
+def _settings(current: Optional[dict[str, Any]], update: Optional[dict[str, Any]]) -> dict:
+    """Return project settings with the values set by `update`."""
+    settings = dict(
+        current or {"sla_minutes": None, "auto_apply_recs": False, "optimize_instance_size": False}
+    )
+    settings.update(update or {})
+    return settings
+
+
+def _view(project: dict[str, Any], include: list[str]) -> dict[str, Any]:
+    """Return a project as a GET request with `include` sees it.
+
+    "creator" adds the creator of the project. Other values name the
+    attributes to return, besides the ID; all attributes are returned if
+    there are none.
+    """
+    attributes = [name for name in include if name != "creator"]
+    view = (
+        {name: value for name, value in project.items() if name == "id" or name in attributes}
+        if attributes
+        else dict(project)
+    )
+    if "creator" in include:
+        view["creator"] = dict(_CREATOR)
+    return view
+
+
+class _Server(ThreadingHTTPServer):
+    """The HTTP server of a :class:`FakeSlingshotServer`, one thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        handler: Callable[..., BaseHTTPRequestHandler],
+        fake: FakeSlingshotServer,
+    ):
+        """Initialize the server, which hands the requests to `fake`."""
+        super().__init__(address, handler)
+        self.fake = fake
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Passes the requests of a connection to the :class:`FakeSlingshotServer`."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self) -> None:
+        """Read a request and write the response of the fake server."""
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, content = cast(_Server, self.server).fake.handle(
+            self.command, self.path, dict(self.headers.items()), body
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the requests out of the output of tests and benchmarks."""
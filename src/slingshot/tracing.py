@@ -0,0 +1,150 @@
+"""Tracing of the operations and requests of a client with OpenTelemetry."""
+
+import importlib
+import threading
+import time
+from typing import Any, Optional
+
+from slingshot.__vers import __version__
+from slingshot.hooks import RequestHooks
+from slingshot.types import (
+    ErrorEvent,
+    OperationEndEvent,
+    OperationEvent,
+    ResponseEvent,
+    RetryEvent,
+)
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """Hooks that record the operations and requests of a client as OpenTelemetry spans.
+
+    Every operation, such as
+    :meth:`~slingshot.api.projects.ProjectAPI.iterate_projects` or
+    :meth:`~slingshot.api.projects.ProjectAPI.apply_recommendation`, is a span
+    named after it, with the span of each attempt of its requests nested
+    under it. Operations started while another span is current, for
+    example in a job scheduler's own span, are nested under that span.
+
+    Attempt spans are client spans named after the method and endpoint
+    template, such as ``GET /v1/projects/{project_id}``. They carry the
+    HTTP method, endpoint template and path, status code, retry count
+    (``http.request.resend_count``), request and response body sizes, and
+    the timing breakdown of the attempt in ``slingshot.timings.*``
+    attributes, in seconds. Operation spans carry the number of retries made
+    by their requests in ``slingshot.retries``.
+
+    Requires the OpenTelemetry API, installed with the ``otel`` extra:
+    ``pip install "c1s-slingshot-sdk-py[otel]"``. Until an OpenTelemetry SDK
+    is configured, the spans are not recorded.
+
+    >>> from slingshot.tracing import OpenTelemetryHooks
+    >>> client = SlingshotClient(hooks=[OpenTelemetryHooks()])
+    """
+
+    def __init__(self, tracer_provider: Optional[Any] = None) -> None:
+        """Initialize the hooks.
+
+        Args:
+            tracer_provider (Optional[TracerProvider]): The tracer provider
+                that creates the spans. Defaults to the global tracer provider.
+
+        Raises:
+            ImportError: If the OpenTelemetry API is not installed.
+        """
+        try:
+            self._trace = importlib.import_module("opentelemetry.trace")
+        except ImportError as e:
+            raise ImportError(
+                'OpenTelemetryHooks requires opentelemetry-api: pip install "c1s-slingshot-sdk-py[otel]"'
+            ) from e
+        self._tracer = self._trace.get_tracer(
+            "slingshot", __version__, tracer_provider=tracer_provider
+        )
+        self._lock = threading.Lock()
+        # Operation ID -> the span of the operation and the retries made by its requests.
+        self._operations: dict[int, list[Any]] = {}
+
+    def __repr__(self):
+        """Return a string representation of the hooks."""
+        return f"{type(self).__name__}()"
+
+    def _parent(self, operation_id: Optional[int]) -> Optional[Any]:
+        """Return the context of the span of an operation, or None for the current context."""
+        with self._lock:
+            operation = self._operations.get(operation_id) if operation_id is not None else None
+        return self._trace.set_span_in_context(operation[0]) if operation is not None else None
+
+    def on_operation_start(self, event: OperationEvent) -> None:
+        """Start the span of an operation."""
+        span = self._tracer.start_span(event["name"], context=self._parent(event["parent_id"]))
+        with self._lock:
+            self._operations[event["operation_id"]] = [span, 0]
+
+    def on_operation_end(self, event: OperationEndEvent) -> None:
+        """End the span of an operation."""
+        with self._lock:
+            operation = self._operations.pop(event["operation_id"], None)
+        if operation is None:
+            return
+        span, retries = operation
+        span.set_attribute("slingshot.retries", retries)
+        error = event["error"]
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        span.end()
+
+    def _record_attempt(
+        self,
+        event: Any,
+        error: Optional[Exception] = None,
+        extra: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Record the span of an attempt, which started `timings.total` seconds ago.
+
+        `extra` holds additional attributes of the span.
+        """
+        end = time.time_ns()
+        timings = event["timings"]
+        attributes = {
+            "http.request.method": event["method"],
+            "url.template": event["endpoint_template"],
+            "url.path": event["endpoint"],
+            "http.request.resend_count": event["attempt"] - 1,
+            "http.request.body.size": event["bytes_sent"],
+            "http.response.body.size": event["bytes_received"],
+            **{f"slingshot.timings.{phase}": seconds for phase, seconds in timings.items()},
+            **(extra or {}),
+        }
+        status_code = event["status_code"]
+        if status_code is not None:
+            attributes["http.response.status_code"] = status_code
+        span = self._tracer.start_span(
+            f"{event['method']} {event['endpoint_template']}",
+            context=self._parent(event["operation_id"]),
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=end - int(timings["total"] * 1e9),
+        )
+        if error is not None:
+            span.record_exception(error)
+        if error is not None or (status_code is not None and status_code >= 400):
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error or "")))
+        span.end(end_time=end)
+
+    def on_response(self, event: ResponseEvent) -> None:
+        """Record the span of a successful attempt."""
+        self._record_attempt(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Record the span of an attempt that is retried, and count the retry."""
+        self._record_attempt(event, extra={"slingshot.retry_delay": event["delay"]})
+        with self._lock:
+            operation = self._operations.get(event["operation_id"] or 0)
+            if operation is not None:
+                operation[1] += 1
+
+    def on_error(self, event: ErrorEvent) -> None:
+        """Record the span of a failed attempt."""
+        self._record_attempt(event, event["error"])
@@ -210,3 +210,223 @@ class Page(TypedDict, Generic[T]):
     page: int
     pages: int
     items: list[T]
+
+
+class BatchResult(TypedDict, Generic[T]):
+    """The outcome of a single operation in a batch of API calls.
+
+    Exactly one of `result` and `error` is set: `result` holds the value
+    returned for a successful operation and `error` holds the exception raised
+    by a failed one, such as an :class:`httpx.HTTPStatusError` for a 404.
+    """
+
+    result: Optional[T]
+    error: Optional[Exception]
+
+
+class RetryStats(TypedDict):
+    """Counts of the retries made by a client.
+
+    `requests` counts requests without their retries and `retries` the
+    retries made. `giveups` counts requests that failed after using up their
+    attempts or whose Retry-After delay was too long to wait for, and
+    `budget_exhausted` the retries skipped because the retry budget was used
+    up. `retry_after_honored` counts the retries delayed by a Retry-After
+    header, and `retry_delay_seconds` is the total time spent waiting before
+    retries.
+    """
+
+    requests: int
+    retries: int
+    giveups: int
+    budget_exhausted: int
+    retry_after_honored: int
+    retry_delay_seconds: float
+
+
+class CacheStats(TypedDict):
+    """Counts of the lookups and removals of a :class:`~slingshot.cache.ResponseCache`.
+
+    `hits` and `misses` count the lookups that did and did not find a fresh
+    response. `evictions` counts the responses removed to make room for new
+    ones, and `invalidations` the responses removed after a write.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class CoalescingStats(TypedDict):
+    """Counts of the GET requests coalesced by a client.
+
+    `calls` counts the requests sent to the API, and `coalesced` the
+    identical requests made while one of them was in flight, which waited for
+    its response instead of being sent.
+    """
+
+    calls: int
+    coalesced: int
+
+
+class RequestTimings(TypedDict):
+    """Where the time of one attempt of a request went, in seconds.
+
+    `queue` is the time before the request was written, waiting for the rate
+    limiter and for a connection from the pool. `connect` and `tls` are the
+    time spent opening a new connection, and are zero when a pooled one was
+    reused. `send` is the time spent writing the request, `server` the time
+    from then until the response headers arrived, `download` the time spent
+    reading the response body and `decode` the time spent decoding it.
+    `total` is the time of the whole attempt.
+
+    The network phases are reported by httpx's transport; with a custom
+    transport that does not report them, such as :class:`httpx.MockTransport`,
+    they are zero.
+    """
+
+    queue: float
+    connect: float
+    tls: float
+    send: float
+    server: float
+    download: float
+    decode: float
+    total: float
+
+
+class RequestEvent(TypedDict):
+    """An attempt of a request, passed to :meth:`~slingshot.hooks.RequestHooks.on_request_start`.
+
+    `endpoint_template` is `endpoint` with the IDs replaced by placeholders,
+    such as ``/v1/projects/{project_id}``, so that requests to the same route
+    can be grouped. `attempt` counts from 1 and grows with every retry.
+    `operation` and `operation_id` are the name and ID of the innermost
+    operation making the request, if any.
+    """
+
+    method: str
+    endpoint: str
+    endpoint_template: str
+    attempt: int
+    operation: Optional[str]
+    operation_id: Optional[int]
+
+
+class ResponseEvent(RequestEvent):
+    """An attempt of a request that succeeded.
+
+    Passed to :meth:`~slingshot.hooks.RequestHooks.on_response`. `bytes_sent`
+    is the size of the request body and `bytes_received` the number of bytes
+    of the response body received during the attempt, before decompression.
+    """
+
+    status_code: int
+    bytes_sent: int
+    bytes_received: int
+    timings: RequestTimings
+
+
+class RetryEvent(ResponseEvent):
+    """An attempt of a request that failed and is retried after `delay` seconds.
+
+    Passed to :meth:`~slingshot.hooks.RequestHooks.on_retry`.
+    """
+
+    delay: float
+
+
+class ErrorEvent(RequestEvent):
+    """An attempt of a request that failed with `error`, which is raised to the caller.
+
+    Passed to :meth:`~slingshot.hooks.RequestHooks.on_error`. `status_code` is
+    None if no response was received, e.g. after a timeout.
+    """
+
+    status_code: Optional[int]
+    bytes_sent: int
+    bytes_received: int
+    timings: RequestTimings
+    error: Exception
+
+
+class OperationEvent(TypedDict):
+    """An operation, passed to :meth:`~slingshot.hooks.RequestHooks.on_operation_start`.
+
+    `name` is the qualified name of the method, such as
+    ``ProjectAPI.iterate_projects``. `operation_id` identifies the operation
+    among the events, and `parent_id` is the ID of the operation that called
+    this one, if any.
+    """
+
+    name: str
+    operation_id: int
+    parent_id: Optional[int]
+
+
+class OperationEndEvent(OperationEvent):
+    """An operation that ended, passed to :meth:`~slingshot.hooks.RequestHooks.on_operation_end`.
+
+    `duration` is in seconds, and `error` is the exception that the operation
+    raised, if any.
+    """
+
+    duration: float
+    error: Optional[Exception]
+
+
+class HistogramSnapshot(TypedDict):
+    """The distribution of the values observed by a histogram.
+
+    `buckets` lists the upper bound of every bucket with the number of values
+    less than or equal to it, the last bound being infinity. `count` is the
+    number of values observed and `sum` their total.
+    """
+
+    buckets: list[tuple[float, int]]
+    count: int
+    sum: float
+
+
+class EndpointMetrics(TypedDict):
+    """The metrics of the attempts of requests to an endpoint that got the same status class.
+
+    `endpoint_template` is the endpoint with its IDs replaced by placeholders,
+    such as ``/v1/projects/{project_id}``, and `status_class` is ``2xx``,
+    ``3xx``, ``4xx``, ``5xx``, or ``error`` for attempts that failed without a
+    response. `requests` counts the attempts, including retries, `retries`
+    those that were retried and `throttled` those answered with 429.
+    `bytes_sent` and `bytes_received` are the total sizes of the request and
+    response bodies, `decode_seconds` the total time spent decoding responses,
+    and `latency` the distribution of the durations of the attempts in
+    seconds.
+    """
+
+    method: str
+    endpoint_template: str
+    status_class: str
+    requests: int
+    retries: int
+    throttled: int
+    bytes_sent: int
+    bytes_received: int
+    decode_seconds: float
+    latency: HistogramSnapshot
+
+
+class SyncStats(TypedDict):
+    """What a sync of a :class:`~slingshot.store.ProjectStore` did.
+
+    `pages` counts the pages of projects fetched and `fetched` the projects in
+    them. `written` counts the projects that were new or changed and were
+    written to the store, and `deleted` the projects removed from the store
+    because the API no longer lists them. `complete` is whether every page was
+    fetched; deleted projects are only detected by complete syncs.
+    """
+
+    pages: int
+    fetched: int
+    written: int
+    deleted: int
+    complete: bool
@@ -1,7 +1,12 @@
+from collections.abc import Iterator
+
 import pytest
 from pytest_httpx import HTTPXMock
 
-from slingshot.client import SlingshotClient
+from slingshot.client import AsyncSlingshotClient, SlingshotClient
+from slingshot.retry import RetryPolicy
+from slingshot.testing import FakeSlingshotServer
+from tests.helpers import FakeTime
 
 
 @pytest.fixture(scope="session")
@@ -18,3 +23,44 @@ def client(api_key: str, httpx_mock: HTTPXMock) -> SlingshotClient:
     api_url = "https://test.slingshot.capitalone.com/prod/api/gradient"
 
     return SlingshotClient(api_key=api_key, api_url=api_url)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio, which the async client is built on."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="function")
+def async_client(api_key: str, httpx_mock: HTTPXMock) -> AsyncSlingshotClient:
+    """Fixture to create an AsyncSlingshotClient instance for testing."""
+    api_url = "https://test.slingshot.capitalone.com/prod/api/gradient"
+
+    return AsyncSlingshotClient(api_key=api_key, api_url=api_url)
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeSlingshotServer]:
+    """A started fake server, without projects."""
+    with FakeSlingshotServer(seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def fake_client(fake_server: FakeSlingshotServer) -> Iterator[SlingshotClient]:
+    """A client of the `fake_server` fixture that retries without waiting long."""
+    with SlingshotClient(
+        api_key="test",
+        api_url=fake_server.url,
+        retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.01),
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def fake_time(monkeypatch: pytest.MonkeyPatch) -> FakeTime:
+    """Replace the clock of the rate limiter, retry budget, circuit breaker and response cache."""
+    fake = FakeTime()
+    for module in ("ratelimit", "retry", "circuit", "cache"):
+        monkeypatch.setattr(f"slingshot.{module}.time", fake)
+    return fake
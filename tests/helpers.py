@@ -0,0 +1,40 @@
+"""Test doubles shared by the test modules."""
+
+from typing import Any, Callable
+
+import httpx
+
+from slingshot.client import SlingshotClient
+from slingshot.retry import RetryPolicy
+
+
+class FakeTime:
+    """A stand-in for the time module whose clock only moves when told to or slept on."""
+
+    def __init__(self) -> None:
+        """Start the clock at an arbitrary time."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Move the clock forward instead of sleeping."""
+        self.now += seconds
+
+
+def mock_client(
+    handler: Callable[[httpx.Request], httpx.Response], **options: Any
+) -> SlingshotClient:
+    """Return a client that sends its requests to `handler` and retries without waiting.
+
+    `options` are passed on to the client, for example its hooks.
+    """
+    return SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+        **options,
+    )
@@ -0,0 +1,90 @@
+from importlib.metadata import version as get_version
+from typing import Literal
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from slingshot import AsyncSlingshotClient
+
+__version__ = get_version("c1s-slingshot-sdk-py")
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("status_code", [500, 503, 429])
+@pytest.mark.parametrize("method", ["GET", "DELETE"])
+async def test_retries_get_on_status_code(
+    httpx_mock: HTTPXMock,
+    async_client: AsyncSlingshotClient,
+    status_code: int,
+    method: Literal["GET", "DELETE"],
+) -> None:
+    """Test that the async client retries on the same status codes as the sync client."""
+    httpx_mock.add_response(
+        method=method, url=f"{async_client._api_url}/TEST", status_code=status_code
+    )
+    httpx_mock.add_response(
+        method=method,
+        url=f"{async_client._api_url}/TEST",
+        status_code=200,
+        json={"success": True},
+    )
+    result = await async_client._api_request(method=method, endpoint="/TEST")
+    assert result == {"success": True}
+
+
+@pytest.mark.parametrize("method", ["POST", "PUT"])
+async def test_no_retry_post_put_on_server_error(
+    httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient, method: Literal["POST", "PUT"]
+) -> None:
+    """Test that POST and PUT are not retried on 5xx responses."""
+    httpx_mock.add_response(method=method, url=f"{async_client._api_url}/TEST", status_code=500)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await async_client._api_request(method=method, endpoint="/TEST")
+    assert exc_info.value.response.status_code == 500
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_headers(httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient) -> None:
+    """Test that the async client authenticates and identifies itself."""
+    httpx_mock.add_response(
+        url=f"{async_client._api_url}/TEST",
+        json={"success": True},
+        match_headers={
+            "Auth": async_client._api_key,
+            "User-Agent": f"Slingshot Library/{__version__} (c1s-slingshot-sdk-py)",
+        },
+    )
+    assert await async_client._api_request(method="GET", endpoint="/TEST") == {"success": True}
+
+
+async def test_response_non_json_content_type(
+    httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient
+) -> None:
+    """Test response coming back without json content type."""
+    httpx_mock.add_response(url=f"{async_client._api_url}/TEST", status_code=200)
+    with pytest.raises(RuntimeError, match="response was not of type 'application/json'"):
+        await async_client._api_request(method="GET", endpoint="/TEST")
+
+
+async def test_response_204(httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient) -> None:
+    """Test response coming back for a 204 no content."""
+    httpx_mock.add_response(url=f"{async_client._api_url}/TEST", status_code=204)
+    assert await async_client._api_request(method="GET", endpoint="/TEST") is None
+
+
+def test_no_api_key_raises_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an error is raised if no API key is provided."""
+    monkeypatch.delenv("SLINGSHOT_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="API key must be provided"):
+        AsyncSlingshotClient(api_key=None)
+
+
+async def test_context_manager() -> None:
+    """Test that the client closes its connections when used as an async context manager."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(status_code=204))
+    async with AsyncSlingshotClient(api_key="test_api_key", transport=transport) as client:
+        assert await client._api_request(method="GET", endpoint="/TEST") is None
+        assert repr(client) == f'AsyncSlingshotClient(api_url="{client._api_url}", api_key="***")'
+    assert client._http.is_closed
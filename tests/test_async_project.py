@@ -0,0 +1,328 @@
+import asyncio
+import math
+from typing import Optional, cast
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from slingshot import AsyncSlingshotClient
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_success(httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient) -> None:
+    """Test creating a project successfully."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{async_client._api_url}/v1/projects",
+        json={"result": {"id": "project_id_123", "name": "project_create"}},
+    )
+    project = await async_client.projects.create(
+        name="project_create",
+        workspace_id="12345678901234",
+        settings={"sla_minutes": 5},
+        app_id="test",
+    )
+    assert project == {"id": "project_id_123", "name": "project_create"}
+    request = httpx_mock.get_requests()[0]
+    expected_payload = {
+        "name": "project_create",
+        "workspaceId": "12345678901234",
+        "app_id": "test",
+        "settings": {"sla_minutes": 5},
+    }
+    assert (
+        request.read().decode() == httpx.Request("POST", "/", json=expected_payload).read().decode()
+    )
+
+
+async def test_update_success(httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient) -> None:
+    """Test updating a project successfully."""
+    project_id = "project_id_123"
+    httpx_mock.add_response(
+        method="PUT",
+        url=f"{async_client._api_url}/v1/projects/{project_id}",
+        json={"result": {"id": project_id, "name": "project_update"}},
+    )
+    project = await async_client.projects.update(
+        project_id=project_id, name="project_update", settings=None
+    )
+    assert project == {"id": project_id, "name": "project_update"}
+    request = httpx_mock.get_requests()[0]
+    assert (
+        request.read().decode()
+        == httpx.Request("PUT", "/", json={"name": "project_update", "settings": None})
+        .read()
+        .decode()
+    )
+
+
+async def test_delete_and_reset(httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient) -> None:
+    """Test deleting and resetting a project."""
+    project_id = "project_id_123"
+    httpx_mock.add_response(
+        method="DELETE",
+        url=f"{async_client._api_url}/v1/projects/{project_id}",
+        json={},
+    )
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{async_client._api_url}/v1/projects/{project_id}/reset",
+        status_code=204,
+    )
+    assert await async_client.projects.delete(project_id=project_id) is None
+    assert await async_client.projects.reset(project_id=project_id) is None
+
+
+@pytest.mark.parametrize("include", [["creator"], None])
+async def test_get_projects_success(
+    httpx_mock: HTTPXMock,
+    async_client: AsyncSlingshotClient,
+    include: Optional[list[str]],
+) -> None:
+    """Test project list fetching success."""
+    mock_response = {"items": [{"id": "project_id_123"}], "page": 2, "pages": 2}
+    params = {"page": 2, "size": 25, "job_id": "job_1"}
+    if include:
+        params["include"] = include
+    httpx_mock.add_response(
+        method="GET",
+        url=httpx.URL(url=f"{async_client._api_url}/v1/projects", params=params),
+        json=mock_response,
+    )
+    response_page = await async_client.projects.get_projects(
+        include=include, job_id="job_1", page=2, size=25
+    )
+    assert response_page == mock_response
+
+
+async def test_get_project_missing(
+    httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient
+) -> None:
+    """Test error handling when fetching a project."""
+    project_id = "project_id_123"
+    httpx_mock.add_response(
+        method="GET",
+        url=httpx.URL(
+            url=f"{async_client._api_url}/v1/projects/{project_id}", params={"include": ["name"]}
+        ),
+        status_code=404,
+        json={"error": "Project not found"},
+    )
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await async_client.projects.get_project(project_id=project_id, include=["name"])
+    assert exc_info.value.response.status_code == 404
+
+
+async def test_recommendations(httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient) -> None:
+    """Test creating, fetching and applying a recommendation."""
+    project_id = "project_id_123"
+    recommendation_id = "recommendation_123"
+    recommendation_url = (
+        f"{async_client._api_url}/v1/projects/{project_id}/recommendations/{recommendation_id}"
+    )
+    pending = {"id": recommendation_id, "state": "PENDING"}
+    success = {"id": recommendation_id, "state": "SUCCESS"}
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{async_client._api_url}/v1/projects/{project_id}/recommendations",
+        status_code=202,
+        json={"result": pending},
+    )
+    httpx_mock.add_response(method="GET", url=recommendation_url, json={"result": success})
+    httpx_mock.add_response(method="POST", url=f"{recommendation_url}/apply", json={})
+    httpx_mock.add_response(method="GET", url=recommendation_url, json={"result": success})
+
+    assert await async_client.projects.create_recommendation(project_id=project_id) == pending
+    assert (
+        await async_client.projects.get_recommendation(
+            project_id=project_id, recommendation_id=recommendation_id
+        )
+        == success
+    )
+    assert (
+        await async_client.projects.apply_recommendation(
+            project_id=project_id, recommendation_id=recommendation_id
+        )
+        == success
+    )
+
+
+def _paginated_client(total_items: int, requested: list[httpx.Request]) -> AsyncSlingshotClient:
+    """Build a client whose transport serves `total_items` projects in pages."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request)
+        page = int(request.url.params["page"])
+        size = int(request.url.params["size"])
+        # Later pages answer first, so completion order differs from page order.
+        await asyncio.sleep(0.01 / page)
+        start = (page - 1) * size
+        return httpx.Response(
+            status_code=200,
+            json={
+                "page": page,
+                "pages": math.ceil(total_items / size),
+                "items": [
+                    {"id": f"proj_{i}"} for i in range(start, min(start + size, total_items))
+                ],
+            },
+        )
+
+    return AsyncSlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 3, 50])
+@pytest.mark.parametrize("total_items", [0, 5, 95])
+async def test_aiterate_projects_ordered(concurrency: int, total_items: int) -> None:
+    """Tests that aiterate_projects yields every project in page order."""
+    requested: list[httpx.Request] = []
+    client = _paginated_client(total_items, requested)
+    result = [
+        project["id"]
+        async for project in client.projects.aiterate_projects(size=10, concurrency=concurrency)
+    ]
+    assert result == [f"proj_{i}" for i in range(total_items)]
+    assert len(requested) == max(1, math.ceil(total_items / 10))
+
+
+async def test_aiterate_projects_unordered() -> None:
+    """Tests that aiterate_projects(ordered=False) yields pages as they complete."""
+    client = _paginated_client(95, [])
+    result = [
+        cast(str, project["id"])
+        async for project in client.projects.aiterate_projects(
+            size=10, concurrency=9, ordered=False
+        )
+    ]
+    assert sorted(result) == sorted(f"proj_{i}" for i in range(95))
+    assert result != [f"proj_{i}" for i in range(95)]
+
+
+async def test_aiterate_projects_filters_and_max_pages() -> None:
+    """Tests that aiterate_projects passes the filters and respects max_pages."""
+    requested: list[httpx.Request] = []
+    client = _paginated_client(95, requested)
+    result = [
+        project["id"]
+        async for project in client.projects.aiterate_projects(
+            include=["name"], creator_id="c", app_id="a", job_id="j", size=10, max_pages=3
+        )
+    ]
+    assert result == [f"proj_{i}" for i in range(30)]
+    assert len(requested) == 3
+    for request in requested:
+        assert request.url.params.get_list("include") == ["name"]
+        assert request.url.params["creator_id"] == "c"
+        assert request.url.params["app_id"] == "a"
+        assert request.url.params["job_id"] == "j"
+
+
+async def test_aiterate_projects_stops_on_error() -> None:
+    """Tests that aiterate_projects stops at the first page that fails."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 3:
+            return httpx.Response(status_code=404)
+        return httpx.Response(
+            status_code=200, json={"page": page, "pages": 6, "items": [{"id": f"proj_{page}"}]}
+        )
+
+    client = AsyncSlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=httpx.MockTransport(handler)
+    )
+    result = [project async for project in client.projects.aiterate_projects(size=1)]
+    assert result == [{"id": "proj_1"}, {"id": "proj_2"}]
+
+
+async def test_aiterate_projects_closed_early() -> None:
+    """Tests that closing the generator early stops requesting further pages."""
+    requested: list[httpx.Request] = []
+    client = _paginated_client(1000, requested)
+    projects = client.projects.aiterate_projects(size=10, concurrency=2)
+    assert [(await projects.__anext__())["id"] for _ in range(15)] == [
+        f"proj_{i}" for i in range(15)
+    ]
+    await projects.aclose()
+    assert len(requested) <= 4
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_aiterate_projects_invalid_concurrency(concurrency: int) -> None:
+    """Tests that aiterate_projects rejects a concurrency below 1 before any request."""
+    requested: list[httpx.Request] = []
+    client = _paginated_client(95, requested)
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        async for _ in client.projects.aiterate_projects(size=10, concurrency=concurrency):
+            pass
+    assert requested == []
+
+
+async def test_wait_for_many_recommendations() -> None:
+    """Tests that many recommendations can be awaited concurrently."""
+    polls: dict[str, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        recommendation_id = request.url.path.rsplit("/", 1)[-1]
+        polls[recommendation_id] = polls.get(recommendation_id, 0) + 1
+        state = "SUCCESS" if polls[recommendation_id] >= 3 else "PENDING"
+        return httpx.Response(
+            status_code=200, json={"result": {"id": recommendation_id, "state": state}}
+        )
+
+    client = AsyncSlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=httpx.MockTransport(handler)
+    )
+    recommendations = await asyncio.gather(
+        *(
+            client.projects.wait_for_recommendation(
+                project_id="proj", recommendation_id=f"rec_{i}", initial_interval=0.01
+            )
+            for i in range(20)
+        )
+    )
+    assert recommendations == [{"id": f"rec_{i}", "state": "SUCCESS"} for i in range(20)]
+    assert polls == {f"rec_{i}": 3 for i in range(20)}
+
+
+async def test_wait_for_recommendation_timeout(
+    httpx_mock: HTTPXMock, async_client: AsyncSlingshotClient
+) -> None:
+    """Tests that waiting gives up once the timeout has elapsed."""
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{async_client._api_url}/v1/projects/proj/recommendations/rec",
+        json={"result": {"id": "rec", "state": "PENDING"}},
+        is_reusable=True,
+    )
+    with pytest.raises(TimeoutError):
+        await async_client.projects.wait_for_recommendation(
+            project_id="proj", recommendation_id="rec", timeout=0.05, initial_interval=0.01
+        )
+
+
+async def test_wait_for_recommendation_throttled(
+    async_client: AsyncSlingshotClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tests that throttled polls keep polling and other errors are raised."""
+    request = httpx.Request("GET", f"{async_client._api_url}/v1/projects/p/recommendations/r")
+    status_codes = [429, 422]
+
+    async def get_recommendation(project_id: str, recommendation_id: str):
+        await asyncio.sleep(0)
+        response = httpx.Response(
+            status_code=status_codes.pop(0), headers={"Retry-After": "0"}, request=request
+        )
+        raise httpx.HTTPStatusError("error", request=request, response=response)
+
+    monkeypatch.setattr(async_client.projects, "get_recommendation", get_recommendation)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await async_client.projects.wait_for_recommendation(
+            project_id="p", recommendation_id="r", initial_interval=0.01
+        )
+    assert exc_info.value.response.status_code == 422
+    assert status_codes == []
@@ -0,0 +1,298 @@
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from slingshot import AsyncSlingshotClient, ResponseCache, SlingshotClient, ValidatorCache
+from slingshot.cache import _cache_key
+from tests.helpers import FakeTime
+
+API_URL = "https://test.slingshot.capitalone.com/prod/api/gradient"
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    """A response cache with default settings."""
+    return ResponseCache()
+
+
+@pytest.fixture
+def cached_client(api_key: str, httpx_mock: HTTPXMock, cache: ResponseCache) -> SlingshotClient:
+    """A client that uses the `cache` fixture."""
+    return SlingshotClient(api_key=api_key, api_url=API_URL, cache=cache)
+
+
+def test_cache_key_ignores_param_order() -> None:
+    """Test that the same params in a different order map to the same key."""
+    assert _cache_key("/v1/projects/a", {"include": ["id"], "x": "1"}) == _cache_key(
+        "/v1/projects/a", {"x": "1", "include": ["id"]}
+    )
+    assert _cache_key("/v1/projects/a", {}) == "/v1/projects/a"
+
+
+def test_expiry(fake_time: FakeTime) -> None:
+    """Test that responses are served until their time to live has passed."""
+    cache = ResponseCache(ttl=10)
+    cache.put("key", {"a": 1})
+
+    fake_time.now += 9
+    assert cache.get("key") == (True, {"a": 1})
+    fake_time.now += 1
+    assert cache.get("key") == (False, None)
+    assert len(cache) == 0
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "invalidations": 0}
+
+
+def test_lru_eviction() -> None:
+    """Test that the least recently used response is evicted first."""
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_returns_copies() -> None:
+    """Test that modifying a cached response does not change the cache."""
+    cache = ResponseCache()
+    response = {"result": {"name": "before"}}
+    cache.put("key", response)
+    response["result"]["name"] = "after"
+    cache.get("key")[1]["result"]["name"] = "after"
+
+    assert cache.get("key") == (True, {"result": {"name": "before"}})
+
+
+def test_invalidate_only_matches_the_resource() -> None:
+    """Test that invalidation removes a resource and its children but not its siblings."""
+    cache = ResponseCache()
+    for key in (
+        "/v1/projects/ab",
+        "/v1/projects/ab?include=id",
+        "/v1/projects/ab/r/1",
+        "/v1/projects/abc",
+    ):
+        cache.put(key, {})
+
+    cache.invalidate_for_write("/v1/projects/ab/reset")
+    assert [cache.get(key)[0] for key in ("/v1/projects/ab", "/v1/projects/abc")] == [False, True]
+    assert cache.stats()["invalidations"] == 3
+
+    cache.invalidate_for_write("/v1/projects")
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_invalid_max_entries() -> None:
+    """Test that the cache must hold at least one response."""
+    with pytest.raises(ValueError, match="max_entries"):
+        ResponseCache(max_entries=0)
+
+
+def test_get_project_is_cached_per_include(
+    httpx_mock: HTTPXMock, cached_client: SlingshotClient, cache: ResponseCache
+) -> None:
+    """Test that get_project is served from the cache for the same include only."""
+    httpx_mock.add_response(
+        url=f"{API_URL}/v1/projects/proj_1", json={"result": {"id": "proj_1", "name": "Full"}}
+    )
+    httpx_mock.add_response(
+        url=f"{API_URL}/v1/projects/proj_1?include=id", json={"result": {"id": "proj_1"}}
+    )
+
+    for _ in range(3):
+        assert cached_client.projects.get_project("proj_1")["name"] == "Full"
+    assert cached_client.projects.get_project("proj_1", include=["id"]) == {"id": "proj_1"}
+    assert len(httpx_mock.get_requests()) == 2
+    assert cache.stats()["hits"] == 2
+
+
+def test_writes_invalidate_the_project(
+    httpx_mock: HTTPXMock, cached_client: SlingshotClient, cache: ResponseCache
+) -> None:
+    """Test that updating a project drops its cached responses."""
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{API_URL}/v1/projects/proj_1",
+        json={"result": {"id": "proj_1", "name": "Old"}},
+    )
+    httpx_mock.add_response(
+        method="PUT",
+        url=f"{API_URL}/v1/projects/proj_1",
+        json={"result": {"id": "proj_1", "name": "New"}},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{API_URL}/v1/projects/proj_1",
+        json={"result": {"id": "proj_1", "name": "New"}},
+    )
+
+    assert cached_client.projects.get_project("proj_1")["name"] == "Old"
+    cached_client.projects.update("proj_1", name="New")
+    assert cached_client.projects.get_project("proj_1")["name"] == "New"
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_failed_write_invalidates_the_project(
+    httpx_mock: HTTPXMock, cached_client: SlingshotClient, cache: ResponseCache
+) -> None:
+    """Test that a write that fails still drops the cached responses it may have changed."""
+    cache.put("/v1/projects/proj_1", {"result": {"id": "proj_1"}})
+    httpx_mock.add_response(method="DELETE", url=f"{API_URL}/v1/projects/proj_1", status_code=409)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        cached_client.projects.delete("proj_1")
+    assert len(cache) == 0
+
+
+def test_only_terminal_recommendations_are_cached(
+    httpx_mock: HTTPXMock, cached_client: SlingshotClient
+) -> None:
+    """Test that pending recommendations are fetched every time and final ones once."""
+    url = f"{API_URL}/v1/projects/proj_1/recommendations/rec_1"
+    httpx_mock.add_response(url=url, json={"result": {"id": "rec_1", "state": "PENDING"}})
+    httpx_mock.add_response(url=url, json={"result": {"id": "rec_1", "state": "SUCCESS"}})
+
+    states = [
+        cached_client.projects.get_recommendation("proj_1", "rec_1")["state"] for _ in range(3)
+    ]
+    assert states == ["PENDING", "SUCCESS", "SUCCESS"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.anyio
+async def test_async_get_project_is_cached(
+    api_key: str, httpx_mock: HTTPXMock, cache: ResponseCache
+) -> None:
+    """Test that the async client serves get_project from the cache and invalidates on writes."""
+    httpx_mock.add_response(
+        method="GET", url=f"{API_URL}/v1/projects/proj_1", json={"result": {"id": "proj_1"}}
+    )
+    httpx_mock.add_response(
+        method="POST", url=f"{API_URL}/v1/projects/proj_1/reset", status_code=204
+    )
+
+    async with AsyncSlingshotClient(api_key=api_key, api_url=API_URL, cache=cache) as client:
+        await client.projects.get_project("proj_1")
+        await client.projects.get_project("proj_1")
+        await client.projects.reset("proj_1")
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "invalidations": 1}
+
+
+@pytest.fixture
+def validators() -> ValidatorCache:
+    """A validator cache with default settings."""
+    return ValidatorCache()
+
+
+@pytest.fixture
+def conditional_client(
+    api_key: str, httpx_mock: HTTPXMock, validators: ValidatorCache
+) -> SlingshotClient:
+    """A client that uses the `validators` fixture."""
+    return SlingshotClient(api_key=api_key, api_url=API_URL, validator_cache=validators)
+
+
+def test_etag_revalidation(
+    httpx_mock: HTTPXMock, conditional_client: SlingshotClient, validators: ValidatorCache
+) -> None:
+    """Test that a GET repeated with If-None-Match returns the cached body on 304."""
+    url = f"{API_URL}/v1/projects/proj_1"
+    httpx_mock.add_response(url=url, json={"result": {"id": "proj_1"}}, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+    first = conditional_client.projects.get_project("proj_1")
+    first["name"] = "changed by the caller"
+    assert conditional_client.projects.get_project("proj_1") == {"id": "proj_1"}
+    assert validators.stats() == {"hits": 1, "misses": 1, "evictions": 0, "invalidations": 0}
+
+
+def test_last_modified_revalidation(
+    httpx_mock: HTTPXMock, conditional_client: SlingshotClient
+) -> None:
+    """Test that Last-Modified is sent back as If-Modified-Since."""
+    url = f"{API_URL}/v1/projects/proj_1"
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+    httpx_mock.add_response(
+        url=url, json={"result": {"id": "proj_1"}}, headers={"Last-Modified": last_modified}
+    )
+    httpx_mock.add_response(
+        url=url, status_code=304, match_headers={"If-Modified-Since": last_modified}
+    )
+
+    for _ in range(2):
+        assert conditional_client.projects.get_project("proj_1") == {"id": "proj_1"}
+
+
+def test_responses_without_validators_are_not_kept(
+    httpx_mock: HTTPXMock, conditional_client: SlingshotClient, validators: ValidatorCache
+) -> None:
+    """Test that a response without ETag or Last-Modified does not make the next GET conditional."""
+    httpx_mock.add_response(url=f"{API_URL}/v1/projects/proj_1", json={"result": {}})
+
+    conditional_client.projects.get_project("proj_1")
+    assert len(validators) == 0
+    assert "If-None-Match" not in httpx_mock.get_requests()[0].headers
+
+
+def test_writes_drop_validators(
+    httpx_mock: HTTPXMock, conditional_client: SlingshotClient, validators: ValidatorCache
+) -> None:
+    """Test that a write through the client drops the validators of the project."""
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{API_URL}/v1/projects/proj_1",
+        json={"result": {}},
+        headers={"ETag": "a"},
+    )
+    httpx_mock.add_response(method="DELETE", url=f"{API_URL}/v1/projects/proj_1", status_code=204)
+
+    conditional_client.projects.get_project("proj_1")
+    conditional_client.projects.delete("proj_1")
+    assert len(validators) == 0
+    assert validators.stats()["invalidations"] == 1
+
+
+def test_validator_cache_eviction() -> None:
+    """Test that the least recently used validators are evicted first."""
+    validators = ValidatorCache(max_entries=1)
+    response = httpx.Response(200, headers={"ETag": "a"})
+    validators.store("a", response, {})
+    validators.store("b", response, {})
+
+    assert validators.lookup("a") is None
+    assert validators.lookup("b") is not None
+    assert validators.stats()["evictions"] == 1
+    validators.clear()
+    assert len(validators) == 0
+    with pytest.raises(ValueError, match="max_entries"):
+        ValidatorCache(max_entries=0)
+
+
+def test_unexpected_not_modified(httpx_mock: HTTPXMock, client: SlingshotClient) -> None:
+    """Test that a 304 to a request made without validators is an error."""
+    httpx_mock.add_response(url=f"{client._api_url}/TEST", status_code=304)
+
+    with pytest.raises(RuntimeError, match="304"):
+        client._api_request(method="GET", endpoint="/TEST")
+
+
+@pytest.mark.anyio
+async def test_async_etag_revalidation(
+    api_key: str, httpx_mock: HTTPXMock, validators: ValidatorCache
+) -> None:
+    """Test that the async client makes conditional requests as well."""
+    url = f"{API_URL}/v1/projects/proj_1/recommendations/rec_1"
+    httpx_mock.add_response(url=url, json={"result": {"state": "PENDING"}}, headers={"ETag": "a"})
+    httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": "a"})
+
+    async with AsyncSlingshotClient(
+        api_key=api_key, api_url=API_URL, validator_cache=validators
+    ) as client:
+        for _ in range(2):
+            recommendation = await client.projects.get_recommendation("proj_1", "rec_1")
+            assert recommendation == {"state": "PENDING"}
+    assert validators.stats()["hits"] == 1
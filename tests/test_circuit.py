@@ -0,0 +1,199 @@
+from typing import Any
+
+import httpx
+import pytest
+
+from slingshot import (
+    AsyncSlingshotClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    SlingshotClient,
+)
+from tests.helpers import FakeTime
+
+
+def _fail(breaker: CircuitBreaker, endpoint: str, times: int) -> None:
+    """Record `times` failed requests to `endpoint`."""
+    for _ in range(times):
+        breaker.record(breaker.before_request(endpoint), failed=True)
+
+
+def test_opens_after_consecutive_failures(fake_time: FakeTime) -> None:
+    """Test that the circuit opens after the threshold and a success resets the count."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+    _fail(breaker, "/v1/projects", 2)
+    breaker.record(breaker.before_request("/v1/projects"), failed=False)
+    _fail(breaker, "/v1/projects", 2)
+    assert breaker.state("/v1/projects") == "closed"
+
+    _fail(breaker, "/v1/projects/abc", 1)
+    assert breaker.state("/v1/projects") == "open"
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_request("/v1/projects/abc/recommendations")
+    assert exc_info.value.group == "/v1/projects"
+    assert exc_info.value.retry_in == pytest.approx(10)
+
+
+def test_half_open_trial(fake_time: FakeTime) -> None:
+    """Test that one trial is let through after the timeout and decides the next state."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    _fail(breaker, "/v1/projects", 1)
+
+    fake_time.now += 10
+    group = breaker.before_request("/v1/projects")
+    assert breaker.state("/v1/projects") == "half-open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("/v1/projects")
+
+    breaker.record(group, failed=True)
+    assert breaker.state("/v1/projects") == "open"
+
+    fake_time.now += 10
+    breaker.record(breaker.before_request("/v1/projects"), failed=False)
+    assert breaker.state("/v1/projects") == "closed"
+
+
+def test_stale_trial_is_replaced(fake_time: FakeTime) -> None:
+    """Test that a trial that never reports back does not keep the circuit half-open forever."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    _fail(breaker, "/v1/projects", 1)
+    fake_time.now += 10
+    breaker.before_request("/v1/projects")
+
+    fake_time.now += 10
+    assert breaker.before_request("/v1/projects") == "/v1/projects"
+
+
+def test_cancelled_trial_is_released(fake_time: FakeTime) -> None:
+    """Test that a trial that ends without an outcome lets the next request make the trial."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.cancel(breaker.before_request("/v1/projects"))
+    assert breaker.state("/v1/projects") == "closed"
+    _fail(breaker, "/v1/projects", 1)
+    fake_time.now += 10
+
+    breaker.cancel(breaker.before_request("/v1/projects"))
+
+    assert breaker.state("/v1/projects") == "open"
+    assert breaker.before_request("/v1/projects") == "/v1/projects"
+
+
+def test_groups_are_independent(fake_time: FakeTime) -> None:
+    """Test that an open circuit does not affect other endpoint groups."""
+    breaker = CircuitBreaker(failure_threshold=1, group_by=lambda endpoint: endpoint)
+    _fail(breaker, "/v1/projects/a", 1)
+
+    assert breaker.state("/v1/projects/a") == "open"
+    assert breaker.before_request("/v1/projects/b") == "/v1/projects/b"
+
+
+def test_invalid_threshold() -> None:
+    """Test that the failure threshold must be positive."""
+    with pytest.raises(ValueError, match="failure_threshold"):
+        CircuitBreaker(failure_threshold=0)
+
+
+def test_open_circuit_stops_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a request fails fast once its own retries open the circuit."""
+    monkeypatch.setattr("slingshot.client.time.sleep", lambda _: None)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503)
+
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+    )
+
+    with pytest.raises(CircuitOpenError):
+        client._api_request("GET", "/v1/projects/abc")
+    assert len(requests) == 2
+    with pytest.raises(CircuitOpenError):
+        client._api_request("GET", "/v1/projects")
+    assert len(requests) == 2
+
+
+def test_client_errors_do_not_open_the_circuit() -> None:
+    """Test that 4xx responses count as successes and transport errors as failures."""
+    responses = [httpx.ConnectError("refused"), httpx.Response(404), httpx.ConnectError("refused")]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    breaker = CircuitBreaker(failure_threshold=2)
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        circuit_breaker=breaker,
+    )
+
+    for error in (httpx.ConnectError, httpx.HTTPStatusError, httpx.ConnectError):
+        with pytest.raises(error):
+            client._api_request("GET", "/v1/projects")
+    assert breaker.state("/v1/projects") == "closed"
+
+
+def test_errors_around_the_trial_do_not_block_the_circuit(fake_time: FakeTime) -> None:
+    """Test that errors before or while sending the trial do not leave the circuit half-open."""
+    responses: list = [httpx.Response(503), RuntimeError("interrupted"), httpx.Response(204)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker=breaker,
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        client._api_request("GET", "/v1/projects")
+    fake_time.now += 10
+
+    unencodable: Any = {"name": object()}
+    with pytest.raises(TypeError):
+        client._api_request("POST", "/v1/projects", json=unencodable)
+    assert breaker.state("/v1/projects") == "open"
+    with pytest.raises(RuntimeError, match="interrupted"):
+        client._api_request("GET", "/v1/projects")
+    assert breaker.state("/v1/projects") == "open"
+    assert client._api_request("GET", "/v1/projects") is None
+    assert breaker.state("/v1/projects") == "closed"
+
+
+@pytest.mark.anyio
+async def test_async_client_fails_fast() -> None:
+    """Test that the async client raises CircuitOpenError without sending the request."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(500)
+
+    async with AsyncSlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker=CircuitBreaker(failure_threshold=1),
+    ) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._api_request("GET", "/v1/projects")
+        with pytest.raises(CircuitOpenError):
+            await client._api_request("GET", "/v1/projects")
+    assert len(requests) == 1
@@ -1,10 +1,15 @@
+import time
+from email.utils import formatdate
 from importlib.metadata import version as get_version
-from typing import Literal
+from typing import Literal, Optional, cast
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from slingshot.client import SlingshotClient
+from slingshot import RetryPolicy
+from slingshot.client import SlingshotClient, _remove_unset_keys, _retry_after_seconds
+from slingshot.types import UNSET
 
 __version__ = get_version("c1s-slingshot-sdk-py")
 
@@ -148,3 +153,160 @@ def test_response_204(httpx_mock: HTTPXMock, client: SlingshotClient, method: st
 
     # pyright is not happy with method: str against str Literal methods...
     assert client._api_request(method=method, endpoint="/TEST") is None  # pyright: ignore
+
+
+def test_custom_transport() -> None:
+    """Test that requests are sent through an injected transport."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code=200, json={"success": True})
+
+    client = SlingshotClient(api_key="test_api_key", transport=httpx.MockTransport(handler))
+    assert client._api_request(method="GET", endpoint="/TEST") == {"success": True}
+    assert client._api_request(method="GET", endpoint="/TEST") == {"success": True}
+
+    assert len(requests) == 2
+    assert str(requests[0].url) == f"{DEFAULT_API_URL}/TEST"
+    assert requests[0].headers["Auth"] == "test_api_key"
+    assert (
+        requests[0].headers["User-Agent"]
+        == f"Slingshot Library/{__version__} (c1s-slingshot-sdk-py)"
+    )
+
+
+def test_timeout_and_limits() -> None:
+    """Test that the timeout and pool limits are passed to the HTTP client."""
+    limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+    client = SlingshotClient(api_key="test_api_key", timeout=12.5, limits=limits)
+    assert client._http.timeout == httpx.Timeout(12.5)
+    pool = client._http._transport._pool  # pyright: ignore
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+
+
+def test_close() -> None:
+    """Test that a closed client refuses to send requests."""
+    client = SlingshotClient(
+        api_key="test_api_key",
+        transport=httpx.MockTransport(lambda request: httpx.Response(status_code=204)),
+    )
+    client.close()
+    assert client._http.is_closed
+    with pytest.raises(RuntimeError):
+        client._api_request(method="GET", endpoint="/TEST")
+
+
+def test_context_manager() -> None:
+    """Test that the client closes its connections when used as a context manager."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(status_code=204))
+    with SlingshotClient(api_key="test_api_key", transport=transport) as client:
+        assert client._api_request(method="GET", endpoint="/TEST") is None
+        assert not client._http.is_closed
+    assert client._http.is_closed
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({}, None),
+        ({"Retry-After": "3"}, 3.0),
+        ({"Retry-After": "0.5"}, 0.5),
+        ({"Retry-After": "-1"}, 0.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+def test_retry_after_seconds(headers: dict[str, str], expected: Optional[float]) -> None:
+    """Test parsing of the Retry-After header."""
+    response = httpx.Response(status_code=429, headers=headers)
+    assert _retry_after_seconds(response) == expected
+
+
+def test_retry_after_date_in_future() -> None:
+    """Test that a Retry-After date is converted into a delay from now."""
+    retry_at = formatdate(time.time() + 30, usegmt=True)
+    response = httpx.Response(status_code=429, headers={"Retry-After": retry_at})
+    assert 28 < cast(float, _retry_after_seconds(response)) <= 30
+
+
+def test_429_pauses_backpressure(
+    httpx_mock: HTTPXMock, client: SlingshotClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a 429 response starts a pause that batch operations wait for."""
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    httpx_mock.add_response(
+        url=f"{client._api_url}/TEST", status_code=429, headers={"Retry-After": "60"}
+    )
+    httpx_mock.add_response(url=f"{client._api_url}/TEST", status_code=204)
+    assert client._api_request(method="GET", endpoint="/TEST") is None
+    assert client._backpressure._resume_at > time.monotonic() + 55
+    monkeypatch.undo()
+
+    client._backpressure._resume_at = 0.0
+    start = time.monotonic()
+    client._backpressure.pause(0.1)
+    client._backpressure.wait()
+    assert time.monotonic() - start >= 0.1
+
+
+def test_backpressure_is_capped_by_the_retry_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the pause after a 429 without Retry-After never exceeds max_retry_after."""
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    responses = iter([httpx.Response(429), httpx.Response(204)])
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(lambda request: next(responses)),
+        retry_policy=RetryPolicy(max_retry_after=0.01),
+    )
+    before = time.monotonic()
+    assert client._api_request(method="GET", endpoint="/TEST") is None
+    assert client._backpressure._resume_at <= time.monotonic() + 0.01
+    assert client._backpressure._resume_at > before
+
+
+def test_remove_unset_keys() -> None:
+    """Test that UNSET values are removed at any depth without touching the payload."""
+    unchanged = {"sla_minutes": 30, "tags": ["a", "b"]}
+    payload = {
+        "name": "a",
+        "description": UNSET,
+        "settings": unchanged,
+        "steps": [{"id": 1, "note": UNSET}, UNSET, 2],
+    }
+
+    cleaned = _remove_unset_keys(payload)
+
+    assert cleaned == {"name": "a", "settings": unchanged, "steps": [{"id": 1}, 2]}
+    assert payload["description"] is UNSET
+    assert payload["steps"] == [{"id": 1, "note": UNSET}, UNSET, 2]
+    # Dicts and lists without UNSET values are not copied.
+    assert isinstance(cleaned, dict)
+    assert cleaned["settings"] is unchanged
+
+
+def test_remove_unset_keys_without_unset() -> None:
+    """Test that a payload without UNSET values is returned as is."""
+    payload = {"name": "a", "settings": {"sla_minutes": 30}, "tags": ["a", {"b": None}]}
+    assert _remove_unset_keys(payload) is payload
+    assert _remove_unset_keys(None) is None
+
+
+def test_create_and_update_skip_unset_removal(
+    httpx_mock: HTTPXMock, client: SlingshotClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the payloads of create and update, built without UNSET values, are not walked."""
+
+    def fail(obj: object) -> object:
+        raise AssertionError("the payload was walked")
+
+    monkeypatch.setattr("slingshot.client._remove_unset_keys", fail)
+    httpx_mock.add_response(json={"result": {"id": "proj_1"}}, is_reusable=True)
+
+    client.projects.create(name="a", workspace_id="ws", settings={"sla_minutes": 30})
+    client.projects.update("proj_1", description="b")
+    with pytest.raises(AssertionError, match="walked"):
+        client._api_request("POST", "/v1/projects", json={"name": "a"})
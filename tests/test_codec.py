@@ -0,0 +1,122 @@
+import importlib
+from typing import Any
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, JSONCodec, OrjsonCodec, SlingshotClient
+from slingshot.codec import default_codec
+
+PAYLOAD = {"name": "Projet é", "settings": {"sla_minutes": 30, "tags": ["a", "b"]}, "x": None}
+
+
+class RecordingCodec(JSONCodec):
+    """A codec that records what it encodes and decodes."""
+
+    def __init__(self) -> None:
+        """Start with nothing recorded."""
+        self.encoded: list[Any] = []
+        self.decoded: list[bytes] = []
+
+    def dumps(self, obj: Any) -> bytes:
+        """Record and encode `obj`."""
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Record and decode `data`."""
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+def _hide_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make importing orjson fail, as if it were not installed."""
+    import_module = importlib.import_module
+
+    def fake_import(name: str, package: Any = None) -> Any:
+        if name == "orjson":
+            raise ImportError("No module named 'orjson'")
+        return import_module(name, package)
+
+    monkeypatch.setattr("slingshot.codec.importlib.import_module", fake_import)
+
+
+def test_stdlib_codec_encodes_like_httpx() -> None:
+    """Test that the stdlib codec encodes bodies exactly as httpx's `json=` does."""
+    expected = httpx.Request("POST", "https://test", json=PAYLOAD).read()
+    assert JSONCodec().dumps(PAYLOAD) == expected
+    assert JSONCodec().loads(expected) == PAYLOAD
+
+
+def test_stdlib_codec_rejects_nan() -> None:
+    """Test that NaN, which is not valid JSON, cannot be encoded."""
+    with pytest.raises(ValueError):
+        JSONCodec().dumps({"value": float("nan")})
+
+
+def test_orjson_codec_round_trip() -> None:
+    """Test that the orjson codec encodes and decodes like the stdlib codec."""
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+    assert codec.dumps(PAYLOAD) == JSONCodec().dumps(PAYLOAD)
+    assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+    assert repr(codec) == "OrjsonCodec()"
+
+
+def test_default_codec_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the stdlib codec is used when orjson is not installed."""
+    _hide_orjson(monkeypatch)
+    assert type(default_codec()) is JSONCodec
+    with pytest.raises(ImportError, match=r"\[fast\]"):
+        OrjsonCodec()
+
+
+def test_default_codec_prefers_orjson() -> None:
+    """Test that orjson is used when it is installed."""
+    pytest.importorskip("orjson")
+    assert type(default_codec()) is OrjsonCodec
+
+
+def test_client_uses_codec() -> None:
+    """Test that the client encodes request bodies and decodes responses with its codec."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"result": {"id": "proj_1"}})
+
+    codec = RecordingCodec()
+    client = SlingshotClient(
+        api_key="test", api_url="https://test", transport=httpx.MockTransport(handler), codec=codec
+    )
+    assert client._api_request("POST", "/v1/projects", json=PAYLOAD) == {"result": {"id": "proj_1"}}
+    assert codec.encoded == [PAYLOAD]
+    assert codec.decoded == [b'{"result":{"id":"proj_1"}}']
+    assert requests[0].headers["content-type"] == "application/json"
+    assert codec.loads(requests[0].read()) == PAYLOAD
+
+    client._api_request("GET", "/v1/projects")
+    assert len(codec.encoded) == 1
+    assert requests[1].read() == b""
+    assert "content-type" not in requests[1].headers
+
+
+@pytest.mark.anyio
+async def test_async_client_uses_codec() -> None:
+    """Test that the async client encodes request bodies and decodes responses with its codec."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"result": {"id": "proj_1"}})
+
+    codec = RecordingCodec()
+    async with AsyncSlingshotClient(
+        api_key="test", api_url="https://test", transport=httpx.MockTransport(handler), codec=codec
+    ) as client:
+        await client._api_request("PUT", "/v1/projects/proj_1", json=PAYLOAD)
+
+    assert codec.encoded == [PAYLOAD]
+    assert len(codec.decoded) == 1
+    assert requests[0].headers["content-type"] == "application/json"
+    assert codec.loads(requests[0].read()) == PAYLOAD
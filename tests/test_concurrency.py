@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from slingshot._concurrency import run_concurrently
+
+
+def test_run_concurrently_bounds_calls_in_flight() -> None:
+    """Tests that no more than max_workers calls run at the same time."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def work(item: int) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return item * 2
+
+    results = dict(run_concurrently(work, range(40), max_workers=4))
+
+    assert peak <= 4
+    assert {item: outcome["result"] for item, outcome in results.items()} == {
+        item: item * 2 for item in range(40)
+    }
+
+
+def test_run_concurrently_captures_errors() -> None:
+    """Tests that an exception is reported in the result of its item."""
+
+    def work(item: int) -> int:
+        if item == 3:
+            raise KeyError(item)
+        return item
+
+    results = dict(run_concurrently(work, range(5), max_workers=2))
+
+    assert isinstance(results[3]["error"], KeyError)
+    assert results[3]["result"] is None
+    assert results[4] == {"result": 4, "error": None}
+
+
+def test_run_concurrently_consumes_items_lazily() -> None:
+    """Tests that closing the generator early stops consuming the items."""
+    consumed: list[int] = []
+
+    def items():
+        for item in range(1000):
+            consumed.append(item)
+            yield item
+
+    results = run_concurrently(lambda item: item, items(), max_workers=3)
+    next(results)
+    results.close()
+
+    assert len(consumed) <= 4
+
+
+def test_run_concurrently_rejects_invalid_max_workers() -> None:
+    """Tests that max_workers must be positive."""
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        list(run_concurrently(lambda item: item, [1], max_workers=0))
@@ -0,0 +1,95 @@
+import importlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slingshot import SlingshotClient
+from slingshot.export import COLUMNS, project_schema, record_batches, to_table, write_parquet
+from slingshot.testing import FakeSlingshotServer
+
+PROJECT: Any = {
+    "id": "abc",
+    "name": "ETL",
+    "job_id": "42",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-02T12:30:00.5Z",
+    "settings": {"sla_minutes": 60, "auto_apply_recs": True, "optimize_instance_size": False},
+    "metrics": {"job_success_rate_percent": 95, "sla_met_percent": 80.5, "estimated_savings": 1200},
+}
+
+
+def test_flattened_columns() -> None:
+    """Test that nested fields are flattened into typed columns, with None for missing ones."""
+    pa = pytest.importorskip("pyarrow")
+    partial: Any = {"id": "def", "settings": None}
+    table = to_table([PROJECT, partial])
+
+    assert table.schema == project_schema()
+    assert table.column_names == list(COLUMNS)
+    first, second = table.to_pylist()
+    assert first["settings_sla_minutes"] == 60
+    assert first["settings_auto_apply_recs"] is True
+    assert first["metrics_sla_met_percent"] == 80.5
+    assert first["metrics_estimated_savings"] == 1200.0
+    assert first["updated_at"].isoformat() == "2024-01-02T12:30:00.500000+00:00"
+    assert first["description"] is None
+    assert second["id"] == "def"
+    assert second["settings_sla_minutes"] is None
+    assert second["metrics_estimated_savings"] is None
+    assert table.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+
+
+def test_batches_are_built_as_projects_are_iterated() -> None:
+    """Test that at most a batch of projects is consumed before it is yielded."""
+    pytest.importorskip("pyarrow")
+    consumed = 0
+
+    def projects() -> Iterator[Any]:
+        """Yield copies of a project, counting them."""
+        nonlocal consumed
+        for i in range(5):
+            consumed += 1
+            yield {**PROJECT, "id": str(i)}
+
+    batches = record_batches(projects(), batch_size=2)
+    assert next(batches).num_rows == 2
+    assert consumed == 2
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert list(record_batches([])) == []
+    with pytest.raises(ValueError, match="batch_size"):
+        next(record_batches([], batch_size=0))
+
+
+def test_write_parquet(tmp_path: Path) -> None:
+    """Test that the projects listed by the API are written to a Parquet file."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "projects.parquet"
+    with FakeSlingshotServer() as server:
+        server.add_projects(25)
+        with SlingshotClient(api_key="test", api_url=server.url) as client:
+            rows = write_parquet(client.projects.iterate_projects(size=10), path, batch_size=10)
+
+    assert rows == 25
+    metadata = parquet.ParquetFile(path).metadata
+    assert (metadata.num_rows, metadata.num_row_groups) == (25, 3)
+    table = parquet.read_table(path)
+    assert table.schema == project_schema()
+    assert table.column("metrics_job_success_rate_percent").null_count == 0
+    assert table.column("job_id").to_pylist()[:2] == ["100000000", "100000001"]
+
+
+def test_requires_pyarrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the export explains how to install pyarrow when it is missing."""
+    import_module = importlib.import_module
+
+    def fake_import(name: str, package: Any = None) -> Any:
+        """Fail to import pyarrow, as if it were not installed."""
+        if name.startswith("pyarrow"):
+            raise ImportError(f"No module named {name!r}")
+        return import_module(name, package)
+
+    monkeypatch.setattr("slingshot.export.importlib.import_module", fake_import)
+    with pytest.raises(ImportError, match=r"\[arrow\]"):
+        to_table([PROJECT])
@@ -0,0 +1,282 @@
+import json
+import logging
+from typing import Any
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, RequestHooks, RetryPolicy, SlingshotClient
+from slingshot.hooks import _endpoint_template
+from slingshot.testing import FakeSlingshotServer
+from slingshot.types import (
+    ErrorEvent,
+    OperationEndEvent,
+    OperationEvent,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+)
+from tests.helpers import mock_client
+
+
+class RecordingHooks(RequestHooks):
+    """Hooks that record the events they receive."""
+
+    def __init__(self) -> None:
+        """Start without events."""
+        self.events: list[tuple[str, Any]] = []
+
+    def on_operation_start(self, event: OperationEvent) -> None:
+        """Record the start of an operation."""
+        self.events.append(("operation_start", event))
+
+    def on_operation_end(self, event: OperationEndEvent) -> None:
+        """Record the end of an operation."""
+        self.events.append(("operation_end", event))
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Record the start of an attempt."""
+        self.events.append(("start", event))
+
+    def on_response(self, event: ResponseEvent) -> None:
+        """Record a successful attempt."""
+        self.events.append(("response", event))
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Record a retried attempt."""
+        self.events.append(("retry", event))
+
+    def on_error(self, event: ErrorEvent) -> None:
+        """Record a failed attempt."""
+        self.events.append(("error", event))
+
+
+@pytest.mark.parametrize(
+    "endpoint, template",
+    [
+        ("/v1/projects", "/v1/projects"),
+        ("/v1/projects/abc", "/v1/projects/{project_id}"),
+        ("/v1/projects/abc/reset", "/v1/projects/{project_id}/reset"),
+        (
+            "/v1/projects/abc/recommendations/def/apply",
+            "/v1/projects/{project_id}/recommendations/{recommendation_id}/apply",
+        ),
+        ("/v1/projects/abc?include=creator", "/v1/projects/{project_id}"),
+    ],
+)
+def test_endpoint_template(endpoint: str, template: str) -> None:
+    """Test that the IDs of an endpoint are replaced by placeholders."""
+    assert _endpoint_template(endpoint) == template
+
+
+def test_retried_request() -> None:
+    """Test the events of a request that succeeds after a retry."""
+    responses = iter([httpx.Response(503), httpx.Response(200, json={"result": {"id": "abc"}})])
+    hooks = RecordingHooks()
+    with mock_client(lambda request: next(responses), hooks=[hooks]) as client:
+        client.projects.get_project("abc")
+
+    assert [(kind, event.get("attempt")) for kind, event in hooks.events] == [
+        ("operation_start", None),
+        ("start", 1),
+        ("retry", 1),
+        ("start", 2),
+        ("response", 2),
+        ("operation_end", None),
+    ]
+    retry = hooks.events[2][1]
+    assert retry["status_code"] == 503
+    assert retry["delay"] == 0.001
+    response = hooks.events[4][1]
+    assert response["method"] == "GET"
+    assert response["endpoint"] == "/v1/projects/abc"
+    assert response["endpoint_template"] == "/v1/projects/{project_id}"
+    assert response["status_code"] == 200
+    assert response["timings"]["decode"] > 0
+    assert response["timings"]["total"] >= response["timings"]["decode"]
+
+
+def test_failed_requests() -> None:
+    """Test that errors raised to the caller are reported, with the status code if any."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Respond 404 to projects and fail to connect for the rest."""
+        if request.url.path.startswith("/v1/projects/"):
+            return httpx.Response(404)
+        raise httpx.ConnectError("refused", request=request)
+
+    hooks = RecordingHooks()
+    with mock_client(handler, hooks=[hooks]) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.projects.get_project("abc")
+        with pytest.raises(httpx.ConnectError):
+            client.projects.get_projects()
+
+    errors = [event for kind, event in hooks.events if kind == "error"]
+    assert [kind for kind, _ in hooks.events] == [
+        "operation_start",
+        "start",
+        "error",
+        "operation_end",
+    ] * 2
+    assert errors[0]["status_code"] == 404
+    assert errors[1]["status_code"] is None
+    assert isinstance(errors[1]["error"], httpx.ConnectError)
+
+
+def test_network_timings() -> None:
+    """Test that the timings break down requests sent over a real connection."""
+    hooks = RecordingHooks()
+    with FakeSlingshotServer(latency=0.05) as server:
+        project_id = server.add_project("ETL")["id"]
+        with SlingshotClient(api_key="test", api_url=server.url, hooks=[hooks]) as client:
+            client.projects.get_project(project_id)
+            client.projects.get_project(project_id)
+
+    first, second = (event["timings"] for kind, event in hooks.events if kind == "response")
+    assert first["connect"] > 0
+    assert second["connect"] == 0
+    assert second["tls"] == 0
+    for timings in (first, second):
+        assert timings["server"] >= 0.05
+        assert timings["send"] > 0
+        assert timings["download"] > 0
+        assert timings["queue"] > 0
+        assert timings["total"] >= sum(
+            timings[phase] for phase in ("connect", "send", "server", "download", "decode")
+        )
+
+
+def test_streamed_pages() -> None:
+    """Test that the attempts of streamed pages are reported."""
+    hooks = RecordingHooks()
+    with FakeSlingshotServer() as server:
+        server.add_projects(25)
+        with SlingshotClient(api_key="test", api_url=server.url, hooks=[hooks]) as client:
+            assert len(list(client.projects.iterate_projects(size=10, stream=True))) == 25
+
+    responses = [event for kind, event in hooks.events if kind == "response"]
+    assert len(responses) == 3
+    assert all(event["timings"]["server"] > 0 for event in responses)
+
+
+def test_failing_hook_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that an exception raised by a hook does not fail the request."""
+
+    class FailingHooks(RequestHooks):
+        """Hooks that fail on every response."""
+
+        def on_response(self, event: ResponseEvent) -> None:
+            """Fail."""
+            raise ValueError("broken hook")
+
+    recording = RecordingHooks()
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(204)),
+        hooks=[FailingHooks(), recording],
+    )
+    with caplog.at_level(logging.ERROR, logger="slingshot.hooks"):
+        assert client._api_request("GET", "/v1/projects") is None
+    assert "FailingHooks.on_response failed" in caplog.text
+    assert [kind for kind, _ in recording.events] == ["start", "response"]
+
+
+@pytest.mark.anyio
+async def test_async_client() -> None:
+    """Test that the async client reports the same events with network timings."""
+    hooks = RecordingHooks()
+    with FakeSlingshotServer() as server:
+        server.inject(429, retry_after=0.001)
+        project_id = server.add_project("ETL")["id"]
+        async with AsyncSlingshotClient(
+            api_key="test",
+            api_url=server.url,
+            retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+            hooks=[hooks],
+        ) as client:
+            await client.projects.get_project(project_id)
+
+    assert [kind for kind, _ in hooks.events] == [
+        "operation_start",
+        "start",
+        "retry",
+        "start",
+        "response",
+        "operation_end",
+    ]
+    assert hooks.events[2][1]["status_code"] == 429
+    response = hooks.events[4][1]
+    assert response["status_code"] == 200
+    assert response["timings"]["server"] > 0
+    assert response["timings"]["connect"] == 0
+
+
+def test_operations() -> None:
+    """Test that the attempts of an operation name it, and nested operations their parent."""
+    hooks = RecordingHooks()
+    with FakeSlingshotServer() as server:
+        server.add_projects(25)
+        with SlingshotClient(api_key="test", api_url=server.url, hooks=[hooks]) as client:
+            projects = client.projects.iterate_projects(size=10)
+            for _ in range(11):
+                next(projects)
+            assert [kind for kind, _ in hooks.events].count("operation_end") == 2
+            projects.close()
+            with pytest.raises(httpx.HTTPStatusError):
+                client.projects.get_project("missing")
+
+    starts = {e["operation_id"]: e for kind, e in hooks.events if kind == "operation_start"}
+    ends = [event for kind, event in hooks.events if kind == "operation_end"]
+    iteration, first_page, second_page, get = starts.values()
+    assert iteration["name"] == "ProjectAPI.iterate_projects"
+    assert iteration["parent_id"] is None
+    assert first_page["name"] == second_page["name"] == "ProjectAPI.get_projects"
+    assert first_page["parent_id"] == second_page["parent_id"] == iteration["operation_id"]
+    assert get["parent_id"] is None
+    # The iteration lasts until it is closed, after the pages it fetched.
+    assert [event["operation_id"] for event in ends][-2:] == [
+        iteration["operation_id"],
+        get["operation_id"],
+    ]
+    assert all(event["duration"] > 0 for event in ends)
+    assert isinstance(ends[-1]["error"], httpx.HTTPStatusError)
+    assert ends[-2]["error"] is None
+    for kind, event in hooks.events:
+        if kind == "start":
+            assert starts[event["operation_id"]]["name"] == event["operation"]
+            assert event["operation"] != "ProjectAPI.iterate_projects"
+
+
+def test_bytes_transferred() -> None:
+    """Test that attempts report the size of the request and response bodies."""
+    hooks = RecordingHooks()
+    with FakeSlingshotServer() as server:
+        project_id = server.add_project("ETL")["id"]
+        with SlingshotClient(api_key="test", api_url=server.url, hooks=[hooks]) as client:
+            project = client.projects.update(project_id, name="Nightly ETL")
+
+    (response,) = [event for kind, event in hooks.events if kind == "response"]
+    assert response["bytes_sent"] == len(b'{"name":"Nightly ETL"}')
+    assert response["bytes_received"] == len(json.dumps({"result": project}))
+
+
+@pytest.mark.anyio
+async def test_async_operations() -> None:
+    """Test that the operations of the async client are reported."""
+    hooks = RecordingHooks()
+    with FakeSlingshotServer() as server:
+        server.add_projects(5)
+        async with AsyncSlingshotClient(
+            api_key="test", api_url=server.url, hooks=[hooks]
+        ) as client:
+            assert len([p async for p in client.projects.aiterate_projects(size=10)]) == 5
+            await client.projects.get_projects()
+
+    names = [event["name"] for kind, event in hooks.events if kind == "operation_end"]
+    assert names == [
+        "AsyncProjectAPI.get_projects",
+        "AsyncProjectAPI.aiterate_projects",
+        "AsyncProjectAPI.get_projects",
+    ]
@@ -0,0 +1,84 @@
+import logging
+import time
+
+import httpx
+import pytest
+
+from slingshot import ProjectIndex, SlingshotClient
+from slingshot.testing import FakeSlingshotServer
+
+
+@pytest.fixture
+def fake_server(fake_server: FakeSlingshotServer) -> FakeSlingshotServer:
+    """The fake server, with projects of two workspaces."""
+    for i in range(5):
+        fake_server.add_project(
+            f"Project {i}",
+            workspace_id=f"workspace-{i % 2}",
+            app_id=f"app-{i}",
+            job_id=str(i % 4),
+            cluster_path=f"job_clusters/cluster-{i % 3}",
+        )
+    return fake_server
+
+
+def test_lookups(fake_server: FakeSlingshotServer, fake_client: SlingshotClient) -> None:
+    """Test that the projects are found by their IDs without requests."""
+    index = ProjectIndex(fake_client, size=2)
+    requests = fake_server.stats()["requests"]
+    projects = list(fake_client.projects.iterate_projects())
+
+    assert len(index) == 5
+    assert list(index) == projects
+    assert index.get(str(projects[1]["id"])) == projects[1]
+    assert index.get("missing") is None
+    assert projects[1]["id"] in index
+    assert index.find(app_id="app-3") == [projects[3]]
+    assert index.find(job_id="0") == [projects[0], projects[4]]
+    assert index.find(job_id="0", workspace_id="workspace-0") == [projects[0], projects[4]]
+    assert index.find(job_id="1", workspace_id="workspace-0") == []
+    assert index.find(cluster_path="job_clusters/cluster-2") == [projects[2]]
+    assert index.find(workspace_id="missing") == []
+    assert index.find() == projects
+    assert fake_server.stats()["requests"] == requests + 1
+    assert 0 <= index.age < 60
+    assert repr(index) == "ProjectIndex(projects=5, refresh_interval=None)"
+
+
+def test_refresh(fake_server: FakeSlingshotServer, fake_client: SlingshotClient) -> None:
+    """Test that a refresh replaces the projects, and that a failed one keeps them."""
+    index = ProjectIndex(fake_client)
+    fake_server.add_project("New", job_id="42")
+    assert index.find(job_id="42") == []
+
+    index.refresh()
+    assert [project["name"] for project in index.find(job_id="42")] == ["New"]
+    fake_server.inject(404)
+    with pytest.raises(httpx.HTTPStatusError):
+        index.refresh()
+    assert len(index) == 6
+
+
+def test_background_refresh(
+    fake_server: FakeSlingshotServer, fake_client: SlingshotClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the index refreshes itself until it is closed, logging failed refreshes."""
+    with caplog.at_level(logging.WARNING, logger="slingshot.index"):
+        with ProjectIndex(fake_client, refresh_interval=0.05) as index:
+            # The first refresh fails and the next one finds the new project.
+            fake_server.inject(404)
+            fake_server.add_project("New", job_id="42")
+            deadline = time.monotonic() + 5
+            while not index.find(job_id="42") and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert index.find(job_id="42")
+        requests = fake_server.stats()["requests"]
+        time.sleep(0.2)
+    assert fake_server.stats()["requests"] == requests
+    assert "Refreshing the project index failed" in caplog.text
+
+
+def test_invalid_refresh_interval(fake_client: SlingshotClient) -> None:
+    """Test that the refresh interval must be positive."""
+    with pytest.raises(ValueError, match="positive"):
+        ProjectIndex(fake_client, refresh_interval=0)
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from slingshot._jsonstream import ArrayFieldParser
+
+DOCUMENT = json.dumps(
+    {
+        "page": 2,
+        "items": [{"id": i, "name": "é" * i, "values": [1.5e3, None, True]} for i in range(20)],
+        "pages": 12345,
+    },
+    indent=1,
+)
+
+
+def _parse(text: str, chunk_size: int) -> tuple[list, dict]:
+    """Feed `text` to a parser in chunks, returning the items and the other fields."""
+    parser = ArrayFieldParser("items")
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items += parser.feed(text[start : start + chunk_size])
+    items += parser.feed("", final=True)
+    return items, parser.rest
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, len(DOCUMENT)])
+def test_any_chunking(chunk_size: int) -> None:
+    """Test that the result does not depend on where the chunks are split."""
+    expected = json.loads(DOCUMENT)
+    items, rest = _parse(DOCUMENT, chunk_size)
+
+    assert items == expected.pop("items")
+    assert rest == expected
+
+
+def test_items_are_returned_as_soon_as_complete() -> None:
+    """Test that each item is returned by the chunk that completes it."""
+    parser = ArrayFieldParser("items")
+
+    assert parser.feed('{"items": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(": 2}, 3") == [{"id": 2}]
+    # The number may continue in the next chunk.
+    assert parser.feed("4]}") == [34]
+    assert parser.feed("", final=True) == []
+
+
+def test_empty_array() -> None:
+    """Test that an empty array has no items."""
+    assert _parse('{"items": [], "pages": 0}', 1) == ([], {"pages": 0})
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ('{"items": [{"id": 1}', "Incomplete"),
+        ('{"items": []} {}', "Extra data"),
+        ('{"pages": 1}', "no 'items' array"),
+        ("{}", "no 'items' array"),
+        ('[{"id": 1}]', "Expected {"),
+        ('{"items": [1 2]}', "Expected , or ]"),
+        ('{"items": {}}', "Expected \\["),
+        ('{1: "a"}', "string key"),
+    ],
+)
+def test_invalid_documents(text: str, message: str) -> None:
+    """Test that malformed documents raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        _parse(text, 4)
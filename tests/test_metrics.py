@@ -0,0 +1,155 @@
+import math
+from typing import Any
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, MetricsRegistry, SlingshotClient
+from slingshot.metrics import format_prometheus
+from slingshot.testing import FakeSlingshotServer
+from tests.helpers import mock_client
+
+
+def test_counts_attempts_per_endpoint_and_status_class() -> None:
+    """Test that attempts are counted under their endpoint template and status class."""
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(503),
+            httpx.Response(200, json={"result": {"id": "abc"}}),
+            httpx.Response(200, json={"result": {"id": "def"}}),
+            httpx.Response(404),
+        ]
+    )
+    registry = MetricsRegistry()
+    with mock_client(lambda request: next(responses), metrics=registry) as client:
+        client.projects.get_project("abc")
+        client.projects.get_project("def")
+        with pytest.raises(httpx.HTTPStatusError):
+            client.projects.get_project("ghi")
+        metrics = {m["status_class"]: m for m in client.metrics()}
+
+    assert set(metrics) == {"2xx", "4xx", "5xx"}
+    assert all(m["method"] == "GET" for m in metrics.values())
+    assert all(m["endpoint_template"] == "/v1/projects/{project_id}" for m in metrics.values())
+    assert (metrics["2xx"]["requests"], metrics["2xx"]["retries"]) == (2, 0)
+    assert metrics["2xx"]["decode_seconds"] > 0
+    assert (metrics["4xx"]["requests"], metrics["4xx"]["retries"]) == (2, 1)
+    assert metrics["4xx"]["throttled"] == 1
+    assert (metrics["5xx"]["requests"], metrics["5xx"]["retries"]) == (1, 1)
+    latency = metrics["2xx"]["latency"]
+    assert latency["count"] == 2
+    assert latency["buckets"][-1] == (math.inf, 2)
+    assert [count for _, count in latency["buckets"]] == sorted(
+        count for _, count in latency["buckets"]
+    )
+    assert latency["sum"] > 0
+
+
+def test_transport_errors_and_bytes() -> None:
+    """Test that failed connections and the sizes of the bodies are counted."""
+    registry = MetricsRegistry()
+    with FakeSlingshotServer() as server:
+        project_id = server.add_project("ETL")["id"]
+        with SlingshotClient(api_key="test", api_url=server.url, metrics=registry) as client:
+            client.projects.update(project_id, name="Nightly ETL")
+    with mock_client(lambda request: httpx.Response(200), metrics=registry) as client:
+        client._http.close()
+        with pytest.raises(RuntimeError):
+            client.projects.delete("abc")
+
+    delete, put = registry.snapshot()
+    assert (put["method"], put["status_class"]) == ("PUT", "2xx")
+    assert put["bytes_sent"] == len(b'{"name":"Nightly ETL"}')
+    assert put["bytes_received"] > 0
+    assert (delete["method"], delete["status_class"]) == ("DELETE", "error")
+    assert delete["bytes_received"] == 0
+
+
+def test_buckets() -> None:
+    """Test that latencies are counted in the bucket of the smallest bound above them."""
+    registry = MetricsRegistry(buckets=[0.1, 1])
+    for total in (0.05, 0.1, 0.5, 3):
+        event: Any = {
+            "method": "GET",
+            "endpoint_template": "/v1/projects",
+            "bytes_sent": 0,
+            "bytes_received": 10,
+            "status_code": 200,
+            "timings": {"total": total, "decode": 0.0},
+        }
+        registry.on_response(event)
+
+    (metrics,) = registry.snapshot()
+    assert metrics["latency"]["buckets"] == [(0.1, 2), (1.0, 3), (math.inf, 4)]
+    assert metrics["latency"]["sum"] == pytest.approx(3.65)
+    assert metrics["bytes_received"] == 40
+    registry.clear()
+    assert registry.snapshot() == []
+
+
+@pytest.mark.parametrize("buckets", [[], [1, 1], [2, 1]])
+def test_invalid_buckets(buckets: list[float]) -> None:
+    """Test that the buckets must be increasing."""
+    with pytest.raises(ValueError, match="increasing"):
+        MetricsRegistry(buckets=buckets)
+
+
+def test_prometheus_text() -> None:
+    """Test the Prometheus text exposition of the metrics."""
+    registry = MetricsRegistry(buckets=[0.5], prefix="etl")
+    with mock_client(
+        lambda request: httpx.Response(200, json={"result": []}), metrics=registry
+    ) as client:
+        client.projects.get_projects()
+
+    text = registry.prometheus_text()
+    labels = 'method="GET",endpoint="/v1/projects",status_class="2xx"'
+    assert "# TYPE etl_requests_total counter" in text
+    assert f"etl_requests_total{{{labels}}} 1\n" in text
+    assert f"etl_retries_total{{{labels}}} 0\n" in text
+    assert f"etl_response_bytes_total{{{labels}}} " in text
+    assert "# TYPE etl_request_duration_seconds histogram" in text
+    assert f'etl_request_duration_seconds_bucket{{{labels},le="0.5"}} 1\n' in text
+    assert f'etl_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n' in text
+    assert f"etl_request_duration_seconds_count{{{labels}}} 1\n" in text
+    assert text == format_prometheus(client.metrics(), prefix="etl")
+
+
+def test_label_values_are_escaped() -> None:
+    """Test that quotes, backslashes and newlines in label values are escaped."""
+    registry = MetricsRegistry()
+    event: Any = {
+        "method": "GET",
+        "endpoint_template": '/v1/"a"\\b\nc',
+        "bytes_sent": 0,
+        "bytes_received": 0,
+        "status_code": None,
+        "timings": {"total": 0.1, "decode": 0.0},
+    }
+    registry.on_error(event)
+    assert 'endpoint="/v1/\\"a\\"\\\\b\\nc"' in registry.prometheus_text()
+
+
+def test_without_registry() -> None:
+    """Test that a client without a registry reports no metrics."""
+    assert SlingshotClient(api_key="test").metrics() == []
+
+
+@pytest.mark.anyio
+async def test_async_client() -> None:
+    """Test that the async client counts its requests, in a registry shared with another."""
+    registry = MetricsRegistry()
+    with FakeSlingshotServer() as server:
+        server.add_projects(3)
+        async with AsyncSlingshotClient(
+            api_key="test", api_url=server.url, metrics=registry
+        ) as client:
+            await client.projects.get_projects()
+        with SlingshotClient(api_key="test", api_url=server.url, metrics=registry) as other:
+            other.projects.get_projects()
+
+    (metrics,) = client.metrics()
+    assert metrics["requests"] == 2
+    assert metrics["bytes_received"] > 0
+    assert other.metrics() == client.metrics()
@@ -0,0 +1,110 @@
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+import slingshot
+from slingshot import AsyncSlingshotClient, SlingshotClient
+from slingshot.client import _with_default_limits
+
+
+def _modules_after(code: str) -> set[str]:
+    """Run `code` in a new interpreter and return the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_does_not_load_httpx() -> None:
+    """Test that importing the package does not import httpx or the client."""
+    modules = _modules_after("import slingshot")
+    assert "httpx" not in modules
+    assert "slingshot.client" not in modules
+
+
+def test_utilities_do_not_load_httpx() -> None:
+    """Test that the utilities that do not send requests can be imported without httpx."""
+    modules = _modules_after(
+        "from slingshot import CircuitBreaker, RateLimiter, ResponseCache, RetryPolicy, JSONCodec"
+    )
+    assert "httpx" not in modules
+
+
+def test_client_is_imported_on_first_use() -> None:
+    """Test that the lazily imported names are the ones defined by the submodules."""
+    modules = _modules_after("import slingshot\nslingshot.SlingshotClient")
+    assert "slingshot.client" in modules
+    assert slingshot.SlingshotClient is SlingshotClient
+    assert set(slingshot.__all__) <= set(dir(slingshot))
+
+
+def test_client_import_does_not_load_httpx() -> None:
+    """Test that importing and creating the clients only loads httpx once a request is made."""
+    features = {
+        "slingshot.cache",
+        "slingshot.circuit",
+        "slingshot.metrics",
+        "slingshot.ratelimit",
+        "slingshot.singleflight",
+    }
+    modules = _modules_after("from slingshot import AsyncSlingshotClient, SlingshotClient")
+    assert not {"httpx", "asyncio", "importlib.metadata", *features} & modules
+    modules = _modules_after(
+        "from slingshot import AsyncSlingshotClient, SlingshotClient\n"
+        "SlingshotClient(api_key='test')\n"
+        "AsyncSlingshotClient(api_key='test')"
+    )
+    assert not {"httpx", "asyncio", *features} & modules
+
+
+def test_unknown_attribute() -> None:
+    """Test that names the package does not define raise AttributeError."""
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        slingshot.Missing  # noqa: B018
+
+
+def test_http_client_is_created_on_first_request() -> None:
+    """Test that creating a client does not create its HTTP client until it is needed."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(status_code=204))
+    client = SlingshotClient(api_key="test", api_url="https://test", transport=transport)
+    assert client._http_client is None
+    client._api_request("GET", "/v1/projects")
+    assert client._http_client is not None
+    client.close()
+    assert client._http_client.is_closed
+
+
+def test_default_limits() -> None:
+    """Test that HTTP clients get the default connection limits unless others are given."""
+    limits = httpx.Limits(max_connections=5)
+    assert _with_default_limits({"limits": limits})["limits"] is limits
+    assert _with_default_limits({"limits": None})["limits"] == httpx.Limits(
+        max_connections=100, max_keepalive_connections=20
+    )
+
+
+def test_client_constants() -> None:
+    """Test that the client constants built on first use can still be imported."""
+    from slingshot.__vers import __version__
+    from slingshot.client import DEFAULT_LIMITS, USER_AGENT
+
+    assert USER_AGENT == f"Slingshot Library/{__version__} (c1s-slingshot-sdk-py)"
+    assert DEFAULT_LIMITS == httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    assert "httpx" not in _modules_after("import slingshot.client")
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        slingshot.client.Missing  # noqa: B018
+
+
+@pytest.mark.anyio
+async def test_async_client_closed_before_first_request() -> None:
+    """Test that an async client closed before its first request refuses to send any."""
+    client = AsyncSlingshotClient(api_key="test", api_url="https://test")
+    await client.aclose()
+    assert client._http_client is None
+    with pytest.raises(RuntimeError, match="closed"):
+        await client._api_request("GET", "/v1/projects")
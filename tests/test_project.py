@@ -561,3 +561,99 @@ def test_apply_recommendation_failure(
         )
     assert exc_info.value.response.status_code == status_code
     assert exc_info.value.response.json() == mock_error
+
+
+def test_wait_for_recommendation_success(
+    httpx_mock: HTTPXMock,
+    client: SlingshotClient,
+) -> None:
+    """Test polling a recommendation until it reaches a terminal state."""
+    project_id = "project_id_123"
+    recommendation_id = "recommendation_123"
+    url = f"{client._api_url}/v1/projects/{project_id}/recommendations/{recommendation_id}"
+    for state in ("PENDING", "UPLOADING", "SUCCESS"):
+        httpx_mock.add_response(
+            method="GET", url=url, json={"result": {"id": recommendation_id, "state": state}}
+        )
+    recommendation = client.projects.wait_for_recommendation(
+        project_id=project_id,
+        recommendation_id=recommendation_id,
+        initial_interval=0.01,
+    )
+    assert recommendation == {"id": recommendation_id, "state": "SUCCESS"}
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_wait_for_recommendation_timeout(
+    httpx_mock: HTTPXMock,
+    client: SlingshotClient,
+) -> None:
+    """Test that waiting gives up once the timeout has elapsed."""
+    project_id = "project_id_123"
+    recommendation_id = "recommendation_123"
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{client._api_url}/v1/projects/{project_id}/recommendations/{recommendation_id}",
+        json={"result": {"id": recommendation_id, "state": "PENDING"}},
+        is_reusable=True,
+    )
+    with pytest.raises(TimeoutError, match="did not reach one of the states SUCCESS"):
+        client.projects.wait_for_recommendation(
+            project_id=project_id,
+            recommendation_id=recommendation_id,
+            timeout=0.1,
+            terminal_states=["SUCCESS"],
+            initial_interval=0.01,
+            max_interval=0.02,
+        )
+    assert len(httpx_mock.get_requests()) >= 3
+
+
+def test_wait_for_recommendation_failure(
+    httpx_mock: HTTPXMock,
+    client: SlingshotClient,
+) -> None:
+    """Test that errors other than throttling are raised while waiting."""
+    project_id = "project_id_123"
+    recommendation_id = "recommendation_123"
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{client._api_url}/v1/projects/{project_id}/recommendations/{recommendation_id}",
+        status_code=404,
+        json={"error": "Recommendation not found"},
+    )
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        client.projects.wait_for_recommendation(
+            project_id=project_id, recommendation_id=recommendation_id
+        )
+    assert exc_info.value.response.status_code == 404
+
+
+def test_wait_for_recommendation_honors_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+    client: SlingshotClient,
+) -> None:
+    """Test that throttled polls wait for the Retry-After delay and keep polling."""
+    request = httpx.Request("GET", f"{client._api_url}/v1/projects/p/recommendations/r")
+    responses = [
+        httpx.Response(status_code=429, headers={"Retry-After": "7"}, request=request),
+        httpx.Response(status_code=503, request=request),
+        {"id": "r", "state": "FAILURE"},
+    ]
+    sleeps: list[float] = []
+
+    def get_recommendation(project_id: str, recommendation_id: str):
+        response = responses.pop(0)
+        if isinstance(response, httpx.Response):
+            raise httpx.HTTPStatusError("throttled", request=request, response=response)
+        return response
+
+    monkeypatch.setattr(client.projects, "get_recommendation", get_recommendation)
+    monkeypatch.setattr("slingshot.api.projects.time.sleep", sleeps.append)
+
+    recommendation = client.projects.wait_for_recommendation(
+        project_id="p", recommendation_id="r", initial_interval=1.0
+    )
+    assert recommendation == {"id": "r", "state": "FAILURE"}
+    assert sleeps[0] == 7.0
+    assert 1.0 <= sleeps[1] <= 2.0
@@ -1,7 +1,10 @@
+import json
 import math
 import random
 import re
-from typing import Any, Optional, cast
+import time
+from collections.abc import Iterator
+from typing import Any, Callable, Optional, cast
 
 import httpx
 import pytest
@@ -469,3 +472,328 @@ def test_get_project_recommendation(httpx_mock: HTTPXMock, client: SlingshotClie
         project_id=project_id, recommendation_id=recommendation_id
     )
     assert result == expected_response
+
+
+def _project_pages(total_items: int) -> tuple[list[ProjectSchema], httpx.MockTransport, list[int]]:
+    """Build a dataset and a transport serving it in pages, recording the requested pages."""
+    dataset = cast(list[ProjectSchema], [{"id": f"proj_{i}"} for i in range(total_items)])
+    requested_pages: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        size = int(request.url.params["size"])
+        requested_pages.append(page)
+        start = (page - 1) * size
+        return httpx.Response(
+            status_code=200,
+            json={
+                "page": page,
+                "pages": math.ceil(total_items / size),
+                "items": dataset[start : start + size],
+            },
+        )
+
+    return dataset, httpx.MockTransport(handler), requested_pages
+
+
+@pytest.mark.parametrize("prefetch", [1, 4, 20])
+@pytest.mark.parametrize(
+    "total_items, max_pages, expected_items",
+    [
+        (5, 1000, 5),  # Less than one page
+        (1000, 1000, 1000),  # Many pages
+        (1000, 3, 30),  # Truncated by max_pages
+    ],
+)
+def test_iterate_projects_prefetch(
+    prefetch: int, total_items: int, max_pages: int, expected_items: int
+) -> None:
+    """Tests that prefetching yields every project in page order."""
+    dataset, transport, requested_pages = _project_pages(total_items)
+    client = SlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=transport
+    )
+
+    result = list(client.projects.iterate_projects(size=10, max_pages=max_pages, prefetch=prefetch))
+
+    assert result == dataset[:expected_items]
+    assert sorted(requested_pages) == list(range(1, math.ceil(expected_items / 10) + 1))
+
+
+def test_iterate_projects_prefetch_stops_on_error() -> None:
+    """Tests that prefetching stops at the first page that fails, like the serial iteration."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 3:
+            return httpx.Response(status_code=404)
+        return httpx.Response(
+            status_code=200, json={"page": page, "pages": 5, "items": [{"id": f"proj_{page}"}]}
+        )
+
+    client = SlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=httpx.MockTransport(handler)
+    )
+    result = list(client.projects.iterate_projects(size=1, prefetch=2))
+    assert result == [{"id": "proj_1"}, {"id": "proj_2"}]
+
+
+def test_iterate_projects_prefetch_closed_early() -> None:
+    """Tests that closing the generator stops requesting pages beyond the prefetch window."""
+    _, transport, requested_pages = _project_pages(1000)
+    client = SlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=transport
+    )
+
+    projects = client.projects.iterate_projects(size=10, prefetch=2)
+    assert [next(projects)["id"] for _ in range(15)] == [f"proj_{i}" for i in range(15)]
+    projects.close()
+
+    # Page 1, page 2 being consumed and at most two more pages in flight.
+    assert len(requested_pages) <= 4
+
+
+@pytest.mark.parametrize(
+    "total_items, max_pages, expected_items", [(0, 1000, 0), (35, 1000, 35), (35, 2, 20)]
+)
+def test_iterate_projects_stream(total_items: int, max_pages: int, expected_items: int) -> None:
+    """Tests that streaming yields every project in page order."""
+    dataset, transport, requested_pages = _project_pages(total_items)
+    client = SlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=transport
+    )
+
+    result = list(client.projects.iterate_projects(size=10, max_pages=max_pages, stream=True))
+
+    assert result == dataset[:expected_items]
+    assert requested_pages == list(range(1, max(1, math.ceil(expected_items / 10)) + 1))
+
+
+def test_iterate_projects_stream_yields_before_page_is_received() -> None:
+    """Tests that the first project is yielded before the rest of the page has been received."""
+    sent: list[bytes] = []
+    body = json.dumps({"items": [{"id": f"proj_{i}"} for i in range(100)], "page": 1, "pages": 1})
+
+    def chunks() -> Iterator[bytes]:
+        for start in range(0, len(body), 64):
+            sent.append(body[start : start + 64].encode())
+            yield sent[-1]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=200, headers={"Content-Type": "application/json"}, content=chunks()
+        )
+
+    client, _ = _recording_client(handler)
+    projects = client.projects.iterate_projects(stream=True)
+
+    assert next(projects) == {"id": "proj_0"}
+    assert len(sent) <= 2
+    assert len(list(projects)) == 99
+
+
+def test_iterate_projects_stream_stops_on_error() -> None:
+    """Tests that streaming stops at the first page that fails, like the buffered iteration."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 2:
+            return httpx.Response(status_code=404, json={"error": "Not found"})
+        return httpx.Response(
+            status_code=200, json={"page": page, "pages": 5, "items": [{"id": f"proj_{page}"}]}
+        )
+
+    client, requests = _recording_client(handler)
+    assert list(client.projects.iterate_projects(size=1, stream=True)) == [{"id": "proj_1"}]
+    assert len(requests) == 2
+
+
+def test_stream_array_retries_and_reports_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that opening a stream is retried, and that error responses are read before raising."""
+    monkeypatch.setattr("slingshot.client.time.sleep", lambda _: None)
+    statuses = [503, 400]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code=statuses.pop(0), json={"error": "Bad request"})
+
+    client, requests = _recording_client(handler)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        list(client._stream_array("/v1/projects", None, "items", {}))
+    assert exc_info.value.response.json() == {"error": "Bad request"}
+    assert len(requests) == 2
+
+
+def test_stream_array_rejects_non_json() -> None:
+    """Tests that a successful response that is not JSON is an error."""
+    client, _ = _recording_client(lambda request: httpx.Response(status_code=200, text="OK"))
+    with pytest.raises(RuntimeError, match="application/json"):
+        list(client._stream_array("/v1/projects", None, "items", {}))
+
+
+def test_iterate_projects_stream_and_prefetch() -> None:
+    """Tests that streaming cannot be combined with prefetching."""
+    client, _ = _recording_client(lambda request: httpx.Response(status_code=500))
+    with pytest.raises(ValueError, match="prefetch"):
+        next(client.projects.iterate_projects(stream=True, prefetch=2))
+
+
+def test_get_projects_by_id() -> None:
+    """Tests that get_projects_by_id collects projects and per-ID errors."""
+    requested_ids: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        project_id = request.url.path.rsplit("/", 1)[-1]
+        requested_ids.append(project_id)
+        assert request.url.params.get_list("include") == ["name"]
+        if project_id.endswith("7"):
+            return httpx.Response(status_code=404, json={"error": "Project not found"})
+        return httpx.Response(status_code=200, json={"result": {"id": project_id}})
+
+    client = SlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=httpx.MockTransport(handler)
+    )
+    project_ids = [f"proj_{i}" for i in range(100)]
+
+    results = dict(
+        client.projects.get_projects_by_id(project_ids + project_ids[:10], include=["name"])
+    )
+
+    assert sorted(requested_ids) == sorted(project_ids)
+    assert results.keys() == set(project_ids)
+    for project_id, outcome in results.items():
+        if project_id.endswith("7"):
+            assert outcome["result"] is None
+            assert isinstance(outcome["error"], httpx.HTTPStatusError)
+            assert outcome["error"].response.status_code == 404
+        else:
+            assert outcome == {"result": {"id": project_id}, "error": None}
+
+
+def _recording_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> tuple[SlingshotClient, list[httpx.Request]]:
+    """Build a client whose transport records every request before handling it."""
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    client = SlingshotClient(
+        api_key="test_key", api_url="https://api.test.com", transport=httpx.MockTransport(record)
+    )
+    return client, requests
+
+
+def test_create_many() -> None:
+    """Tests that create_many returns one outcome per project, in input order."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.read())
+        if payload["name"] == "Duplicate":
+            return httpx.Response(status_code=409, json={"error": "app_id already exists"})
+        return httpx.Response(status_code=200, json={"result": {"name": payload["name"]}})
+
+    client, requests = _recording_client(handler)
+    names = [f"Project {i}" for i in range(30)]
+    names[7] = "Duplicate"
+
+    results = client.projects.create_many(
+        ({"name": name, "workspace_id": "1234", "app_id": f"app_{name}"} for name in names),
+        max_workers=4,
+    )
+
+    assert len(requests) == 30
+    assert len(results) == 30
+    for name, outcome in zip(names, results):
+        if name == "Duplicate":
+            assert outcome["result"] is None
+            assert isinstance(outcome["error"], httpx.HTTPStatusError)
+            assert outcome["error"].response.status_code == 409
+        else:
+            assert outcome == {"result": {"name": name}, "error": None}
+
+
+def test_update_many() -> None:
+    """Tests that update_many sends each update to its project."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        project_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(
+            status_code=200, json={"result": {"id": project_id, **json.loads(request.read())}}
+        )
+
+    client, _ = _recording_client(handler)
+    results = client.projects.update_many(
+        [{"project_id": f"proj_{i}", "description": f"Description {i}"} for i in range(10)]
+    )
+    assert [outcome["result"] for outcome in results] == [
+        {"id": f"proj_{i}", "description": f"Description {i}"} for i in range(10)
+    ]
+
+
+def test_delete_and_reset_many() -> None:
+    """Tests that delete_many and reset_many report per-project failures."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "proj_missing" in request.url.path:
+            return httpx.Response(status_code=404, json={"error": "Project not found"})
+        if request.method == "DELETE":
+            return httpx.Response(status_code=200, json={})
+        return httpx.Response(status_code=204)
+
+    client, requests = _recording_client(handler)
+    project_ids = ["proj_1", "proj_missing", "proj_2"]
+
+    for results in (
+        client.projects.delete_many(project_ids),
+        client.projects.reset_many(project_ids),
+    ):
+        assert results[0] == {"result": None, "error": None}
+        assert isinstance(results[1]["error"], httpx.HTTPStatusError)
+        assert results[2] == {"result": None, "error": None}
+    assert {(request.method, request.url.path) for request in requests} == {
+        *(("DELETE", f"/v1/projects/{project_id}") for project_id in project_ids),
+        *(("POST", f"/v1/projects/{project_id}/reset") for project_id in project_ids),
+    }
+
+
+def test_batch_honors_backpressure() -> None:
+    """Tests that a 429 seen by one worker pauses the items the other workers start next."""
+    throttled_at: list[float] = []
+    started_at: dict[str, float] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        project_id = request.url.path.rsplit("/", 2)[-2]
+        started_at.setdefault(project_id, time.monotonic())
+        if project_id == "proj_0" and not throttled_at:
+            throttled_at.append(time.monotonic())
+            return httpx.Response(status_code=429, headers={"Retry-After": "0.3"})
+        time.sleep(0.05)
+        return httpx.Response(status_code=204)
+
+    client, _ = _recording_client(handler)
+    results = client.projects.reset_many([f"proj_{i}" for i in range(12)], max_workers=4)
+
+    assert all(outcome["error"] is None for outcome in results)
+    # Items 1-3 started alongside the throttled item; the rest had to wait.
+    for i in range(4, 12):
+        assert started_at[f"proj_{i}"] >= throttled_at[0] + 0.3
+
+
+def test_batch_ignores_retry_after_beyond_the_policy() -> None:
+    """Tests that a Retry-After too long to be retried fails its item without pausing the others."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/projects/proj_0/reset":
+            return httpx.Response(status_code=429, headers={"Retry-After": "3600"})
+        return httpx.Response(status_code=204)
+
+    client, _ = _recording_client(handler)
+    start = time.monotonic()
+    results = client.projects.reset_many([f"proj_{i}" for i in range(8)], max_workers=2)
+
+    assert time.monotonic() - start < 5
+    assert isinstance(results[0]["error"], httpx.HTTPStatusError)
+    assert all(outcome["error"] is None for outcome in results[1:])
+    assert client._backpressure._resume_at == 0.0
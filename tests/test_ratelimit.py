@@ -0,0 +1,109 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, RateLimiter, SlingshotClient
+from tests.helpers import FakeTime
+
+
+def test_burst_then_steady_rate(fake_time: FakeTime) -> None:
+    """Test that a burst is allowed and later requests are spaced out at the rate."""
+    limiter = RateLimiter(rate=10, burst=3)
+
+    assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter._reserve() == pytest.approx(0.1)
+    assert limiter._reserve() == pytest.approx(0.2)
+
+    fake_time.now += 10
+    assert limiter._reserve() == 0.0
+
+
+def test_acquire_sleeps(fake_time: FakeTime) -> None:
+    """Test that acquire blocks until the reserved token is available."""
+    limiter = RateLimiter(rate=4)
+    start = fake_time.now
+    for _ in range(8):
+        limiter.acquire()
+    assert fake_time.now - start == pytest.approx(1.0)
+
+
+def test_throttle_and_recover(fake_time: FakeTime) -> None:
+    """Test that throttling halves the rate once per second and the rate recovers."""
+    # The rate recovers by 0.1 requests per second every second.
+    limiter = RateLimiter(rate=10, min_rate=2, recovery_time=80)
+
+    limiter.throttle()
+    limiter.throttle()
+    assert limiter.rate == 5
+
+    fake_time.now += 1
+    limiter.throttle()
+    assert limiter.rate == pytest.approx(2.55)
+    limiter.throttle()
+    fake_time.now += 1.1
+    limiter.throttle()
+    assert limiter.rate == 2
+
+    fake_time.now += 80
+    assert limiter.rate == pytest.approx(10)
+
+
+def test_throttle_drops_burst(fake_time: FakeTime) -> None:
+    """Test that throttling makes the next request wait at the lower rate."""
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.throttle()
+    assert limiter._reserve() == pytest.approx(0.2)
+
+
+@pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1, "burst": 0}])
+def test_invalid_arguments(kwargs: dict) -> None:
+    """Test that the rate and burst must be positive."""
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
+
+
+def test_shared_across_threads() -> None:
+    """Test that threads sharing a limiter are held to its combined rate."""
+    limiter = RateLimiter(rate=200, burst=1)
+    start = time.monotonic()
+    threads = [
+        threading.Thread(target=lambda: [limiter.acquire() for _ in range(10)]) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 40 requests with a burst of 1 take at least 39 intervals of 5ms.
+    assert time.monotonic() - start >= 39 / 200
+
+
+def test_client_throttles_on_429(fake_time: FakeTime) -> None:
+    """Test that the client consults the limiter and throttles it on 429."""
+    responses = iter([429, 204])
+    limiter = RateLimiter(rate=10, burst=5)
+    client = SlingshotClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(lambda request: httpx.Response(next(responses))),
+        rate_limiter=limiter,
+    )
+    assert client._api_request(method="GET", endpoint="/TEST") is None
+    assert limiter.rate == pytest.approx(5, abs=0.1)
+    # Throttling dropped the rest of the burst.
+    assert limiter._tokens < 1
+
+
+@pytest.mark.anyio
+async def test_async_client_throttles_on_429(fake_time: FakeTime) -> None:
+    """Test that the async client awaits the limiter and throttles it on 429."""
+    responses = iter([429, 204])
+    limiter = RateLimiter(rate=10, burst=1)
+    client = AsyncSlingshotClient(
+        api_key="test_key",
+        transport=httpx.MockTransport(lambda request: httpx.Response(next(responses))),
+        rate_limiter=limiter,
+    )
+    assert await client._api_request(method="GET", endpoint="/TEST") is None
+    assert limiter.rate == pytest.approx(5, abs=0.1)
+    assert repr(limiter) == "RateLimiter(rate=10.0, burst=1)"
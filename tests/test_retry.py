@@ -0,0 +1,158 @@
+from typing import Optional
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, RetryBudget, RetryPolicy, SlingshotClient
+from tests.helpers import FakeTime
+
+
+def _failing_client(
+    statuses: list[int], headers: Optional[dict[str, str]] = None, **kwargs
+) -> tuple[SlingshotClient, list[httpx.Request]]:
+    """Return a client whose requests get the given statuses, then 200, and the requests it sends."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if statuses:
+            return httpx.Response(statuses.pop(0), headers=headers)
+        return httpx.Response(200, json={"success": True})
+
+    client = SlingshotClient(
+        api_key="test", api_url="https://test", transport=httpx.MockTransport(handler), **kwargs
+    )
+    return client, requests
+
+
+def test_budget_allows_min_retries_then_a_ratio_of_requests(fake_time: FakeTime) -> None:
+    """Test that the budget allows the minimum retries plus a share of the requests."""
+    budget = RetryBudget(ratio=0.5, min_retries=2, window=10)
+
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+
+def test_budget_forgets_old_traffic(fake_time: FakeTime) -> None:
+    """Test that requests and retries older than the window no longer count."""
+    budget = RetryBudget(ratio=0.0, min_retries=1, window=10)
+
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    fake_time.now += 5
+    assert not budget.try_spend()
+    fake_time.now += 6
+    assert budget.try_spend()
+    assert len(budget._buckets) == 2
+
+
+def test_decorrelated_jitter_bounds() -> None:
+    """Test that each delay lies between the base delay and three times the previous one."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    for _ in range(100):
+        assert 1.0 <= policy.jittered_delay(None) <= 3.0
+        assert 1.0 <= policy.jittered_delay(1.5) <= 4.5
+        assert policy.jittered_delay(100.0) <= 5.0
+
+
+def test_retries_and_records_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a retried request is counted and the delays are summed."""
+    sleeps: list[float] = []
+    monkeypatch.setattr("slingshot.client.time.sleep", sleeps.append)
+    client, requests = _failing_client([503, 502], retry_policy=RetryPolicy(base_delay=0.1))
+
+    assert client._api_request("GET", "/TEST") == {"success": True}
+    assert len(requests) == 3
+    stats = client.retry_stats()
+    assert stats["requests"] == 1
+    assert stats["retries"] == 2
+    assert stats["giveups"] == 0
+    assert stats["retry_delay_seconds"] == pytest.approx(sum(sleeps))
+
+
+def test_gives_up_after_max_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the last error is raised once the attempts are used up."""
+    monkeypatch.setattr("slingshot.client.time.sleep", lambda _: None)
+    client, requests = _failing_client([500] * 5, retry_policy=RetryPolicy(max_attempts=3))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client._api_request("GET", "/TEST")
+    assert len(requests) == 3
+    assert client.retry_stats()["giveups"] == 1
+
+
+def test_honors_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the delay before a retry is at least the Retry-After delay."""
+    sleeps: list[float] = []
+    monkeypatch.setattr("slingshot.client.time.sleep", sleeps.append)
+    client, _ = _failing_client([503], headers={"Retry-After": "12"})
+
+    assert client._api_request("GET", "/TEST") == {"success": True}
+    assert sleeps[0] >= 12
+    assert client.retry_stats()["retry_after_honored"] == 1
+
+
+def test_gives_up_on_long_retry_after() -> None:
+    """Test that a request is not retried if Retry-After asks for more than the maximum wait."""
+    client, requests = _failing_client(
+        [429], headers={"Retry-After": "120"}, retry_policy=RetryPolicy(max_retry_after=30)
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client._api_request("GET", "/TEST")
+    assert len(requests) == 1
+    assert client.retry_stats()["giveups"] == 1
+
+
+def test_shared_budget_stops_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that clients sharing a policy stop retrying once their common budget is used up."""
+    monkeypatch.setattr("slingshot.client.time.sleep", lambda _: None)
+    policy = RetryPolicy(budget=RetryBudget(ratio=0.0, min_retries=2))
+    first, _ = _failing_client([500, 500], retry_policy=policy)
+    second, requests = _failing_client([500, 500], retry_policy=policy)
+
+    assert first._api_request("GET", "/TEST") == {"success": True}
+    with pytest.raises(httpx.HTTPStatusError):
+        second._api_request("GET", "/TEST")
+    assert len(requests) == 1
+    assert second.retry_stats()["budget_exhausted"] == 1
+
+
+def test_does_not_retry_client_errors() -> None:
+    """Test that a 404 is raised without being retried or counted as a give-up."""
+    client, requests = _failing_client([404])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client._api_request("GET", "/TEST")
+    assert len(requests) == 1
+    assert client.retry_stats() == {
+        "requests": 1,
+        "retries": 0,
+        "giveups": 0,
+        "budget_exhausted": 0,
+        "retry_after_honored": 0,
+        "retry_delay_seconds": 0.0,
+    }
+
+
+@pytest.mark.anyio
+async def test_async_client_retries() -> None:
+    """Test that the async client retries with the same policy and records stats."""
+    statuses = [429]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if statuses:
+            return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"success": True})
+
+    async with AsyncSlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(base_delay=0.01),
+    ) as client:
+        assert await client._api_request("POST", "/TEST") == {"success": True}
+        assert client.retry_stats()["retries"] == 1
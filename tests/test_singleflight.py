@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, SlingshotClient
+from slingshot.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class _Interrupted(BaseException):
+    """An interruption that is not an error, like KeyboardInterrupt."""
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    """Wait until `condition()` is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _gated_client(
+    status_code: int = 200,
+) -> tuple[SlingshotClient, list[httpx.Request], threading.Event]:
+    """Return a coalescing client whose responses are held back until the returned event is set."""
+    requests: list[httpx.Request] = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        release.wait(5)
+        return httpx.Response(status_code, json={"result": {"id": request.url.path}})
+
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        coalesce_requests=True,
+    )
+    return client, requests, release
+
+
+def test_identical_gets_share_one_request() -> None:
+    """Test that threads making the same GET at the same time send a single request."""
+    client, requests, release = _gated_client()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(client.projects.get_project, "proj_1") for _ in range(8)]
+        _wait_for(lambda: client.coalescing_stats()["coalesced"] == 7)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(requests) == 1
+    assert all(result == {"id": "/v1/projects/proj_1"} for result in results)
+    # Every caller gets its own copy.
+    assert len({id(result) for result in results}) == 8
+    assert client.coalescing_stats() == {"calls": 1, "coalesced": 7}
+
+
+def test_different_and_write_requests_are_not_coalesced() -> None:
+    """Test that only identical GET requests are coalesced."""
+    client, requests, release = _gated_client()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(client.projects.get_project, "proj_1"),
+            executor.submit(client.projects.get_project, "proj_1", ["id"]),
+            executor.submit(client._api_request, "POST", "/v1/projects/proj_1/reset"),
+            executor.submit(client._api_request, "POST", "/v1/projects/proj_1/reset"),
+        ]
+        _wait_for(lambda: len(requests) == 4)
+        release.set()
+        for future in futures:
+            future.result()
+
+    assert client.coalescing_stats() == {"calls": 2, "coalesced": 0}
+
+
+def test_errors_are_shared() -> None:
+    """Test that the callers waiting for a failed request get its error."""
+    client, requests, release = _gated_client(status_code=404)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(client.projects.get_project, "proj_1") for _ in range(3)]
+        _wait_for(lambda: client.coalescing_stats()["coalesced"] == 2)
+        release.set()
+        for future in futures:
+            with pytest.raises(httpx.HTTPStatusError):
+                future.result()
+    assert len(requests) == 1
+
+
+def test_disabled_by_default(client: SlingshotClient) -> None:
+    """Test that clients do not coalesce requests unless asked to."""
+    assert client._singleflight is None
+    assert client.coalescing_stats() == {"calls": 0, "coalesced": 0}
+
+
+def test_interrupted_call_is_repeated_by_waiters() -> None:
+    """Test that the waiting threads make the call themselves if the first one was interrupted."""
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def interrupted() -> str:
+        started.set()
+        release.wait(5)
+        raise _Interrupted
+
+    def leader() -> None:
+        with pytest.raises(_Interrupted):
+            flights.do("key", interrupted)
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait(5)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        follower = executor.submit(flights.do, "key", lambda: "made again")
+        _wait_for(lambda: flights.stats()["coalesced"] == 1)
+        release.set()
+        assert follower.result() == "made again"
+    thread.join()
+
+
+@pytest.mark.anyio
+async def test_async_identical_gets_share_one_request() -> None:
+    """Test that tasks making the same GET at the same time send a single request."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"result": {"id": "proj_1"}})
+
+    async with AsyncSlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        coalesce_requests=True,
+    ) as client:
+        results = await asyncio.gather(*(client.projects.get_project("proj_1") for _ in range(5)))
+
+    assert len(requests) == 1
+    assert results == [{"id": "proj_1"}] * 5
+    assert client.coalescing_stats() == {"calls": 1, "coalesced": 4}
+
+
+@pytest.mark.anyio
+async def test_async_cancelled_leader() -> None:
+    """Test that waiting tasks make the call themselves if the first task is cancelled."""
+    flights = AsyncSingleFlight()
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return calls
+
+    leader = asyncio.ensure_future(flights.do("key", call))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flights.do("key", call))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert flights.stats() == {"calls": 1, "coalesced": 1}
@@ -0,0 +1,190 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from slingshot import ProjectStore, SlingshotClient, sync_projects
+from slingshot.codec import JSONCodec
+from slingshot.store import SCHEMA_VERSION
+from slingshot.testing import FakeSlingshotServer
+
+
+@pytest.fixture
+def fake_server(fake_server: FakeSlingshotServer) -> FakeSlingshotServer:
+    """The fake server, with projects last updated on different days."""
+    for day in range(1, 6):
+        fake_server.add_project(
+            f"Project {day}",
+            workspace_id=f"workspace-{day % 2}",
+            app_id=f"app-{day}",
+            job_id=str(day),
+            updated_at=f"2024-01-0{day}T00:00:00Z",
+        )
+    return fake_server
+
+
+def test_sync_and_lookups(fake_client: SlingshotClient, tmp_path: Path) -> None:
+    """Test that a sync mirrors every project, which can then be looked up by its IDs."""
+    with ProjectStore(tmp_path / "projects.db") as store:
+        stats = store.sync(fake_client, size=2)
+        assert stats == {"pages": 3, "fetched": 5, "written": 5, "deleted": 0, "complete": True}
+        assert len(store) == 5
+        assert store.watermark == "2024-01-05T00:00:00Z"
+
+        project = next(p for p in fake_client.projects.iterate_projects() if p["app_id"] == "app-3")
+        assert store.get(str(project["id"])) == project
+        assert store.get("missing") is None
+        assert store.find(app_id="app-3") == [project]
+        assert store.find(job_id="3", workspace_id="workspace-1") == [project]
+        assert store.find(job_id="3", workspace_id="workspace-0") == []
+        assert len(store.find(workspace_id="workspace-0")) == 2
+        assert len(store.find(creator_id=str(project["creator_id"]))) == 5
+        assert [p["id"] for p in store] == sorted(str(p["id"]) for p in store.find())
+
+    with ProjectStore(tmp_path / "projects.db") as reopened:
+        assert len(reopened) == 5
+
+
+def test_incremental_sync(fake_server: FakeSlingshotServer, fake_client: SlingshotClient) -> None:
+    """Test that later syncs only write the changed projects and remove the deleted ones."""
+    store = ProjectStore()
+    store.sync(fake_client)
+    first, second, *_ = fake_client.projects.get_projects()["items"]
+    fake_client.projects.update(str(first["id"]), name="Renamed")
+    fake_client.projects.delete(str(second["id"]))
+    fake_server.add_project("New")
+
+    stats = store.sync(fake_client)
+
+    assert stats == {"pages": 1, "fetched": 5, "written": 2, "deleted": 1, "complete": True}
+    renamed = store.get(str(first["id"]))
+    assert renamed is not None and renamed["name"] == "Renamed"
+    assert store.get(str(second["id"])) is None
+    assert [p["name"] for p in store.find(workspace_id="1234567890123456")] == ["New"]
+    assert store.sync(fake_client)["written"] == 0
+
+
+def test_project_deleted_during_sync(
+    fake_server: FakeSlingshotServer, fake_client: SlingshotClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a project skipped because another was deleted mid-sync is not removed."""
+    store = ProjectStore()
+    store.sync(fake_client, size=2)
+    first, _, third, *_ = fake_server.projects
+    get_projects = fake_client.projects.get_projects
+
+    def delete_after_first_page(**params: Any) -> Any:
+        """List a page, deleting the first project once the first page is listed."""
+        response = get_projects(**params)
+        if params["page"] == 1:
+            fake_client.projects.delete(first["id"])
+        return response
+
+    monkeypatch.setattr(fake_client.projects, "get_projects", delete_after_first_page)
+    # The third project moves to the first page, which was already listed.
+    stats = store.sync(fake_client, size=2)
+
+    assert stats == {"pages": 2, "fetched": 4, "written": 0, "deleted": 0, "complete": True}
+    assert store.get(third["id"]) is not None
+    monkeypatch.undo()
+    assert store.sync(fake_client, size=2)["deleted"] == 1
+    assert store.get(first["id"]) is None
+    assert len(store) == 4
+
+
+def _newest_first(projects: list[dict], requests: list[int]) -> Any:
+    """Return a handler listing `projects` two per page, most recently updated first."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Serve a page of projects and record its number."""
+        page = int(request.url.params["page"])
+        requests.append(page)
+        ordered = sorted(projects, key=lambda project: project["updated_at"], reverse=True)
+        return httpx.Response(
+            200,
+            json={"page": page, "pages": 3, "items": ordered[(page - 1) * 2 : page * 2]},
+        )
+
+    return handler
+
+
+def test_newest_first_stops_early() -> None:
+    """Test that syncs of a listing ordered by update stop at the first page older than the watermark."""
+    projects = [
+        {"id": str(day), "name": f"Project {day}", "updated_at": f"2024-01-0{day}T00:00:00Z"}
+        for day in range(1, 6)
+    ]
+    requests: list[int] = []
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(_newest_first(projects, requests)),
+    )
+    store = ProjectStore()
+    # The first sync fetches every page, since there is no watermark yet.
+    assert store.sync(client, size=2, newest_first=True)["complete"]
+    projects[0]["updated_at"] = "2024-01-06T00:00:00Z"
+    requests.clear()
+
+    stats = store.sync(client, size=2, newest_first=True)
+
+    assert requests == [1, 2]
+    assert stats == {"pages": 2, "fetched": 4, "written": 1, "deleted": 0, "complete": False}
+    assert store.watermark == "2024-01-06T00:00:00Z"
+    requests.clear()
+    assert store.sync(client, size=2, newest_first=True, full=True)["complete"]
+    assert requests == [1, 2, 3]
+
+
+def test_failed_sync_keeps_fetched_pages(
+    fake_server: FakeSlingshotServer, fake_client: SlingshotClient
+) -> None:
+    """Test that a failed page raises without removing the projects of the store."""
+    store = ProjectStore()
+    store.sync(fake_client)
+    fake_server.inject(404)
+    with pytest.raises(httpx.HTTPStatusError):
+        store.sync(fake_client, size=2)
+    assert len(store) == 5
+
+
+def test_sync_projects(fake_client: SlingshotClient, tmp_path: Path) -> None:
+    """Test the shortcut that syncs a database file."""
+    path = tmp_path / "projects.db"
+    assert sync_projects(path, fake_client)["written"] == 5
+    assert sync_projects(str(path), fake_client)["written"] == 0
+
+
+def test_sync_projects_with_default_client(
+    fake_server: FakeSlingshotServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the shortcut creates a client from the environment by default."""
+    monkeypatch.setenv("SLINGSHOT_API_KEY", "test")
+    monkeypatch.setenv("SLINGSHOT_API_URL", fake_server.url)
+    assert sync_projects(tmp_path / "projects.db")["fetched"] == 5
+
+
+def test_codec_and_threads(fake_client: SlingshotClient) -> None:
+    """Test that the store can use another codec and be read from other threads."""
+    store = ProjectStore(codec=JSONCodec())
+    store.sync(fake_client)
+    counts: list[int] = []
+    threads = [threading.Thread(target=lambda: counts.append(len(store.find()))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counts == [5] * 4
+    assert repr(store) == 'ProjectStore(":memory:")'
+
+
+def test_newer_schema(tmp_path: Path) -> None:
+    """Test that a database created by a newer version of the SDK is refused."""
+    path = tmp_path / "projects.db"
+    with sqlite3.connect(path) as db:
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    with pytest.raises(ValueError, match="newer"):
+        ProjectStore(path)
@@ -0,0 +1,223 @@
+import time
+from typing import cast
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, SlingshotClient, ValidatorCache
+from slingshot.testing import FakeSlingshotServer
+
+
+def test_project_lifecycle(fake_server: FakeSlingshotServer, fake_client: SlingshotClient) -> None:
+    """Test creating, fetching, updating, resetting and deleting a project."""
+    project = fake_client.projects.create(
+        name="ETL", workspace_id="ws", job_id="42", settings={"sla_minutes": 30}
+    )
+    assert project["name"] == "ETL"
+    assert project["workspace_id"] == "ws"
+    assert project["settings"] == {
+        "sla_minutes": 30,
+        "auto_apply_recs": False,
+        "optimize_instance_size": False,
+    }
+    project_id = project["id"]
+    assert project_id is not None
+
+    updated = fake_client.projects.update(
+        project_id, description="Nightly", settings={"auto_apply_recs": True}
+    )
+    assert updated["description"] == "Nightly"
+    assert updated["settings"]["auto_apply_recs"] is True  # pyright: ignore[reportOptionalSubscript]
+    assert updated["settings"]["sla_minutes"] == 30  # pyright: ignore[reportOptionalSubscript]
+
+    fake_client.projects.reset(project_id)
+    assert fake_client.projects.get_project(project_id)["phase"] == "PENDING"
+
+    fake_client.projects.delete(project_id)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        fake_client.projects.get_project(project_id)
+    assert exc_info.value.response.status_code == 404
+    assert fake_server.projects == []
+
+
+def test_pagination_and_filters(
+    fake_server: FakeSlingshotServer, fake_client: SlingshotClient
+) -> None:
+    """Test that projects are paginated and filtered like the API does."""
+    fake_server.add_projects(120)
+
+    page = fake_client.projects.get_projects(page=3, size=50)
+    assert (page["page"], page["pages"], len(page["items"])) == (3, 3, 20)
+    assert [p["name"] for p in fake_client.projects.iterate_projects(size=50)] == [
+        f"Project {i}" for i in range(120)
+    ]
+    assert len(list(fake_client.projects.iterate_projects(size=50, stream=True))) == 120
+
+    filtered = fake_client.projects.get_projects(app_id="app-7")
+    assert [p["name"] for p in filtered["items"]] == ["Project 7"]
+    assert filtered["pages"] == 1
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        fake_client.projects.get_projects(size=500)
+    assert exc_info.value.response.status_code == 422
+
+
+def test_include(fake_server: FakeSlingshotServer, fake_client: SlingshotClient) -> None:
+    """Test that `include` selects attributes and adds the creator."""
+    project_id = fake_server.add_project("ETL")["id"]
+
+    assert "creator" not in fake_client.projects.get_project(project_id)
+    assert fake_client.projects.get_project(project_id, include=["name"]) == {
+        "id": project_id,
+        "name": "ETL",
+    }
+    with_creator = fake_client.projects.get_project(project_id, include=["creator"])
+    assert with_creator["name"] == "ETL"
+    assert with_creator["creator"]["isActive"] is True  # pyright: ignore[reportOptionalSubscript]
+
+
+def test_validation_and_conflicts(fake_client: SlingshotClient) -> None:
+    """Test the 422 and 409 responses to invalid and duplicate projects."""
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        fake_client._api_request("POST", "/v1/projects", json={"name": "ETL"})
+    assert exc_info.value.response.status_code == 422
+    assert exc_info.value.response.json()["detail"][0]["loc"] == ["body", "workspaceId"]
+
+    fake_client.projects.create(name="ETL", workspace_id="ws", app_id="etl")
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        fake_client.projects.create(name="ETL again", workspace_id="ws", app_id="etl")
+    assert exc_info.value.response.status_code == 409
+
+
+def test_authentication(fake_server: FakeSlingshotServer) -> None:
+    """Test that requests without the expected API key are rejected."""
+    fake_server.api_key = "secret"
+    response = httpx.get(f"{fake_server.url}/v1/projects", headers={"Auth": "wrong"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Authentication required."}
+    assert (
+        httpx.get(f"{fake_server.url}/v1/projects", headers={"Auth": "secret"}).status_code == 200
+    )
+
+
+def test_unknown_routes(fake_server: FakeSlingshotServer) -> None:
+    """Test the responses to paths and methods the API does not have."""
+    headers = {"Auth": "test"}
+    assert httpx.get(f"{fake_server.url}/v2/projects", headers=headers).status_code == 404
+    assert httpx.delete(f"{fake_server.url}/v1/projects", headers=headers).status_code == 405
+
+
+def test_recommendations(fake_server: FakeSlingshotServer, fake_client: SlingshotClient) -> None:
+    """Test that recommendations are generated after a delay and can be applied."""
+    fake_server.recommendation_delay = 0.05
+    project_id = fake_server.add_project("ETL", job_id="42")["id"]
+
+    recommendation = fake_client.projects.create_recommendation(project_id)
+    assert recommendation["state"] == "PENDING"
+    recommendation_id = cast(str, recommendation["id"])
+    recommendation = fake_client.projects.wait_for_recommendation(
+        project_id, recommendation_id, timeout=5, initial_interval=0.01, max_interval=0.02
+    )
+    assert recommendation["state"] == "SUCCESS"
+    assert recommendation["recommendation"]["configuration"]["num_workers"] == 4  # pyright: ignore[reportOptionalSubscript]
+
+    applied = fake_client.projects.apply_recommendation(project_id, recommendation_id)
+    assert applied["state"] == "SUCCESS"
+    assert fake_client.projects.get_project(project_id)["phase"] == "ACTIVE"
+
+
+def test_recommendation_without_job_runs(
+    fake_server: FakeSlingshotServer, fake_client: SlingshotClient
+) -> None:
+    """Test that recommendations of projects without a job fail and cannot be applied."""
+    project_id = fake_server.add_project("ETL")["id"]
+    recommendation_id = cast(str, fake_client.projects.create_recommendation(project_id)["id"])
+
+    recommendation = fake_client.projects.get_recommendation(project_id, recommendation_id)
+    assert recommendation["state"] == "FAILURE"
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        fake_client.projects.apply_recommendation(project_id, recommendation_id)
+    assert exc_info.value.response.status_code == 409
+
+
+def test_injected_failures_are_retried(
+    fake_server: FakeSlingshotServer, fake_client: SlingshotClient
+) -> None:
+    """Test that injected 429 and 503 responses are sent and retried by the client."""
+    fake_server.add_project("ETL")
+    fake_server.inject(429, retry_after=0.01)
+    fake_server.inject(503, count=2)
+
+    assert len(fake_client.projects.get_projects()["items"]) == 1
+    assert fake_server.stats() == {"requests": 4, "throttled": 1, "errors": 2, "not_modified": 0}
+    assert fake_client.retry_stats()["retries"] == 3
+
+
+def test_random_failures() -> None:
+    """Test that the share of random failures follows the configured rates."""
+    with FakeSlingshotServer(throttle_rate=0.2, error_rate=0.1, error_status=500, seed=3) as server:
+        with httpx.Client(base_url=server.url, headers={"Auth": "test"}) as http:
+            statuses = [http.get("/v1/projects").status_code for _ in range(200)]
+    assert 20 <= statuses.count(429) <= 60
+    assert 5 <= statuses.count(500) <= 35
+    assert server.stats()["throttled"] == statuses.count(429)
+
+
+def test_rate_limit() -> None:
+    """Test that requests over the rate limit are answered with 429 and Retry-After."""
+    with FakeSlingshotServer(rate_limit=3) as server:
+        responses = [
+            httpx.get(f"{server.url}/v1/projects", headers={"Auth": "test"}) for _ in range(4)
+        ]
+    assert [response.status_code for response in responses] == [200, 200, 200, 429]
+    assert 0 < float(responses[-1].headers["Retry-After"]) <= 1
+
+
+def test_latency() -> None:
+    """Test that every request takes at least the configured latency."""
+    with FakeSlingshotServer(latency=0.05) as server:
+        start = time.monotonic()
+        httpx.get(f"{server.url}/v1/projects", headers={"Auth": "test"})
+        assert time.monotonic() - start >= 0.05
+
+
+def test_conditional_requests(fake_server: FakeSlingshotServer) -> None:
+    """Test that GET responses carry an ETag and are answered with 304 when unchanged."""
+    project_id = fake_server.add_project("ETL")["id"]
+    validators = ValidatorCache()
+    with SlingshotClient(
+        api_key="test", api_url=fake_server.url, validator_cache=validators
+    ) as client:
+        first = client.projects.get_project(project_id)
+        assert client.projects.get_project(project_id) == first
+        client.projects.update(project_id, name="Renamed")
+        assert client.projects.get_project(project_id)["name"] == "Renamed"
+    assert fake_server.stats()["not_modified"] == 1
+    assert validators.stats()["hits"] == 1
+
+
+def test_concurrent_clients(fake_server: FakeSlingshotServer, fake_client: SlingshotClient) -> None:
+    """Test that the server answers concurrent requests over pooled connections."""
+    project_ids = [project["id"] for project in fake_server.add_projects(40)]
+    results = list(fake_client.projects.get_projects_by_id(project_ids, max_workers=8))
+    assert all(outcome["error"] is None for _, outcome in results)
+    assert fake_server.stats()["requests"] == 40
+
+
+@pytest.mark.anyio
+async def test_async_client(fake_server: FakeSlingshotServer) -> None:
+    """Test that the async client works against the server."""
+    fake_server.add_projects(30)
+    async with AsyncSlingshotClient(api_key="test", api_url=fake_server.url) as client:
+        names = [p["name"] async for p in client.projects.aiterate_projects(size=10)]
+    assert len(names) == 30
+
+
+def test_url_requires_started_server() -> None:
+    """Test that a server that is not started has no URL."""
+    server = FakeSlingshotServer()
+    assert repr(server) == "FakeSlingshotServer()"
+    with pytest.raises(RuntimeError, match="not started"):
+        server.url  # noqa: B018
+    with server:
+        assert repr(server) == f"FakeSlingshotServer(url={server.url!r})"
@@ -0,0 +1,165 @@
+import importlib
+from typing import Any
+
+import httpx
+import pytest
+
+from slingshot import AsyncSlingshotClient, RetryPolicy, SlingshotClient
+from slingshot.testing import FakeSlingshotServer
+from slingshot.tracing import OpenTelemetryHooks
+
+
+class Tracing:
+    """An OpenTelemetry tracer provider that keeps the finished spans in memory."""
+
+    def __init__(self) -> None:
+        """Create the tracer provider, or skip the test if the OpenTelemetry SDK is not installed."""
+        sdk = pytest.importorskip("opentelemetry.sdk.trace")
+        export = importlib.import_module("opentelemetry.sdk.trace.export")
+        in_memory = importlib.import_module(
+            "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+        )
+        self.exporter = in_memory.InMemorySpanExporter()
+        self.provider = sdk.TracerProvider()
+        self.provider.add_span_processor(export.SimpleSpanProcessor(self.exporter))
+
+    def spans(self) -> dict[str, list[Any]]:
+        """Return the finished spans by name."""
+        spans: dict[str, list[Any]] = {}
+        for span in self.exporter.get_finished_spans():
+            spans.setdefault(span.name, []).append(span)
+        return spans
+
+
+@pytest.fixture
+def tracing() -> Tracing:
+    """A tracer provider recording the spans in memory."""
+    return Tracing()
+
+
+def _client(server: FakeSlingshotServer, tracing: Tracing) -> SlingshotClient:
+    """Return a traced client of `server` that retries without waiting long."""
+    return SlingshotClient(
+        api_key="test",
+        api_url=server.url,
+        retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+        hooks=[OpenTelemetryHooks(tracing.provider)],
+    )
+
+
+def test_attempts_are_nested_under_operations(
+    fake_server: FakeSlingshotServer, tracing: Tracing
+) -> None:
+    """Test that attempt spans carry the request details and are children of the operation."""
+    project = fake_server.add_project("ETL", job_id="42")
+    fake_server.inject(503)
+    with _client(fake_server, tracing) as client:
+        client.projects.get_project(project["id"])
+
+    spans = tracing.spans()
+    (operation,) = spans["ProjectAPI.get_project"]
+    retried, succeeded = sorted(
+        spans["GET /v1/projects/{project_id}"], key=lambda span: span.start_time
+    )
+    assert operation.attributes["slingshot.retries"] == 1
+    assert operation.status.is_ok
+    for span in (retried, succeeded):
+        assert span.parent.span_id == operation.context.span_id
+        assert span.kind.name == "CLIENT"
+        assert operation.start_time <= span.start_time <= span.end_time <= operation.end_time
+    assert retried.attributes["http.response.status_code"] == 503
+    assert retried.attributes["http.request.resend_count"] == 0
+    assert retried.attributes["slingshot.retry_delay"] == 0.001
+    assert not retried.status.is_ok
+    assert succeeded.attributes["http.response.status_code"] == 200
+    assert succeeded.attributes["http.request.resend_count"] == 1
+    assert succeeded.attributes["url.template"] == "/v1/projects/{project_id}"
+    assert succeeded.attributes["url.path"] == f"/v1/projects/{project['id']}"
+    assert succeeded.attributes["http.response.body.size"] > 0
+    assert succeeded.attributes["slingshot.timings.server"] > 0
+
+
+def test_pagination(fake_server: FakeSlingshotServer, tracing: Tracing) -> None:
+    """Test that iterating pages, also from the prefetch threads, is one operation."""
+    fake_server.add_projects(25)
+    with _client(fake_server, tracing) as client:
+        assert len(list(client.projects.iterate_projects(size=10, prefetch=2))) == 25
+
+    spans = tracing.spans()
+    (iteration,) = spans["ProjectAPI.iterate_projects"]
+    pages = spans["ProjectAPI.get_projects"]
+    assert len(pages) == 3
+    assert all(page.parent.span_id == iteration.context.span_id for page in pages)
+    page_ids = {page.context.span_id for page in pages}
+    assert {span.parent.span_id for span in spans["GET /v1/projects"]} == page_ids
+
+
+def test_errors_and_caller_spans(fake_server: FakeSlingshotServer, tracing: Tracing) -> None:
+    """Test that failed operations are marked as errors, under the span of the caller."""
+    tracer = tracing.provider.get_tracer("scheduler")
+    with _client(fake_server, tracing) as client, tracer.start_as_current_span("job") as job:
+        project = fake_server.add_project("ETL")
+        recommendation = client.projects.create_recommendation(project["id"])
+        with pytest.raises(httpx.HTTPStatusError):
+            client.projects.apply_recommendation(project["id"], str(recommendation["id"]))
+
+    spans = tracing.spans()
+    (apply,) = spans["ProjectAPI.apply_recommendation"]
+    assert apply.parent.span_id == job.get_span_context().span_id
+    assert not apply.status.is_ok
+    assert apply.events[0].name == "exception"
+    (attempt,) = spans["POST /v1/projects/{project_id}/recommendations/{recommendation_id}/apply"]
+    assert attempt.attributes["http.response.status_code"] == 409
+    assert attempt.attributes["http.request.body.size"] == 0
+
+
+def test_transport_errors(tracing: Tracing) -> None:
+    """Test that attempts failing without a response are recorded."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Fail to connect."""
+        raise httpx.ConnectError("refused", request=request)
+
+    client = SlingshotClient(
+        api_key="test",
+        api_url="https://test",
+        transport=httpx.MockTransport(handler),
+        hooks=[OpenTelemetryHooks(tracing.provider)],
+    )
+    with pytest.raises(httpx.ConnectError):
+        client.projects.delete("abc")
+
+    (attempt,) = tracing.spans()["DELETE /v1/projects/{project_id}"]
+    assert "http.response.status_code" not in attempt.attributes
+    assert attempt.events[0].attributes["exception.type"] == "httpx.ConnectError"
+
+
+@pytest.mark.anyio
+async def test_async_client(fake_server: FakeSlingshotServer, tracing: Tracing) -> None:
+    """Test that the operations of the async client are traced as well."""
+    fake_server.add_projects(15)
+    async with AsyncSlingshotClient(
+        api_key="test", api_url=fake_server.url, hooks=[OpenTelemetryHooks(tracing.provider)]
+    ) as client:
+        assert len([p async for p in client.projects.aiterate_projects(size=10)]) == 15
+
+    spans = tracing.spans()
+    (iteration,) = spans["AsyncProjectAPI.aiterate_projects"]
+    pages = spans["AsyncProjectAPI.get_projects"]
+    assert len(pages) == 2
+    assert all(page.parent.span_id == iteration.context.span_id for page in pages)
+
+
+def test_requires_opentelemetry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the hooks explain how to install OpenTelemetry when it is missing."""
+    import_module = importlib.import_module
+
+    def fake_import(name: str, package: Any = None) -> Any:
+        """Fail to import OpenTelemetry, as if it were not installed."""
+        if name.startswith("opentelemetry"):
+            raise ImportError(f"No module named {name!r}")
+        return import_module(name, package)
+
+    monkeypatch.setattr("slingshot.tracing.importlib.import_module", fake_import)
+    with pytest.raises(ImportError, match=r"\[otel\]"):
+        OpenTelemetryHooks()